@@ -3,15 +3,28 @@ Command line interface module
 """
 import argparse
 import importlib
-import os
+import sys
 
 from . import _CONFIG
 
+# Subcommands and their help.
+# Only the package of the chosen subcommand is imported, so that running a
+# command doesn't load modules of the other commands.
+_COMMANDS_: dict[str, str] = {
+    "build": "Build a package from a package uri.",
+    "compile": "Compile a markdown file to a gdoc object file.",
+    "dump": "dump Gdoc object",
+    "language-server": "gdoc language server",
+    "trace": "show trace tree",
+}
 
-def main():
+
+def main(argv: list[str] | None = None):
     """
     * Command line interface
     """
+    argv = sys.argv[1:] if argv is None else argv
+
     parser = argparse.ArgumentParser(prog=__package__)
     parser.add_argument("-v", "--version", action="store_true", help="show version")
 
@@ -19,17 +32,16 @@ def main():
 
     subparsers = parser.add_subparsers(title="commands")
 
-    here = os.path.dirname(__file__)
-    files = os.listdir(os.path.join(here, _CONFIG["app_path"]))
-    for file in files:
-        if os.path.isdir(os.path.join(here, _CONFIG["app_path"], file)) and (
-            file != "__pycache__"
-        ):
+    command: str | None = _get_command(argv)
+    for name, help in _COMMANDS_.items():
+        if name == command:
             importlib.import_module(
-                __package__ + "." + _CONFIG["app_path"] + "." + file
-            ).setup(subparsers, file, common)
+                __package__ + "." + _CONFIG["app_path"] + "." + name
+            ).setup(subparsers, name, common)
+        else:
+            subparsers.add_parser(name, help=help)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if hasattr(args, "func"):
         args.func(args)
@@ -41,5 +53,16 @@ def main():
         parser.print_help()
 
 
+def _get_command(argv: list[str]) -> str | None:
+    """
+    returns the subcommand in the arguments.
+    """
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg if arg in _COMMANDS_ else None
+
+    return None
+
+
 if __name__ == "__main__":
     main()
@@ -2,6 +2,13 @@
 command.py
 """
 from gdoc.lib.builder.builder import Builder
+from gdoc.lib.pandocastobject.pandoc import (
+    MarkdownReader,
+    Pandoc,
+    PandocAstCache,
+    PandocServer,
+)
+from gdoc.lib.pandocastobject.pandoc.capabilities import DEFAULT_CACHE_DIR
 from gdoc.util import ErrorReport, Settings
 
 
@@ -24,19 +31,56 @@ def setup(subparsers, name, commonOptions):
         action="store_true",
         help="Performs only syntax checking on the document.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes to run pandoc. 0 means the number of CPUs.",
+    )
+    parser.add_argument(
+        "--pandoc-server",
+        action="store_true",
+        help="Convert documents with a long-lived 'pandoc server' process.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run pandoc without reading or writing the PandocAST cache.",
+    )
+    parser.add_argument(
+        "--builtin-reader",
+        action="store_true",
+        help="Read markdown files with the built-in reader instead of pandoc.",
+    )
 
 
 def run(args):
     """
     run subcommand
     """
-    opts: Settings = Settings({})
+    opts: Settings = Settings({"builder": {"jobs": args.jobs}})
     erpt: ErrorReport
 
     filepath = args.filepath
     erpt: ErrorReport = ErrorReport(cont=args.check_only, filename=filepath)
+    server: PandocServer | None = None
+    if args.pandoc_server and not args.builtin_reader:
+        server = PandocServer.get_shared()
+        if args.jobs != 1:
+            # Start the server here so that the worker processes of the builder
+            # connect to it. They don't start or stop servers by themselves.
+            server.is_available()
+    pandoc: Pandoc | MarkdownReader = (
+        MarkdownReader()
+        if args.builtin_reader
+        else Pandoc(server=server, cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
+    )
+    astcache: PandocAstCache | None = (
+        None if args.no_cache else PandocAstCache(pandoc=pandoc)
+    )
 
-    package, e = Builder(opts).build(filepath, erpt=erpt, opts=opts)
+    package, e = Builder(opts, astcache, pandoc).build(filepath, erpt=erpt, opts=opts)
 
     if e is not None:
         print(e.dump(True))
@@ -2,11 +2,28 @@
 command.py
 """
 import json
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Iterator
 
 from gdoc.lib.gdoccompiler.gdcompiler.gdcompiler import GdocCompiler
+from gdoc.lib.pandocastobject.pandoc import (
+    MarkdownReader,
+    Pandoc,
+    PandocAstCache,
+    PandocServer,
+    jsonbackend,
+)
+from gdoc.lib.pandocastobject.pandoc.capabilities import DEFAULT_CACHE_DIR
 from gdoc.lib.plugins import std
 from gdoc.util import ErrorReport, Settings
 
+# Pandoc and PandocAstCache of the process, made once by `_init_process()`.
+_pandoc: Pandoc | MarkdownReader | None = None
+_astcache: PandocAstCache | None = None
+
 
 def setup(subparsers, name, commonOptions):
     """
@@ -33,27 +50,120 @@ def setup(subparsers, name, commonOptions):
         action="store_true",
         help="Performs only syntax checking on the document.",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write each document as a line of compact json as soon as it's compiled.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes to compile files. 0 means the number of CPUs.",
+    )
+    parser.add_argument(
+        "--pandoc-server",
+        action="store_true",
+        help="Convert documents with a long-lived 'pandoc server' process.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run pandoc without reading or writing the PandocAST cache.",
+    )
+    parser.add_argument(
+        "--builtin-reader",
+        action="store_true",
+        help="Read markdown files with the built-in reader instead of pandoc.",
+    )
 
 
 def run(args):
     """
     run subcommand
     """
+    jobs: int = args.jobs or os.cpu_count() or 1
+    files: list[str] = args.filepath
+
+    server: PandocServer | None = None
+    if args.pandoc_server and not args.builtin_reader:
+        server = PandocServer.get_shared()
+    pandoc: Pandoc | MarkdownReader = (
+        MarkdownReader()
+        if args.builtin_reader
+        else Pandoc(server=server, cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
+    )
+
+    # Documents are compiled in worker processes when `jobs` > 1.
+    # Results are written in the order of `files` as soon as they are ready.
+    executor: Executor | None = None
+    if (jobs > 1) and (len(files) > 1):
+        if server is not None:
+            # Start the server here so that the workers connect to it.
+            # It is stopped at exit of this process, while the workers exit
+            # without running their exit handlers.
+            server.is_available()
+        executor = ProcessPoolExecutor(
+            min(jobs, len(files)),
+            initializer=_init_process,
+            initargs=(pandoc, args.no_cache),
+        )
+    else:
+        _init_process(pandoc, args.no_cache)
+
+    try:
+        compile_file = partial(_compile, args)
+        results: Iterator[tuple[bytes | None, str | None]] = (
+            map(compile_file, files)
+            if executor is None
+            else executor.map(compile_file, files)
+        )
+        for output, error in results:
+            if output is not None:
+                sys.stdout.buffer.write(output)
+                sys.stdout.buffer.flush()
+
+            if error is not None:
+                # Keep stdout valid json lines in ndjson mode.
+                print(error, file=sys.stderr if args.ndjson else sys.stdout, flush=True)
+
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _init_process(pandoc: Pandoc | MarkdownReader, no_cache: bool) -> None:
+    """
+    sets Pandoc and PandocAstCache shared by the files compiled in the process.
+    """
+    global _pandoc, _astcache
+    _pandoc = pandoc
+    _astcache = None if no_cache else PandocAstCache(pandoc=pandoc)
+
+
+def _compile(args, filepath: str) -> tuple[bytes | None, str | None]:
+    """
+    compiles the file and returns its output and error report as texts.
+    """
     opts: Settings = Settings({})
-    erpt: ErrorReport
 
     fileformat: str | None = args.filetype
     via_html: bool | None = args.html if (fileformat is not None) else None
 
-    for filepath in args.filepath:
-        erpt: ErrorReport = ErrorReport(cont=args.check_only, filename=filepath)
-        gobj, e = GdocCompiler(plugins=[std.category]).compile(
-            filepath, fileformat, via_html, erpt=erpt, opts=opts
-        )
+    erpt: ErrorReport = ErrorReport(cont=args.check_only, filename=filepath)
+    gobj, e = GdocCompiler(
+        plugins=[std.category], astcache=_astcache, pandoc=_pandoc
+    ).compile(filepath, fileformat, via_html, erpt=erpt, opts=opts)
 
-        if gobj is not None:
-            data = gobj.dumpd()
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+    output: bytes | None = None
+    if gobj is not None:
+        data = gobj.dumpd()
+        if args.ndjson:
+            output = jsonbackend.dumps(data) + b"\n"
+        else:
+            output = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode(
+                "utf-8"
+            )
 
-        if e is not None:
-            print(e.dump(True))
+    return output, (e.dump(True) if e is not None else None)
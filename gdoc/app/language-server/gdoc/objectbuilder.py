@@ -1,10 +1,15 @@
+import asyncio
+import shutil
+import threading
+from concurrent.futures import Future
 from logging import getLogger
-from typing import Callable, NamedTuple, cast
+from typing import Callable, Coroutine, NamedTuple, cast
 
 from gdoc.lib.gdoccompiler.gdcompiler.gdcompiler import GdocCompiler
 from gdoc.lib.gdoccompiler.gdexception import GdocSyntaxError
 from gdoc.lib.gdocparser.tokeninfobuffer import TokenInfoBuffer
 from gdoc.lib.gobj.types import Document
+from gdoc.lib.pandocastobject.pandoc import MarkdownReader, Pandoc, PandocServer
 from gdoc.lib.plugins import std
 from gdoc.util import ErrorReport, Settings
 
@@ -34,6 +39,11 @@ class GdocObjectBuilder(Feature):
     publish_diagnostics: PublishDiagnostics | None = None
     documents: dict[str, DocumentInfo]
     update_handler: Callable[[str, DocumentInfo | None], None] | None = None
+    _loop: "_EventLoopThread | None" = None
+    _tasks: dict[str, Future]
+    # Guards `_tasks`, `documents` and the handlers updated with them, which are
+    # changed by both the dispatcher thread and the event loop thread.
+    _lock: threading.RLock
 
     def __init__(self, languageserver) -> None:
         """
@@ -41,6 +51,8 @@ class GdocObjectBuilder(Feature):
         """
         self.server = languageserver
         self.documents = {}
+        self._tasks = {}
+        self._lock = threading.RLock()
 
     def initialize(self, client_capabilities: Settings) -> dict:
         """
@@ -81,49 +93,114 @@ class GdocObjectBuilder(Feature):
         logger.info(
             " _textdocuments_update_handler(uri = %s, doc_info = %s)", uri, doc_info
         )
-        if doc_info is None:
-            # uri is closed
-            if uri in self.documents:
-                del self.documents[uri]
+        with self._lock:
+            if doc_info is None:
+                # uri is closed
+                self._cancel_task(uri)
+                self.documents.pop(uri, None)
+
+                if self.publish_diagnostics is not None:
+                    self.publish_diagnostics.publish_diagnostics(uri, [])
+
+                if self.update_handler is not None:
+                    self.update_handler(uri, None)
+
+            else:
+                # uri is opened or updated
+                # The object is built in the background so that requests like hover
+                # don't wait for pandoc. Building of the older version is cancelled.
+                self._cancel_task(uri)
+                future: Future = self._get_loop().submit(
+                    _create_object_async(uri, doc_info.document_item["text"])
+                )
+                self._tasks[uri] = future
+                future.add_done_callback(
+                    lambda f: self._object_created_handler(uri, doc_info, f)
+                )
 
-            if self.publish_diagnostics is not None:
-                self.publish_diagnostics.publish_diagnostics(uri, [])
+        return
+
+    def _object_created_handler(
+        self, uri: str, doc_info: TextDocumentInfo, future: Future
+    ) -> None:
+        """
+        Called in the event loop thread when building of the object is done.
+        The result is stored only if the uri is still open with this version,
+        checked under the lock shared with the dispatcher thread.
+        """
+        if future.cancelled() or (self._tasks.get(uri) is not future):
+            # cancelled or superseded by a newer version.
+            return
+
+        if (e := future.exception()) is not None:
+            logger.error("failed to build the object of %s: %s", uri, e)
+            with self._lock:
+                if self._tasks.get(uri) is future:
+                    del self._tasks[uri]
+            return
+
+        gdoc_document, gdoc_erpt, gdoc_tokeninfo = future.result()
+
+        token_map = TokenMap(doc_info.text_position)
+        for textstr, data in gdoc_tokeninfo.get_all().items():
+            token_map.add_token(GdocToken(textstr, data))
+
+        document: DocumentInfo = DocumentInfo(
+            *doc_info, gdoc_document, gdoc_erpt, token_map
+        )
+        diagnostics: list[dict] = _get_diagnostics(
+            document.gdoc_erpt, document.text_position
+        )
+
+        with self._lock:
+            if self._tasks.get(uri) is not future:
+                # closed or updated while building the document info.
+                return
+            del self._tasks[uri]
 
-            if self.update_handler is not None:
-                self.update_handler(uri, None)
-
-        else:
-            # uri is opened or updated
-            gdoc_tokeninfo: TokenInfoBuffer
-            gdoc_document, gdoc_erpt, gdoc_tokeninfo = _create_object(
-                uri, doc_info.document_item["text"]
-            )
-            token_map = TokenMap(doc_info.text_position)
-            for textstr, data in gdoc_tokeninfo.get_all().items():
-                token_map.add_token(GdocToken(textstr, data))
-
-            document: DocumentInfo = DocumentInfo(
-                *doc_info, gdoc_document, gdoc_erpt, token_map
-            )
             if gdoc_document is not None:
                 gdoc_document._object_info_["uri"] = uri
                 gdoc_document._object_info_["document_info"] = document
             self.documents[uri] = document
 
             if self.publish_diagnostics is not None:
-                diagnostics: list[dict] = _get_diagnostics(
-                    document.gdoc_erpt, document.text_position
-                )
                 self.publish_diagnostics.publish_diagnostics(uri, diagnostics)
                 logger.debug(" uri = %s diagnostics = %s", uri, diagnostics)
 
             if self.update_handler is not None:
                 self.update_handler(uri, document)
 
-        return
+    def _cancel_task(self, uri: str) -> None:
+        future: Future | None = self._tasks.pop(uri, None)
+        if future is not None:
+            future.cancel()
+
+    def _get_loop(self) -> "_EventLoopThread":
+        if self._loop is None:
+            self._loop = _EventLoopThread()
+        return self._loop
+
+
+class _EventLoopThread:
+    """
+    asyncio event loop running in a daemon thread.
+    """
 
+    loop: asyncio.AbstractEventLoop
+    thread: threading.Thread
 
-def _create_object(
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="GdocObjectBuilder", daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, coro: Coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+async def _create_object_async(
     uri: str, filedata: str | None = None
 ) -> tuple[Document | None, ErrorReport | None, TokenInfoBuffer]:
     filepath: str = uri.removeprefix("file://")
@@ -132,10 +209,19 @@ def _create_object(
 
     tokeninfo: TokenInfoBuffer = TokenInfoBuffer()
 
+    # Reuse one pandoc process through the session instead of spawning
+    # a new one on every update of the document.
+    # The built-in reader is used where pandoc is not installed.
+    pandoc: Pandoc | MarkdownReader = (
+        Pandoc(server=PandocServer.get_shared())
+        if shutil.which("pandoc") is not None
+        else MarkdownReader()
+    )
+
     erpt: ErrorReport | None
-    document, erpt = GdocCompiler(
-        tokeninfocache=tokeninfo, plugins=[std.category]
-    ).compile(
+    document, erpt = await GdocCompiler(
+        tokeninfocache=tokeninfo, plugins=[std.category], pandoc=pandoc
+    ).compile_async(
         filepath,
         fileformat,
         via_html,
@@ -2,15 +2,20 @@
 builder.py - Build a package from a package uri
 """
 
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
 from logging import getLogger
 from pathlib import Path
+from typing import Iterator
 
 from gdoc.lib.gdoc.documenturi import DocumentUri
-from gdoc.lib.gdoccompiler.gdcompiler.gdcompiler import GdocCompiler
+from gdoc.lib.gdoccompiler.gdcompiler.gdcompiler import GdocCompiler, get_pandoc_json
 from gdoc.lib.gdoccompiler.gdexception import GdocImportError, GdocTypeError
 from gdoc.lib.gdocparser.tokeninfobuffer import TokenInfoBuffer
 from gdoc.lib.gobj.types import Document
 from gdoc.lib.gobj.types.package import Package
+from gdoc.lib.pandocastobject.pandoc import MarkdownReader, Pandoc, PandocAstCache
 from gdoc.lib.plugins import std
 from gdoc.util import Err, ErrorReport, Ok, Result, Settings
 
@@ -23,13 +28,28 @@ class Builder:
     compiler: GdocCompiler
     linker: Linker
     package_aliases: dict[str, str]
+    jobs: int
     _tokeninfocache: TokenInfoBuffer | None
-
-    def __init__(self, opts: Settings | None = None):
+    _astcache: PandocAstCache | None
+    _pandoc: Pandoc | MarkdownReader | None
+
+    def __init__(
+        self,
+        opts: Settings | None = None,
+        astcache: PandocAstCache | None = None,
+        pandoc: Pandoc | MarkdownReader | None = None,
+    ):
         self.package_aliases = (
             opts.get(["builder", "package_aliases"], {}) if opts else {}
         )
-        self.compiler = GdocCompiler(plugins=[std.category])
+        # jobs = 0 means the number of CPUs.
+        self.jobs = opts.get(["builder", "jobs"], 1) if opts else 1
+        self.jobs = self.jobs or os.cpu_count() or 1
+        self._astcache = astcache
+        self._pandoc = pandoc
+        self.compiler = GdocCompiler(
+            plugins=[std.category], astcache=astcache, pandoc=pandoc
+        )
         self.linker = Linker(opts)
 
     def build(
@@ -87,16 +107,27 @@ class Builder:
         #
         # Compile each file
         #
-        for file in files:
-            document: Document | None
-            document, e = GdocCompiler(plugins=[std.category]).compile(
-                file, erpt=srpt, opts=opts
-            )
-            if e and srpt.should_exit(e):
-                return Err(erpt.submit(srpt))
+        # Pandoc runs in worker processes when `jobs` > 1, while the parser runs
+        # here in the order of `files` so that errors are reported in the same
+        # order as the serial build.
+        #
+        executor: Executor | None = None
+        if (self.jobs > 1) and (len(files) > 1):
+            executor = ProcessPoolExecutor(min(self.jobs, len(files)))
+
+        try:
+            for file, pandoc_json in zip(files, self._get_pandoc_jsons(files, executor)):
+                document: Document | None
+                document, e = self.compiler.parse(file, pandoc_json, erpt=srpt, opts=opts)
+                if e and srpt.should_exit(e):
+                    return Err(erpt.submit(srpt))
 
-            if document is not None:
-                package.add_document(file, document)
+                if document is not None:
+                    package.add_document(file, document)
+
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         #
         # Link objects in the package documents
@@ -108,6 +139,16 @@ class Builder:
 
         return Ok(package)
 
+    def _get_pandoc_jsons(
+        self, files: list[str], executor: Executor | None = None
+    ) -> Iterator[dict]:
+        get_json = partial(get_pandoc_json, astcache=self._astcache, pandoc=self._pandoc)
+
+        if executor is None:
+            return map(get_json, files)
+
+        return executor.map(get_json, files)
+
     def _create_document_list(
         self, filepath: str, erpt: ErrorReport
     ) -> Result[list[str], ErrorReport]:
@@ -116,6 +157,7 @@ class Builder:
         except Exception as e:
             return Err(erpt.submit(GdocImportError(f"Failed to get files: {e}")))
 
-        result: list[str] = [str(file) for file in files]
+        # Sort to keep the build order independent of the file system.
+        result: list[str] = sorted(str(file) for file in files)
 
         return Ok(result)
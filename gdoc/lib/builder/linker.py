@@ -327,12 +327,8 @@ class Linker:
         return imports
 
     def collect_imports(self, document: Document) -> list[Import]:
-        result = []
-
-        document.walk(
-            lambda node, _: result.append(node)
-            if (node._get_type_() is node.Type.IMPORT)
-            else None
-        )
-
-        return result
+        return [
+            cast(Import, node)
+            for node in document.iter_preorder()
+            if node._get_type_() is node.Type.IMPORT
+        ]
@@ -0,0 +1,315 @@
+r"""
+binarycodec.py: Compact binary codec of gdoc texts
+
+`dumpb()` encodes `String`, `Code`, `TextString`, `Parenthesized`, `Quoted`,
+`TextBlock` and `DataPos` into bytes, and `loadb()` decodes them.
+The data is the same as of `dumpd()`, but it is much smaller than the json of it.
+
+- Integers are varints, and signed ones are zigzag encoded.
+- Paths of DataPos are stored once in the path table at the head.
+- Each DataPos is stored as differences from the previous one, so runs of
+  continuous positions take a few bytes.
+- Strings are stored as a text and the runs of `String.get_runs()`, and made
+  from the runs at once when loaded.
+
+Other `Text`s in TextStrings are stored as the json of their `dumpd()`,
+and loaded by `loadd` given to `loadb()`.
+"""
+import json
+from typing import Optional, Union
+
+from gdoc.util import Settings
+
+from .code import Code
+from .datapos import DataPos, Pos
+from .parenthesized import Parenthesized
+from .quoted import Quoted
+from .string import String
+from .text import Text
+from .textblock import TextBlock
+from .textstring import TextString
+from .types import _TYPE_LOADD
+
+MAGIC: bytes = b"GDB\x01"
+
+# DataPos flags
+_DPOS_PRESENT_: int = 0x01
+_DPOS_SAME_PATH_: int = 0x02
+_DPOS_CONTINUED_: int = 0x04
+
+_TEXTSTRING_TAGS_: dict[type, int] = {
+    TextString: ord("T"),
+    Parenthesized: ord("P"),
+    Quoted: ord("Q"),
+}
+
+
+def dumpb(obj: Union[Text, TextBlock, DataPos]) -> bytes:
+    """
+    encodes the object into bytes.
+
+    @param obj (Union[Text, TextBlock, DataPos]) : Object to encode.
+    @return bytes : Encoded data.
+    """
+    return _Encoder().encode(obj)
+
+
+def loadb(
+    data: bytes,
+    loadd: _TYPE_LOADD | None = None,
+    opts: Settings | None = None,
+) -> Union[Text, TextBlock, DataPos]:
+    """
+    decodes the object from bytes of `dumpb()`.
+
+    @param data (bytes) : Encoded data.
+    @param loadd (_TYPE_LOADD | None, optional) : loadd of other `Text`s.
+                                                  Defaults to None.
+    @param opts (Settings | None, optional) : Options given to loadd.
+                                              Defaults to None.
+    @exception TypeError : invalid data type
+    @exception RuntimeError : invalid data
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise TypeError("invalid data type")
+
+    try:
+        decoder = _Decoder(data, len(MAGIC), loadd, opts)
+        result = decoder.decode()
+    except (IndexError, UnicodeDecodeError, ValueError) as e:
+        raise RuntimeError("invalid data") from e
+
+    if decoder.pos != len(data):
+        raise RuntimeError("invalid data")
+
+    return result
+
+
+class _Encoder:
+    _body: bytearray
+    _paths: dict[str, int]
+    # path id, line and column of the last DataPos
+    _last: tuple[int, int, int]
+
+    def __init__(self):
+        self._body = bytearray()
+        self._paths = {}
+        self._last = (-1, 0, 0)
+
+    def encode(self, obj: Union[Text, TextBlock, DataPos]) -> bytes:
+        self._node(obj)
+
+        body: bytearray = self._body
+        self._body = bytearray(MAGIC)
+        self._uint(len(self._paths))
+        for path in self._paths:
+            self._str(path)
+
+        return bytes(self._body + body)
+
+    def _node(self, obj: Union[Text, TextBlock, DataPos]) -> None:
+        body: bytearray = self._body
+
+        if type(obj) is String:
+            body.append(ord("s"))
+            self._str(obj.get_str())
+            runs = obj.get_runs()
+            self._uint(len(runs))
+            for length, dpos in runs:
+                self._uint(length)
+                self._dpos(dpos)
+
+        elif type(obj) is Code:
+            body.append(ord("c"))
+            self._dpos(obj.get_data_pos())
+            self._str(obj.get_str())
+
+        elif type(obj) in _TEXTSTRING_TAGS_:
+            body.append(_TEXTSTRING_TAGS_[type(obj)])
+            texts: list[Text] = self._join_strings(obj.get_text_items())
+            self._uint(len(texts))
+            for text in texts:
+                self._node(text)
+
+        elif type(obj) is TextBlock:
+            body.append(ord("B"))
+            self._uint(len(obj))
+            for line in obj:
+                self._node(line)
+
+        elif isinstance(obj, DataPos):
+            body.append(ord("D"))
+            self._dpos(obj)
+
+        elif isinstance(obj, Text):
+            body.append(ord("J"))
+            dumped = json.dumps(obj.dumpd(), ensure_ascii=False, separators=(",", ":"))
+            self._str(dumped)
+
+        else:
+            raise TypeError(f"invalid data type({type(obj).__name__})")
+
+    @staticmethod
+    def _join_strings(texts: list[Text]) -> list[Text]:
+        """
+        joins consecutive `String`s into one as `TextString.dumpd()` does.
+        """
+        result: list[Text] = []
+        string: String | None = None
+        for text in texts:
+            if type(text) is String:
+                if string is None:
+                    string = String()
+                    result.append(string)
+                string.extend(text)
+            else:
+                string = None
+                result.append(text)
+
+        return result
+
+    def _dpos(self, dpos: Optional[DataPos]) -> None:
+        if dpos is None:
+            self._body.append(0)
+            return
+
+        path_id: int = self._paths.setdefault(dpos.path, len(self._paths))
+        last_path_id, last_ln, last_col = self._last
+
+        flags: int = _DPOS_PRESENT_
+        if path_id == last_path_id:
+            flags |= _DPOS_SAME_PATH_
+        if (dpos.start.ln == last_ln) and (dpos.start.col == last_col):
+            flags |= _DPOS_CONTINUED_
+        self._body.append(flags)
+
+        if not (flags & _DPOS_SAME_PATH_):
+            self._uint(path_id)
+        if not (flags & _DPOS_CONTINUED_):
+            self._sint(dpos.start.ln - last_ln)
+            self._sint(dpos.start.col - last_col)
+        self._sint(dpos.stop.ln - dpos.start.ln)
+        self._sint(dpos.stop.col - dpos.start.col)
+
+        self._last = (path_id, dpos.stop.ln, dpos.stop.col)
+
+    def _str(self, string: str) -> None:
+        data: bytes = string.encode("utf-8")
+        self._uint(len(data))
+        self._body += data
+
+    def _uint(self, value: int) -> None:
+        body: bytearray = self._body
+        while value > 0x7F:
+            body.append((value & 0x7F) | 0x80)
+            value >>= 7
+        body.append(value)
+
+    def _sint(self, value: int) -> None:
+        self._uint((value << 1) if value >= 0 else (((-value) << 1) - 1))
+
+
+class _Decoder:
+    _data: bytes
+    pos: int
+    _paths: list[str]
+    # path, line and column of the last DataPos
+    _last: tuple[str, int, int]
+    _loadd: _TYPE_LOADD | None
+    _opts: Settings | None
+
+    def __init__(
+        self,
+        data: bytes,
+        pos: int,
+        loadd: _TYPE_LOADD | None,
+        opts: Settings | None,
+    ):
+        self._data = data
+        self.pos = pos
+        self._last = ("", 0, 0)
+        self._loadd = loadd
+        self._opts = opts
+        self._paths = [self._str() for _ in range(self._uint())]
+
+    def decode(self) -> Union[Text, TextBlock, DataPos]:
+        tag: int = self._data[self.pos]
+        self.pos += 1
+
+        if tag == ord("s"):
+            text: str = self._str()
+            runs: list[tuple[int, Optional[DataPos]]] = [
+                (self._uint(), self._dpos()) for _ in range(self._uint())
+            ]
+            return String.from_runs(text, runs)
+
+        if tag == ord("c"):
+            dpos: Optional[DataPos] = self._dpos()
+            return Code(self._str(), dpos)
+
+        if tag in (ord("T"), ord("P"), ord("Q")):
+            texts: list = [self.decode() for _ in range(self._uint())]
+            textstr: TextString = TextString(texts)
+            if tag == ord("P"):
+                return Parenthesized(textstr)
+            if tag == ord("Q"):
+                return Quoted(textstr)
+            return textstr
+
+        if tag == ord("B"):
+            return TextBlock([self.decode() for _ in range(self._uint())])
+
+        if tag == ord("D"):
+            dpos = self._dpos()
+            if dpos is None:
+                raise RuntimeError("invalid data")
+            return dpos
+
+        if (tag == ord("J")) and (self._loadd is not None):
+            return self._loadd(json.loads(self._str()), self._opts)
+
+        raise TypeError("invalid data type")
+
+    def _dpos(self) -> Optional[DataPos]:
+        flags: int = self._data[self.pos]
+        self.pos += 1
+        if flags == 0:
+            return None
+
+        path, ln, col = self._last
+        if not (flags & _DPOS_SAME_PATH_):
+            path = self._paths[self._uint()]
+        if not (flags & _DPOS_CONTINUED_):
+            ln += self._sint()
+            col += self._sint()
+        stop_ln: int = ln + self._sint()
+        stop_col: int = col + self._sint()
+
+        self._last = (path, stop_ln, stop_col)
+        return DataPos(path, Pos(ln, col), Pos(stop_ln, stop_col))
+
+    def _str(self) -> str:
+        size: int = self._uint()
+        start: int = self.pos
+        self.pos += size
+        if self.pos > len(self._data):
+            raise IndexError("out of data")
+        return self._data[start : self.pos].decode("utf-8")
+
+    def _uint(self) -> int:
+        data: bytes = self._data
+        byte: int = data[self.pos]
+        self.pos += 1
+        value: int = byte & 0x7F
+        shift: int = 7
+        while byte & 0x80:
+            byte = data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+
+        return value
+
+    def _sint(self) -> int:
+        value: int = self._uint()
+        return (value >> 1) if not (value & 1) else -((value + 1) >> 1)
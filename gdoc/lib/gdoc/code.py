@@ -30,10 +30,7 @@ class Code(Text):
         _element: PandocInlineElement
 
         if type(item) is str:
-            _element = cast(
-                PandocInlineElement,
-                PandocAst.create_element({"t": "Code", "c": [["", [], []], item]}),
-            )
+            _element = cast(PandocInlineElement, PandocAst.build_element("Code", item))
         elif isinstance(item, PandocInlineElement):
             _element = cast(PandocInlineElement, item)
             if _element.get_type() != "Code":
@@ -9,6 +9,7 @@ from .parenthesized import Parenthesized
 from .quoted import Quoted
 from .string import String
 from .text import Text
+from .textblock import TextBlock
 from .textstring import TextString
 
 _ELEMENT_TYPES = {
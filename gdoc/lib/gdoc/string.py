@@ -25,25 +25,7 @@ class String(PandocStr, Text, ret_subclass=True):
         dpos: Optional[DataPos] = None,
     ):
         if type(items) is str:
-            attrs: list = []
-            if dpos:
-                # pos = ".tmp/t.md@1:1-1:3"
-                attrs = [
-                    [
-                        "data-pos",
-                        f"{dpos.path}@"
-                        f"{dpos.start.ln}:{dpos.start.col}-"
-                        f"{dpos.stop.ln}:{dpos.stop.col}",
-                    ]
-                ]
-
-            element = cast(
-                PandocInlineElement,
-                PandocAst.create_element(
-                    {"t": "Span", "c": [["", [], attrs], [{"t": "Str", "c": items}]]}
-                ).get_first_child(),
-            )
-            items = [element]
+            items = [self._create_element(items, dpos)]
 
         super().__init__(
             cast(Optional[PandocStr | list[PandocInlineElement]], items),
@@ -51,19 +33,44 @@ class String(PandocStr, Text, ret_subclass=True):
             stop,
         )
 
+    @staticmethod
+    def _create_element(text: str, dpos: Optional[DataPos]) -> PandocInlineElement:
+        """
+        creates a Str element in a Span element having the data position.
+        """
+        attrs: list = []
+        if dpos:
+            # pos = ".tmp/t.md@1:1-1:3"
+            attrs = [
+                [
+                    "data-pos",
+                    f"{dpos.path}@"
+                    f"{dpos.start.ln}:{dpos.start.col}-"
+                    f"{dpos.stop.ln}:{dpos.stop.col}",
+                ]
+            ]
+
+        element = cast(PandocInlineElement, PandocAst.build_element("Str", text))
+        PandocAst.build_element("Span", children=[element], attr=["", [], attrs])
+
+        return element
+
     def get_str(self) -> str:
         return str(self)
 
-    def dumpd(self) -> list:
+    def get_runs(self) -> list[tuple[int, Optional[DataPos]]]:
+        """
+        returns the runs of the chars which have continuous data positions.
+
+        @return list[tuple[int, Optional[DataPos]]] : length and position of the runs.
+        """
         start: int = 0
-        parts: Optional[list[list[int | list | None]]]
+        runs: list[tuple[int, Optional[DataPos]]] = []
         items: list[dict] = self.get_items()
         item: dict
 
-        parts = []
-
         for item in items:
-            pos: list | None = None
+            pos: DataPos | None = None
 
             dpos = self.get_char_pos(start)
             epos = self.get_char_pos(start + item["len"] - 1)
@@ -72,16 +79,21 @@ class String(PandocStr, Text, ret_subclass=True):
                     dpos.path,
                     Pos(dpos.start.ln, dpos.start.col),
                     Pos(epos.stop.ln, epos.stop.col),
-                ).dumpd()
+                )
 
-            parts.append([item["len"], pos])
+            if (pos is None) and (len(runs) > 0) and (runs[-1][1] is None):
+                runs[-1] = (runs[-1][0] + item["len"], None)
+            else:
+                runs.append((item["len"], pos))
             start += item["len"]
 
-        if len(parts) > 1:
-            for i in reversed(range(1, len(parts))):
-                if (parts[i][1] is None) and (parts[i - 1][1] is None):
-                    parts[i - 1][0] = cast(int, parts[i - 1][0]) + cast(int, parts[i][0])
-                    del parts[i]
+        return runs
+
+    def dumpd(self) -> list:
+        parts: list[list[int | list | None]] = [
+            [length, pos.dumpd() if pos is not None else None]
+            for length, pos in self.get_runs()
+        ]
 
         result: list[str | list[list[int | list | None]] | None]
 
@@ -120,22 +132,42 @@ class String(PandocStr, Text, ret_subclass=True):
             result = String(contents)
 
         else:
-            result = String()
+            result = cls.from_runs(
+                contents,
+                [
+                    (item[0], DataPos.loadd(item[1]) if item[1] else None)
+                    for item in dpos_data
+                ],
+            )
 
-            for item in dpos_data:
-                substr = contents[: item[0]]
-                if len(substr) < item[0]:
-                    raise RuntimeError("invalid data")
+        return result
 
-                dpos = DataPos.loadd(item[1]) if item[1] else None
-                result += String(substr, dpos=dpos)
+    @classmethod
+    def from_runs(cls, text: str, runs: list[tuple[int, Optional[DataPos]]]) -> "String":
+        """
+        creates a String from the runs of `get_runs()`.
+        Elements of all runs are made at first, and joined at once.
 
-                contents = contents[item[0] :]
+        @param text (str) : Text of the String.
+        @param runs (list[tuple[int, Optional[DataPos]]]) : length and position.
 
-            if len(contents) > 0:
+        @exception RuntimeError : Lengths of the runs don't match the text.
+        """
+        elements: list[PandocInlineElement] = []
+        start: int = 0
+        for length, dpos in runs:
+            substr = text[start : start + length]
+            if len(substr) < length:
                 raise RuntimeError("invalid data")
 
-        return result
+            if length > 0:
+                elements.append(cls._create_element(substr, dpos))
+            start += length
+
+        if start < len(text):
+            raise RuntimeError("invalid data")
+
+        return cls(elements)
 
     def get_char_pos(self, index: int = 0) -> Optional[DataPos]:
         pos: Optional[PandocDataPos] = super().get_char_pos(index)
@@ -1,8 +1,10 @@
 """
 textstring.py: TextString class
 """
+from array import array
+from bisect import bisect_right
 from collections.abc import Sequence
-from typing import Callable, Optional, SupportsIndex, Union, cast, overload
+from typing import Callable, NamedTuple, Optional, SupportsIndex, Union, cast, overload
 
 from gdoc.lib.pandocastobject.pandocast import PandocInlineElement
 from gdoc.util import Settings
@@ -31,6 +33,27 @@ _OTHER_KNOWN_TYPES = [
 ]
 
 
+class _TextCache(NamedTuple):
+    """
+    Flattened string of a TextString and offset tables of its items.
+    """
+
+    text: str
+    # Cumulative lengths of `get_str()` of the items.
+    str_ends: array
+    # Cumulative lengths of the items in chars of the leaf items,
+    # which are the char indexes of `get_char_pos()`.
+    leaf_ends: array
+    # Number of leading `String` items.
+    lead: int
+    # Index of the first of trailing `String` items.
+    trail: int
+    # Ranges of the items of consecutive `String`s.
+    runs: list[tuple[int, int]]
+    # Child TextStrings and their caches which the cache is made of.
+    deps: list[tuple["TextString", "_TextCache"]]
+
+
 class TextString(Text, Sequence, ReturnType, ret_subclass=True):
     """
     MutableSequence of gdoc inline elements.
@@ -39,6 +62,7 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
     """
 
     __text_items: list[Text]
+    __cache: Optional[_TextCache]
 
     def __init__(
         self,
@@ -56,6 +80,7 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         """
 
         self.__text_items = []  # init self as an empty list
+        self.__cache = None
 
         inlines: list[PandocInlineElement] | list[Text]
 
@@ -100,11 +125,77 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
     #########################
 
     def get_str(self) -> str:
-        result = ""
-        for text in self.__text_items:
-            result += text.get_str()
+        return self.__get_cache().text
 
-        return result
+    def __get_cache(self) -> _TextCache:
+        """
+        returns the cache of the flattened string and offset tables.
+        The cache is made again if self or child TextStrings are changed.
+        """
+        cache: Optional[_TextCache] = self.__cache
+        if cache is not None:
+            for child, child_cache in cache.deps:
+                if child.__get_cache() is not child_cache:
+                    cache = None
+                    break
+
+        if cache is None:
+            cache = self.__cache = self.__create_cache()
+
+        return cache
+
+    def __create_cache(self) -> _TextCache:
+        strs: list[str] = []
+        str_ends: array = array("i")
+        leaf_ends: array = array("i")
+        deps: list[tuple[TextString, _TextCache]] = []
+        str_end: int = 0
+        leaf_end: int = 0
+        lead: int = -1
+        trail: int = 0
+        runs: list[tuple[int, int]] = []
+        run_start: int = 0
+
+        i: int
+        text: Text
+        for i, text in enumerate(self.__text_items):
+            string: str = text.get_str()
+            strs.append(string)
+            str_end += len(string)
+            str_ends.append(str_end)
+
+            if isinstance(text, TextString):
+                child_cache: _TextCache = text.__get_cache()
+                deps.append((text, child_cache))
+                if len(child_cache.leaf_ends) > 0:
+                    leaf_end += child_cache.leaf_ends[-1]
+            else:
+                leaf_end += len(string)
+            leaf_ends.append(leaf_end)
+
+            if type(text) is not String:
+                if lead < 0:
+                    lead = i
+                trail = i + 1
+                if run_start < i:
+                    runs.append((run_start, i))
+                run_start = i + 1
+
+        if lead < 0:
+            lead = len(self.__text_items)
+        if run_start < len(self.__text_items):
+            runs.append((run_start, len(self.__text_items)))
+
+        return _TextCache("".join(strs), str_ends, leaf_ends, lead, trail, runs, deps)
+
+    def __create(self, items: list[Text]) -> "TextString":
+        """
+        creates a TextString of the items taken from TextStrings.
+        The items are not appended one by one, as they are already split into chars.
+        """
+        tstr: TextString = self.__class__._returntype_()
+        tstr.__text_items = items
+        return tstr
 
     def get_char_pos(self, index: int) -> Optional[DataPos]:
         result: Optional[DataPos] = None
@@ -120,27 +211,17 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         return result
 
     def _get_text_by_charindex(self, index: int) -> tuple[Union[Text, None], int]:
-        item: Text | None
-        _index: int = index
-
-        for item in self.__text_items:
-            item = cast(Text, item)
-            if not isinstance(item, TextString):
-                l: int = len(item.get_str())
-                if _index >= l:
-                    _index -= l
-                else:
-                    break
+        leaf_ends: array = self.__get_cache().leaf_ends
+        i: int = bisect_right(leaf_ends, index)
 
-            else:
-                item, _index = item._get_text_by_charindex(_index)
-                if item is not None:
-                    break
-                else:
-                    continue
+        if i >= len(leaf_ends):
+            return None, index - (leaf_ends[-1] if i > 0 else 0)
 
-        else:
-            item = None
+        item: Text = self.__text_items[i]
+        _index: int = index - (leaf_ends[i - 1] if i > 0 else 0)
+
+        if isinstance(item, TextString):
+            return item._get_text_by_charindex(_index)
 
         return item, _index
 
@@ -171,7 +252,7 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         text: Text
         for text in self.__text_items:
             if isinstance(text, String):
-                string += text
+                string.extend(text)
 
             else:
                 if len(string) > 0:
@@ -235,11 +316,14 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         else:
             self.__text_items.append(text)
 
+        self.__cache = None
+
     def get_text_items(self) -> list[Text]:
         return self.__text_items[:]
 
     def clear(self) -> None:
         self.__text_items.clear()
+        self.__cache = None
 
     def pop_prefix(self, prefix: str) -> Optional["TextString"]:
         if prefix == "":
@@ -272,6 +356,7 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
 
         if result is not None:
             del self.__text_items[:num_texts]
+            self.__cache = None
 
         return result
 
@@ -295,6 +380,7 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
                 break
 
         del self.__text_items[: len(result)]
+        self.__cache = None
 
         return result
 
@@ -332,7 +418,7 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         if isinstance(item, Text):
             result = item
         else:
-            result = self.__class__._returntype_(item)
+            result = self.__create(item)
 
         return result
 
@@ -346,7 +432,7 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
                 f'(not "{type(__x).__name__}") to TextString'
             )
 
-        return self.__class__._returntype_(texts)
+        return self.__create(texts)
 
     # def __radd__(self, __x: "TextString", /) -> "TextString":
     #     texts = self.__text_items[:]
@@ -385,14 +471,11 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         return self.__get_leading_str().startswith(__prefix)
 
     def __get_leading_str(self) -> str:
-        result: str = ""
-        for text in self.__text_items:
-            if type(text) is String:
-                result += str(text)
-            else:
-                break
+        cache: _TextCache = self.__get_cache()
+        if cache.lead == 0:
+            return ""
 
-        return result
+        return cache.text[: cache.str_ends[cache.lead - 1]]
 
     def endswith(self, __suffix: str | tuple[str, ...]) -> bool:
         """
@@ -406,13 +489,11 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         return self.__get_last_str().endswith(__suffix)
 
     def __get_last_str(self) -> str:
-        result: str = ""
-        for text in reversed(self.__text_items):
-            if type(text) is String:
-                result = str(text) + result
-            else:
-                break
-        return result
+        cache: _TextCache = self.__get_cache()
+        if cache.trail == 0:
+            return cache.text
+
+        return cache.text[cache.str_ends[cache.trail - 1] :]
 
     def strip(self, __chars: Optional[str] = None) -> "TextString":
         """
@@ -478,114 +559,141 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
         maxsplit: int = -1,
         retsep: bool = False,
     ) -> list["TextString"]:
-        result: list = []
-        target: TextString = self[:]
-        text_parts: list[tuple[str, TextString]] = []
+        """
+        Split the `String`s as a `str`, and the other items are parts of words.
+
+        The `String`s are split in the flattened str, and the results are
+        ranges of the items, which are made into TextStrings at the end.
+        """
+        cache: _TextCache = self.__get_cache()
+        items: list[Text] = self.__text_items
+        size: int = len(items)
+        result: list[tuple[int, int]] = []
+        text_parts: list[tuple[str, int, int]] = []
         max: int = maxsplit
+        pos: int = 0
+        run: int = 0
 
         if sep is None:
-            target = target.lstrip(sep)
+            # lstrip
+            while (
+                (pos < size)
+                and (type(items[pos]) is String)
+                and cache.text[self.__str_offset(cache, pos)].isspace()
+            ):
+                pos += 1
 
         do: bool = True
-        while do or ((len(target) > 0) and (max != 0)):
+        while do or ((pos < size) and (max != 0)):
             do = False
 
-            # get leading TextString not containing `String`.
-            _word: TextString = self.__class__._returntype_(
-                target._deque_while(lambda text: not (type(text) is String))
-            )
-            if len(_word) > 0:
-                text_parts.append(("w", _word))
+            # get leading items not containing `String`.
+            while (run < len(cache.runs)) and (cache.runs[run][1] <= pos):
+                run += 1
+            start: int = cache.runs[run][0] if run < len(cache.runs) else size
+            if start > pos:
+                text_parts.append(("w", pos, start))
+            elif start < pos:
+                start = pos
 
-            # get sub-TextString containing only `String` (len >= 0)
-            _sub_tstr: TextString = self.__class__._returntype_(
-                target._deque_while(lambda text: (type(text) is String))
-            )
-            # and split it as a `str` in util function.
-            text_parts += self._split_tstring(_sub_tstr, sep, max)
+            # get items of `String` (len >= 0) and split it as a `str`.
+            stop: int = cache.runs[run][1] if run < len(cache.runs) else size
+            text_parts += self.__split_run(cache, start, stop, sep, max)
+            pos = stop
 
             # concatenate consecutive words contained in `text_parts`.
             for i in reversed(range(1, len(text_parts))):
                 if text_parts[i][0] == "w" and text_parts[i - 1][0] == "w":
-                    text_parts[i - 1] = ("w", text_parts[i - 1][1] + text_parts[i][1])
+                    text_parts[i - 1] = ("w", text_parts[i - 1][1], text_parts[i][2])
                     del text_parts[i]
 
             # move all items from `text_parts` to `result` except the last item
             # while counting delimiters.
             for i in range(len(text_parts) - 1):
-                if text_parts[0][0] == "d":
+                if text_parts[i][0] == "d":
                     max -= 1
                     if retsep:
-                        result.append(text_parts[0][1])
+                        result.append(text_parts[i][1:])
                 else:
-                    result.append(text_parts[0][1])
-                del text_parts[0]
+                    result.append(text_parts[i][1:])
+            del text_parts[:-1]
 
             # move the last item if it's delimiter.
             if text_parts and (text_parts[0][0] == "d"):
                 max -= 1
                 if retsep:
-                    result.append(text_parts[0][1])
+                    result.append(text_parts[0][1:])
                 del text_parts[0]
 
         if len(text_parts) != 0:
             # it should be a word.
-            result.append(text_parts[0][1] + target)
+            result.append((text_parts[0][1], size))
 
-        elif len(target) > 0:
-            result.append(target)
+        elif pos < size:
+            result.append((pos, size))
 
         # remove the last item if it's delimiter
-        if (
-            (sep is None)
-            and (len(result) > 0)
-            and (result[-1].get_str().split(sep) == [])
-        ):
-            del result[-1]
+        if (sep is None) and (len(result) > 0):
+            start, stop = result[-1]
+            substr: str = cache.text[
+                self.__str_offset(cache, start) : self.__str_offset(cache, stop)
+            ]
+            if substr.split(sep) == []:
+                del result[-1]
 
-        return result
+        return [self.__create(items[start:stop]) for start, stop in result]
+
+    @staticmethod
+    def __str_offset(cache: _TextCache, index: int) -> int:
+        """
+        returns the offset of the item in the flattened str.
+        """
+        return cache.str_ends[index - 1] if index > 0 else 0
 
     @staticmethod
-    def _split_tstring(
-        sub_tstr: "TextString", sep: Optional[str], max: int = -1
-    ) -> list[tuple[str, "TextString"]]:
+    def __split_run(
+        cache: _TextCache, start: int, stop: int, sep: Optional[str], max: int = -1
+    ) -> list[tuple[str, int, int]]:
         """
-        _summary_
+        Split the range of `String` items as a `str`.
 
-        @param sub_tstr : should be `TextString` containing only `String`.
-        @return _type_ : _description_
+        @param cache (_TextCache) : cache of the TextString.
+        @param start (int) : Index of the first `String` item.
+        @param stop (int) : Index of the next to the last `String` item.
+        @return list[tuple[str, int, int]] : "w"(word) or "d"(delimiter)
+                                             and the range of the items.
         """
-        result: list[tuple[str, "TextString"]] = []
-        sub_str: str = sub_tstr.get_str()
+        result: list[tuple[str, int, int]] = []
+        # Each `String` item is a char, so the items are indexed as the str.
+        offset: int = TextString.__str_offset(cache, start)
+        sub_str: str = cache.text[offset : offset + stop - start]
         parts: list[str] = sub_str.split(sep, max)
 
-        start: int
+        begin: int = 0
         end: int
         pos: int
         if sep is None:
-            start = 0
             for part in parts:
-                pos = sub_str.find(part, start)
+                pos = sub_str.find(part, begin)
                 # pos >= 0 since part should be found
-                if pos > start:
-                    result.append(("d", sub_tstr[start:pos]))
+                if pos > begin:
+                    result.append(("d", start + begin, start + pos))
                 end = pos + len(part)
-                result.append(("w", sub_tstr[pos:end]))
-                start = end
+                result.append(("w", start + pos, start + end))
+                begin = end
 
-            if start < len(sub_tstr):
-                result.append(("d", sub_tstr[start:]))
+            if begin < len(sub_str):
+                result.append(("d", start + begin, stop))
 
         else:
-            start = 0
             for part in parts:
-                end = start + len(part)
-                result.append(("w", sub_tstr[start:end]))
-                start = end
-                if sub_str[start:].startswith(sep):
-                    end = start + len(sep)
-                    result.append(("d", sub_tstr[start:end]))
-                    start = end
+                end = begin + len(part)
+                result.append(("w", start + begin, start + end))
+                begin = end
+                if sub_str.startswith(sep, begin):
+                    end = begin + len(sep)
+                    result.append(("d", start + begin, start + end))
+                    begin = end
 
         return result
 
@@ -603,33 +711,23 @@ class TextString(Text, Sequence, ReturnType, ret_subclass=True):
             /
         ) -> int
 
-        @return _type_ : _description_
-        """
-        target: TextString = self[:]
-        pos: int = 0
+        Each range of `String` items is searched as a `str` in the flattened str.
 
-        if len(target) == 0:
+        @return int : Index of the item where sub is found, -1 if not found.
+        """
+        if len(self.__text_items) == 0:
             return "".find(sub, start, end)
 
-        result: int = -1
-        while len(target) > 0:
-            # skip leading TextString not containing `String`.
-            texts: list[Text] = target._deque_while(
-                lambda text: not (type(text) is String)
+        cache: _TextCache = self.__get_cache()
+        run_start: int
+        run_stop: int
+        for run_start, run_stop in cache.runs:
+            # Each `String` item is a char, so the items are indexed as the str.
+            offset: int = self.__str_offset(cache, run_start)
+            p: int = cache.text[offset : offset + run_stop - run_start].find(
+                sub, start, end
             )
-            pos += len(texts)
+            if p >= 0:
+                return run_start + p
 
-            # get sub-TextString containing only `String`.
-            sub_tstr: TextString = self.__class__._returntype_(
-                target._deque_while(lambda text: (type(text) is String))
-            )
-            substr: str = sub_tstr.get_str()
-            if len(substr) > 0:
-                p = substr.find(sub, start, end)
-                if p >= 0:
-                    result = pos + p
-                    break
-
-            pos += len(sub_tstr)
-
-        return result
+        return -1
@@ -10,7 +10,7 @@ from gdoc.lib.gdocparser.objectcontext import ObjectContext
 from gdoc.lib.gdocparser.tokeninfobuffer import TokenInfoBuffer
 from gdoc.lib.gobj.types import BaseCategory
 from gdoc.lib.gobj.types import Document as GobjDocument
-from gdoc.lib.pandocastobject.pandoc import Pandoc
+from gdoc.lib.pandocastobject.pandoc import MarkdownReader, Pandoc, PandocAstCache
 from gdoc.lib.pandocastobject.pandocast import PandocAst
 from gdoc.lib.plugins import Category, CategoryManager
 from gdoc.util import Err, ErrorReport, Ok, Result, Settings
@@ -21,14 +21,22 @@ class GdocCompiler:
 
     _categories_: CategoryManager
     _tokeninfocache: TokenInfoBuffer | None
+    _astcache: PandocAstCache | None
+    _pandoc: Pandoc | MarkdownReader | None
 
     def __init__(
-        self, plugins: list[Category] = [], tokeninfocache: TokenInfoBuffer | None = None
+        self,
+        plugins: list[Category] = [],
+        tokeninfocache: TokenInfoBuffer | None = None,
+        astcache: PandocAstCache | None = None,
+        pandoc: Pandoc | MarkdownReader | None = None,
     ) -> None:
         self._categories_ = CategoryManager().add_category(BaseCategory)
         for p in plugins:
             self._categories_.add_category(p)
         self._tokeninfocache = tokeninfocache
+        self._astcache = astcache
+        self._pandoc = pandoc
 
     def compile(
         self,
@@ -41,8 +49,8 @@ class GdocCompiler:
     ) -> Result[GobjDocument, ErrorReport]:
         """
         1. check if the target file exists.
-        2. check if ./_gdoc_/filename.past.json exists.
-        3. run pandoc
+        2. check if the PandocAST json is in the cache(./_gdoc_/cache/*.past.json).
+        3. run pandoc if not cached
         4. create pandocAst
         5. get metadata in the AST, and set into Document
         6. call parse_Document()
@@ -57,7 +65,54 @@ class GdocCompiler:
             )
             return Err(erpt)
 
-        pandoc_json = Pandoc().get_json(filepath, fileformat, via_html, filedata)
+        pandoc_json = get_pandoc_json(
+            filepath, fileformat, via_html, filedata, self._astcache, self._pandoc
+        )
+
+        return self.parse(filepath, pandoc_json, erpt, opts)
+
+    async def compile_async(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+        erpt: Optional[ErrorReport] = None,
+        opts: Optional[Settings] = None,
+    ) -> Result[GobjDocument, ErrorReport]:
+        """
+        async version of `compile()`.
+        Cancelling the task kills pandoc if it's running.
+        """
+        opts = opts or Settings({})
+        erpt = erpt or ErrorReport()
+
+        if not os.path.isfile(filepath):
+            erpt.submit(
+                # should be Exception
+                f"{filepath} is not found."
+            )
+            return Err(erpt)
+
+        pandoc_json = await get_pandoc_json_async(
+            filepath, fileformat, via_html, filedata, self._astcache, self._pandoc
+        )
+
+        return self.parse(filepath, pandoc_json, erpt, opts)
+
+    def parse(
+        self,
+        filepath: str,
+        pandoc_json: dict,
+        erpt: Optional[ErrorReport] = None,
+        opts: Optional[Settings] = None,
+    ) -> Result[GobjDocument, ErrorReport]:
+        """
+        4. - 6. of `compile()` for PandocAST json object obtained in advance.
+        """
+        opts = opts or Settings({})
+        erpt = erpt or ErrorReport()
+
         pandoc_ast = PandocAst(pandoc_json)
         gdoc = GdocDocument(pandoc_ast)
         gobj: GobjDocument = GobjDocument(None, filepath, self._categories_)
@@ -70,3 +125,43 @@ class GdocCompiler:
         gobj = cast(GobjDocument, r.unwrap())
 
         return Ok(gobj)
+
+
+def get_pandoc_json(
+    filepath: str,
+    fileformat: str | None = None,
+    via_html: bool | None = None,
+    filedata: str | None = None,
+    astcache: PandocAstCache | None = None,
+    pandoc: Pandoc | MarkdownReader | None = None,
+) -> dict:
+    """
+    returns PandocAST json object from the cache if given, or from pandoc.
+    `pandoc` is used only when `astcache` is None. `MarkdownReader` can be given
+    as `pandoc` to parse markdown files without running pandoc.
+
+    This is a module level function so that it can be passed to worker processes.
+    """
+    if astcache is not None:
+        return astcache.get_json(filepath, fileformat, via_html, filedata)
+
+    return (pandoc or Pandoc()).get_json(filepath, fileformat, via_html, filedata)
+
+
+async def get_pandoc_json_async(
+    filepath: str,
+    fileformat: str | None = None,
+    via_html: bool | None = None,
+    filedata: str | None = None,
+    astcache: PandocAstCache | None = None,
+    pandoc: Pandoc | MarkdownReader | None = None,
+) -> dict:
+    """
+    async version of `get_pandoc_json()`.
+    """
+    if astcache is not None:
+        return await astcache.get_json_async(filepath, fileformat, via_html, filedata)
+
+    return await (pandoc or Pandoc()).get_json_async(
+        filepath, fileformat, via_html, filedata
+    )
@@ -2,7 +2,7 @@ r"""
 Node class
 """
 from enum import Enum, auto
-from typing import Callable, Optional, Union
+from typing import Callable, Iterator, Optional, Union
 
 
 class Node:
@@ -223,8 +223,33 @@ class Node:
 
         action(self, root)
 
-        for child in self.get_local_children():
-            child.walk(action, post_action, root)
+        # An explicit stack instead of recursion, not to hit the recursion limit.
+        stack: list[tuple[Node, Iterator[Node]]] = [
+            (self, iter(self.get_local_children()))
+        ]
+        while stack:
+            node, children = stack[-1]
+            child: Node | None = next(children, None)
+            if child is not None:
+                action(child, root)
+                stack.append((child, iter(child.get_local_children())))
+            else:
+                stack.pop()
+                if post_action is not None:
+                    post_action(node, root)
+
+    def iter_preorder(
+        self, prune: Callable[["Node"], bool] | None = None
+    ) -> Iterator["Node"]:
+        """Iterate over the node tree.
+        Yield the node and all local children in the same order as walk() calls action.
+
+        @param prune : Skips the children of nodes it returns True for. Defaults to None.
+        """
+        stack: list["Node"] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
 
-        if post_action is not None:
-            post_action(self, root)
+            if (prune is None) or (not prune(node)):
+                stack.extend(reversed(node.get_local_children()))
@@ -4,4 +4,8 @@ r"""!
 
 """
 
+from .astcache import PandocAstCache
+from .capabilities import PandocCapabilities
+from .markdownreader import MarkdownReader
 from .pandoc import Pandoc
+from .pandocserver import PandocServer
@@ -0,0 +1,242 @@
+r"""
+PandocAstCache class
+"""
+import hashlib
+import json
+import os
+from logging import getLogger
+
+from . import jsonbackend
+from .capabilities import DEFAULT_CACHE_DIR
+from .markdownreader import MarkdownReader
+from .pandoc import Pandoc
+
+logger = getLogger(__name__)
+
+DEFAULT_MAX_SIZE: int = 256 * 1024 * 1024  # bytes
+
+_CACHE_FILE_EXT_: str = ".past.json"
+
+
+class PandocAstCache:
+    """
+    Content-addressed on-disk cache of PandocAST json objects.
+
+    Each entry is stored as `<key>.past.json` in the cache directory.
+    The key is a hash of the source data, the version of pandoc and the options
+    passed to pandoc, so unchanged documents don't need to run pandoc again.
+    """
+
+    _pandoc: Pandoc | MarkdownReader
+    _cache_dir: str
+    _max_size: int | None
+    _total_size: int | None
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_size: int | None = DEFAULT_MAX_SIZE,
+        pandoc: Pandoc | MarkdownReader | None = None,
+    ):
+        """
+        @param cache_dir (str, optional) : Directory to store cache files.
+                                           Defaults to DEFAULT_CACHE_DIR.
+        @param max_size (int | None, optional) : Maximum total size of cache files in
+                                                 bytes. None means unlimited.
+                                                 Defaults to DEFAULT_MAX_SIZE.
+        @param pandoc (Pandoc | MarkdownReader | None, optional) :
+                Pandoc to run on cache misses. Defaults to None.
+        """
+        self._pandoc = pandoc or Pandoc(cache_dir=cache_dir)
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._total_size = None
+
+    def get_json(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+        """
+        returns pandoc ast json object from the cache or from pandoc.
+
+        Arguments are the same as `Pandoc.get_json()`.
+        """
+        key: str | None = self.get_key(filepath, fileformat, via_html, filedata)
+
+        json_object = self.load(key) if key is not None else None
+        if json_object is None:
+            json_object = self._pandoc.get_json(filepath, fileformat, via_html, filedata)
+            if key is not None:
+                self.store(key, json_object)
+
+        return json_object
+
+    async def get_json_async(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+        """
+        async version of `get_json()`.
+        """
+        key: str | None = self.get_key(filepath, fileformat, via_html, filedata)
+
+        json_object = self.load(key) if key is not None else None
+        if json_object is None:
+            json_object = await self._pandoc.get_json_async(
+                filepath, fileformat, via_html, filedata
+            )
+            if key is not None:
+                self.store(key, json_object)
+
+        return json_object
+
+    def get_key(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ) -> str | None:
+        """
+        returns the cache key of the source document.
+
+        @return str | None : Hex digest of the key, or None if the source document
+                             can not be read.
+        """
+        data: bytes
+        if filedata is not None:
+            data = filedata.encode("utf-8")
+        else:
+            try:
+                with open(filepath, "rb") as f:
+                    data = f.read()
+            except OSError:
+                return None
+
+        # 'sourcepos' extension puts the file path into each 'data-pos' attribute
+        # when pandoc reads the file, but not when it reads stdin.
+        source: str = filepath if filedata is None else ""
+
+        header: str = json.dumps(
+            [
+                self._pandoc.get_version(),
+                source,
+                fileformat,
+                via_html,
+            ],
+            sort_keys=True,
+        )
+
+        h = hashlib.sha256(header.encode("utf-8"))
+        h.update(b"\0")
+        h.update(data)
+
+        return h.hexdigest()
+
+    def load(self, key: str):
+        """
+        returns pandoc ast json object stored with the key.
+
+        @return PandocAst json object, or None if not found.
+        """
+        path: str = self._get_path(key)
+
+        try:
+            with open(path, "rb") as f:
+                json_object = jsonbackend.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        try:
+            # Update mtime for the LRU eviction.
+            os.utime(path)
+        except OSError:
+            pass
+
+        logger.debug("cache hit: %s", path)
+
+        return json_object
+
+    def store(self, key: str, json_object) -> None:
+        """
+        stores pandoc ast json object with the key and evicts old entries
+        if the total size exceeds max_size.
+        """
+        path: str = self._get_path(key)
+        tmppath: str = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(tmppath, "wb") as f:
+                f.write(jsonbackend.dumps(json_object))
+            size: int = os.path.getsize(tmppath)
+            existed: bool = os.path.isfile(path)
+            os.replace(tmppath, path)
+        except OSError as e:
+            logger.warning("failed to store cache: %s (%s)", path, e)
+            return
+
+        if (self._total_size is not None) and (not existed):
+            self._total_size += size
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        removes least recently used entries until the total size gets within
+        max_size.
+        """
+        if self._max_size is None:
+            return
+
+        if (self._total_size is not None) and (self._total_size <= self._max_size):
+            return
+
+        entries: list[tuple[float, int, str]] = self._get_entries()
+        self._total_size = sum(entry[1] for entry in entries)
+
+        entries.sort()
+        for mtime, size, path in entries:
+            if self._total_size <= self._max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._total_size -= size
+            logger.debug("cache evicted: %s", path)
+
+    def clear(self) -> None:
+        """
+        removes all entries.
+        """
+        for _, _, path in self._get_entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        self._total_size = 0
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + _CACHE_FILE_EXT_)
+
+    def _get_entries(self) -> list[tuple[float, int, str]]:
+        entries: list[tuple[float, int, str]] = []
+
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(_CACHE_FILE_EXT_) and entry.is_file():
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            pass
+
+        return entries
@@ -0,0 +1,187 @@
+r"""
+Process-wide cache of capabilities of pandoc commands
+
+Capabilities of a pandoc binary, its version, the pandoc-types API version and
+the extensions supported by the readers, are probed only once per process and
+stored in `pandoc-capabilities.json` in the cache directory, so later processes
+don't need to run `pandoc --version` again.
+Entries are invalidated when the mtime or the size of the binary changes.
+"""
+import json
+import os
+import shutil
+import subprocess
+import threading
+from logging import getLogger
+from typing import NamedTuple
+
+from . import jsonbackend
+
+logger = getLogger(__name__)
+
+DEFAULT_CACHE_DIR: str = os.path.join("_gdoc_", "cache")
+
+_CACHE_FILE_: str = "pandoc-capabilities.json"
+
+# Input formats to probe supported extensions of.
+_FORMATS_: tuple[str, ...] = ("gfm", "commonmark", "commonmark_x")
+
+
+class PandocCapabilities(NamedTuple):
+    version: dict[str, list[int | str]]
+    api_version: list[int]
+    extensions: dict[str, list[str]]
+
+    def supports(self, fileformat: str, extension: str) -> bool:
+        """
+        returns True if the reader of `fileformat` supports the extension.
+        """
+        return extension in self.extensions.get(fileformat, [])
+
+
+_capabilities_: dict[str, tuple[tuple[int, int], PandocCapabilities]] = {}
+_lock_: threading.Lock = threading.Lock()
+
+
+def get_capabilities(
+    pandoc_command: str = "pandoc", cache_dir: str | None = None
+) -> PandocCapabilities:
+    """
+    returns capabilities of the pandoc command.
+
+    @param pandoc_command (str, optional) : pandoc command. Defaults to "pandoc".
+    @param cache_dir (str | None, optional) : Directory of the persistent cache.
+                None means the capabilities are cached only in the process.
+                Defaults to None.
+    @exception FileNotFoundError : pandoc command is not found.
+    """
+    path: str | None = shutil.which(pandoc_command)
+    if path is None:
+        raise FileNotFoundError(f"{pandoc_command} is not found.")
+    path = os.path.realpath(path)
+
+    st = os.stat(path)
+    stamp: tuple[int, int] = (st.st_mtime_ns, st.st_size)
+
+    with _lock_:
+        cached = _capabilities_.get(path)
+        if (cached is not None) and (cached[0] == stamp):
+            return cached[1]
+
+        capabilities: PandocCapabilities | None = None
+        if cache_dir is not None:
+            capabilities = _load(cache_dir, path, stamp)
+
+        if capabilities is None:
+            capabilities = _probe(path)
+            if cache_dir is not None:
+                _store(cache_dir, path, stamp, capabilities)
+
+        _capabilities_[path] = (stamp, capabilities)
+
+    return capabilities
+
+
+def clear_capabilities() -> None:
+    """
+    clears capabilities cached in the process.
+    """
+    with _lock_:
+        _capabilities_.clear()
+
+
+def _probe(path: str) -> PandocCapabilities:
+    logger.debug("probe capabilities of %s", path)
+
+    version: dict[str, list[int | str]] = _parse_version(_run([path, "--version"]))
+
+    api_version: list[int] = []
+    try:
+        output = jsonbackend.loads(_run([path, "-f", "markdown", "-t", "json"]))
+        api_version = output.get("pandoc-api-version", [])
+    except ValueError:
+        pass
+
+    if ("pandoc-types" not in version) and (len(api_version) > 0):
+        # pandoc 3 doesn't show the version of pandoc-types.
+        version["pandoc-types"] = list(api_version)
+
+    extensions: dict[str, list[str]] = {}
+    for fileformat in _FORMATS_:
+        extensions[fileformat] = [
+            line[1:]
+            for line in _run([path, f"--list-extensions={fileformat}"]).split()
+            if line[:1] in ("+", "-")
+        ]
+
+    return PandocCapabilities(version, api_version, extensions)
+
+
+def _run(commandline: list[str]) -> str:
+    ps = subprocess.run(
+        commandline,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        encoding="utf-8",
+    )
+    return ps.stdout
+
+
+def _parse_version(stdout: str) -> dict[str, list[int | str]]:
+    version: dict[str, list[int | str]] = {}
+    for line in stdout.split("\n"):
+        words: list[str] = line.replace(",", " ").split()
+        for i, word in enumerate(words):
+            if (word in ("pandoc", "pandoc-types")) and (i < len(words) - 1):
+                vers: list[str] = words[i + 1].split(".")
+                if not vers[0].isdecimal():
+                    break
+                version[word] = [(int(ver) if ver.isdecimal() else ver) for ver in vers]
+
+    return version
+
+
+def _load(cache_dir: str, path: str, stamp: tuple[int, int]) -> PandocCapabilities | None:
+    entry = _read(cache_dir).get(path)
+    if (type(entry) is not dict) or (entry.get("stamp") != list(stamp)):
+        return None
+
+    try:
+        return PandocCapabilities(
+            entry["version"], entry["api-version"], entry["extensions"]
+        )
+    except KeyError:
+        return None
+
+
+def _store(
+    cache_dir: str, path: str, stamp: tuple[int, int], capabilities: PandocCapabilities
+) -> None:
+    entries: dict = _read(cache_dir)
+    entries[path] = {
+        "stamp": list(stamp),
+        "version": capabilities.version,
+        "api-version": capabilities.api_version,
+        "extensions": capabilities.extensions,
+    }
+
+    filepath: str = os.path.join(cache_dir, _CACHE_FILE_)
+    tmppath: str = f"{filepath}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmppath, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmppath, filepath)
+    except OSError as e:
+        logger.warning("failed to store capabilities: %s (%s)", filepath, e)
+
+
+def _read(cache_dir: str) -> dict:
+    try:
+        with open(os.path.join(cache_dir, _CACHE_FILE_), "rb") as f:
+            entries = jsonbackend.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+    return entries if type(entries) is dict else {}
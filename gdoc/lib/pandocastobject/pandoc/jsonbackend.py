@@ -0,0 +1,38 @@
+r"""
+JSON backend for PandocAST json
+
+`orjson` is used if it is installed, otherwise the standard `json` module.
+Both of them parse json from bytes, so pandoc output and cache files don't
+need to be decoded into str in advance.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND: str = "json" if orjson is None else "orjson"
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    parses json from bytes(UTF-8) or str.
+
+    @exception ValueError : Invalid json.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    returns compact UTF-8 json bytes of the object.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,1199 @@
+r"""
+MarkdownReader class
+"""
+import html
+import re
+import unicodedata
+from typing import NamedTuple
+
+from .rawhtml import interpret_raw_html
+
+_API_VERSION_: list[int] = [1, 22, 2, 1]
+_READER_VERSION_: list[int] = [0, 1, 0]
+# The parser reads GFM only, and the extension to be switched is 'sourcepos' only.
+_FORMAT_: str = "gfm"
+_EXTENSIONS_: tuple[str, ...] = ("sourcepos",)
+
+_ASCII_PUNCTUATION_: str = "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"
+
+_ATX_RE_ = re.compile(r" {0,3}(#{1,6})(?:[ \t]+|$)")
+_ATX_CLOSING_RE_ = re.compile(r"(?:^|[ \t]+)#+[ \t]*$")
+_SETEXT_RE_ = re.compile(r" {0,3}(=+|-+)[ \t]*$")
+_HR_RE_ = re.compile(r" {0,3}(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$")
+_FENCE_RE_ = re.compile(r"( {0,3})(`{3,}|~{3,})[ \t]*(.*?)[ \t]*$")
+_FENCE_CLOSING_RE_ = re.compile(r" {0,3}(`{3,}|~{3,})[ \t]*$")
+_QUOTE_RE_ = re.compile(r" {0,3}> ?")
+_BULLET_RE_ = re.compile(r" {0,3}([-+*])(?=[ \t]|$)")
+_ORDERED_RE_ = re.compile(r" {0,3}(\d{1,9})([.)])(?=[ \t]|$)")
+_TABLE_DELIMITER_RE_ = re.compile(r":?-+:?$")
+
+_TAG_NAME_ = r"[A-Za-z][A-Za-z0-9-]*"
+_ATTRIBUTE_ = (
+    r"(?:\s+[A-Za-z_:][A-Za-z0-9_.:-]*"
+    r"(?:\s*=\s*(?:[^\s\"'=<>`]+|'[^']*'|\"[^\"]*\"))?)"
+)
+_OPEN_TAG_ = rf"<{_TAG_NAME_}{_ATTRIBUTE_}*\s*/?>"
+_CLOSING_TAG_ = rf"</{_TAG_NAME_}\s*>"
+_RAW_HTML_RE_ = re.compile(
+    "|".join(
+        [
+            _OPEN_TAG_,
+            _CLOSING_TAG_,
+            r"<!-->|<!--->|<!--[\s\S]*?-->",
+            r"<\?[\s\S]*?\?>",
+            r"<![A-Za-z][^>]*>",
+            r"<!\[CDATA\[[\s\S]*?\]\]>",
+        ]
+    )
+)
+_URI_AUTOLINK_RE_ = re.compile(r"<([A-Za-z][A-Za-z0-9+.-]{1,31}:[^\s<>]*)>")
+_EMAIL_AUTOLINK_RE_ = re.compile(
+    r"<([A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*)>"
+)
+_ENTITY_RE_ = re.compile(
+    r"&(?:#[0-9]{1,7}|#[xX][0-9A-Fa-f]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});"
+)
+_LINK_TAIL_RE_ = re.compile(
+    r"\(\s*(<(?:[^<>\n\\]|\\.)*>|(?:[^\s()\\]|\\.|\((?:[^\s()\\]|\\.)*\))*)"
+    r"(?:\s+(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'|\((?:[^()\\]|\\.)*\)))?\s*\)"
+)
+_ESCAPED_RE_ = re.compile(r"\\([!-/:-@\[-`{-~])")
+_TEXT_RE_ = re.compile(r"(?:[^\\`<&*_~\[\]! \t\n]|!(?!\[))+")
+
+_HTML_BLOCK_START_ = [
+    # (start pattern, end pattern, can interrupt a paragraph)
+    (
+        re.compile(r" {0,3}<(?:script|pre|style|textarea)(?:[ \t>]|$)", re.I),
+        re.compile(r"</(?:script|pre|style|textarea)>", re.I),
+        True,
+    ),
+    (re.compile(r" {0,3}<!--"), re.compile(r"-->"), True),
+    (re.compile(r" {0,3}<\?"), re.compile(r"\?>"), True),
+    (re.compile(r" {0,3}<![A-Za-z]"), re.compile(r">"), True),
+    (re.compile(r" {0,3}<!\[CDATA\["), re.compile(r"\]\]>"), True),
+    (
+        re.compile(
+            r" {0,3}</?(?:address|article|aside|base|basefont|blockquote|body|caption"
+            r"|center|col|colgroup|dd|details|dialog|dir|div|dl|dt|fieldset"
+            r"|figcaption|figure|footer|form|frame|frameset|h[1-6]|head|header|hr"
+            r"|html|iframe|legend|li|link|main|menu|menuitem|nav|noframes|ol"
+            r"|optgroup|option|p|param|search|section|summary|table|tbody|td|tfoot"
+            r"|th|thead|title|tr|track|ul)(?:[ \t]|/?>|$)",
+            re.I,
+        ),
+        None,
+        True,
+    ),
+    (re.compile(rf" {{0,3}}(?:{_OPEN_TAG_}|{_CLOSING_TAG_})[ \t]*$"), None, False),
+]
+
+
+class _Line(NamedTuple):
+    ln: int  # line number of the source(1-based)
+    col: int  # column number of text[0] in the source(1-based)
+    text: str
+
+
+class MarkdownReader:
+    """
+    Pure python CommonMark(GFM) reader to generate PandocAST json object
+    as `pandoc -f gfm+sourcepos -t json` does, including 'data-pos' attributes.
+
+    It has the same interface as `Pandoc`, and can be used instead of it to
+    compile documents without running pandoc.
+
+    Supported syntax:
+    - ATX and setext headers, paragraphs, block quotes, bullet and ordered lists,
+      fenced and indented code blocks, pipe tables, html blocks, thematic breaks
+    - code spans, emphasis, strong emphasis, strikeout, inline links and images,
+      autolinks, raw html, backslash escapes, entities and line breaks
+
+    Reference links, footnotes, task lists and extended autolinks are not supported.
+    """
+
+    def get_json(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+        """
+        returns pandoc ast json object.
+
+        Arguments are the same as `Pandoc.get_json()`.
+
+        @exception ValueError : The file format is not supported.
+        """
+        filename: list[str] = filepath.rsplit("/", 1)[-1].rsplit(".", 1)
+        file_ext: str = filename[-1] if len(filename) > 1 else ""
+
+        if fileformat is None:
+            if file_ext != "md":
+                raise ValueError(f"unsupported file type: '{filepath}'")
+            fileformat = "gfm"
+
+        base, *extensions = re.split(r"(?=[+-])", fileformat)
+        if (base != _FORMAT_) or any(ext[1:] not in _EXTENSIONS_ for ext in extensions):
+            raise ValueError(f"unsupported file format: '{fileformat}'")
+
+        text: str
+        if filedata is None:
+            with open(filepath, "r", encoding="utf-8") as f:
+                text = f.read()
+        else:
+            text = filedata
+
+        sourcepos: bool = "-sourcepos" not in fileformat
+        path: str = filepath if filedata is None else ""
+
+        json_object: dict = {
+            "pandoc-api-version": list(_API_VERSION_),
+            "meta": {},
+            "blocks": _Parser(path, sourcepos).parse(text),
+        }
+
+        if via_html:
+            interpret_raw_html(json_object)
+
+        return json_object
+
+    async def get_json_async(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+        """
+        async version of `get_json()` to be used in place of `Pandoc.get_json_async()`.
+        The reader runs in the calling thread as it doesn't wait for any process.
+        """
+        return self.get_json(filepath, fileformat, via_html, filedata)
+
+    def get_version(self) -> dict[str, list[int | str]]:
+        """
+        returns versions of the reader and pandoc-types of the generated json.
+        """
+        return {
+            "gdoc-markdown": list(_READER_VERSION_),
+            "pandoc-types": list(_API_VERSION_),
+        }
+
+
+class _Parser:
+    """
+    Block and inline parser for one document.
+    """
+
+    _path: str
+    _sourcepos: bool
+    _identifiers: dict[str, int]
+
+    def __init__(self, path: str, sourcepos: bool):
+        self._path = path
+        self._sourcepos = sourcepos
+        self._identifiers = {}
+
+    def parse(self, text: str) -> list:
+        lines: list[str] = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        if lines[-1] == "":
+            lines.pop()
+
+        blocks, _ = self._parse_blocks(
+            [_Line(ln, 1, line) for ln, line in enumerate(lines, 1)]
+        )
+
+        return blocks
+
+    #
+    # Blocks
+    #
+    def _parse_blocks(self, lines: list[_Line]) -> tuple[list, bool]:
+        """
+        @return tuple[list, bool] : Blocks and whether blank lines are
+                                    between them or not.
+        """
+        blocks: list = []
+        loose: bool = False
+        blank: bool = False
+
+        i: int = 0
+        while i < len(lines):
+            if _is_blank(lines[i].text):
+                blank = len(blocks) > 0
+                i += 1
+                continue
+
+            loose = loose or blank
+            blank = False
+            i = self._parse_block(lines, i, blocks)
+
+        return blocks, loose
+
+    def _parse_block(self, lines: list[_Line], i: int, blocks: list) -> int:
+        text: str = lines[i].text
+
+        if _get_indent(text)[0] >= 4:
+            return self._parse_indented_code(lines, i, blocks)
+
+        if _get_fence(text) is not None:
+            return self._parse_fenced_code(lines, i, blocks)
+
+        if _ATX_RE_.match(text):
+            return self._parse_atx_header(lines, i, blocks)
+
+        if _HR_RE_.match(text):
+            blocks.append(self._block({"t": "HorizontalRule"}, lines[i], lines[i]))
+            return i + 1
+
+        if _QUOTE_RE_.match(text):
+            return self._parse_block_quote(lines, i, blocks)
+
+        if _get_list_marker(text) is not None:
+            return self._parse_list(lines, i, blocks)
+
+        if _get_html_block(text, False) is not None:
+            return self._parse_html_block(lines, i, blocks)
+
+        if self._is_table_start(lines, i):
+            return self._parse_table(lines, i, blocks)
+
+        return self._parse_paragraph(lines, i, blocks)
+
+    def _parse_paragraph(self, lines: list[_Line], i: int, blocks: list) -> int:
+        j: int = i + 1
+        while j < len(lines):
+            text: str = lines[j].text
+            if _is_blank(text):
+                break
+
+            m = _SETEXT_RE_.match(text)
+            if m is not None:
+                level: int = 1 if m.group(1)[0] == "=" else 2
+                blocks.append(self._header(level, lines[i:j], lines[i], lines[j]))
+                return j + 1
+
+            if _can_interrupt_paragraph(text) or self._is_table_start(lines, j):
+                break
+
+            j += 1
+
+        inlines: list = self._parse_inlines(lines[i:j])
+        blocks.append(self._block({"t": "Para", "c": inlines}, lines[i], lines[j - 1]))
+
+        return j
+
+    def _parse_atx_header(self, lines: list[_Line], i: int, blocks: list) -> int:
+        line: _Line = lines[i]
+        m = _ATX_RE_.match(line.text)
+        assert m is not None
+
+        content: str = _ATX_CLOSING_RE_.sub("", line.text[m.end() :]).rstrip()
+        content_line = _Line(line.ln, line.col + m.end(), content)
+        blocks.append(self._header(len(m.group(1)), [content_line], line, line))
+
+        return i + 1
+
+    def _header(self, level: int, content: list[_Line], first: _Line, last: _Line):
+        inlines: list = self._parse_inlines(content)
+        identifier: str = self._get_identifier(_stringify(inlines))
+
+        return self._block(
+            {"t": "Header", "c": [level, [identifier, [], []], inlines]}, first, last
+        )
+
+    def _parse_fenced_code(self, lines: list[_Line], i: int, blocks: list) -> int:
+        fence = _get_fence(lines[i].text)
+        assert fence is not None
+        indent, marker, info = fence
+
+        codes: list[str] = []
+        j: int = i + 1
+        last: _Line = lines[-1]
+        while j < len(lines):
+            text: str = lines[j].text
+            m = _FENCE_CLOSING_RE_.match(text)
+            if (
+                (m is not None)
+                and (m.group(1)[0] == marker[0])
+                and (len(m.group(1)) >= len(marker))
+            ):
+                last = lines[j]
+                j += 1
+                break
+
+            codes.append(_strip_indent(lines[j], indent).text)
+            j += 1
+
+        info = _unescape(info)
+        classes: list[str] = [info.split()[0]] if info else []
+        blocks.append(
+            self._block(
+                {"t": "CodeBlock", "c": [["", classes, []], "\n".join(codes)]},
+                lines[i],
+                last,
+            )
+        )
+
+        return j
+
+    def _parse_indented_code(self, lines: list[_Line], i: int, blocks: list) -> int:
+        j: int = i
+        end: int = i
+        while j < len(lines):
+            text: str = lines[j].text
+            if _is_blank(text):
+                j += 1
+                continue
+            if _get_indent(text)[0] < 4:
+                break
+            j += 1
+            end = j
+
+        codes: list[str] = [_strip_indent(line, 4).text for line in lines[i:end]]
+        blocks.append(
+            self._block(
+                {"t": "CodeBlock", "c": [["", [], []], "\n".join(codes)]},
+                lines[i],
+                lines[end - 1],
+            )
+        )
+
+        return end
+
+    def _parse_block_quote(self, lines: list[_Line], i: int, blocks: list) -> int:
+        contents: list[_Line] = []
+
+        j: int = i
+        while j < len(lines):
+            line: _Line = lines[j]
+            m = _QUOTE_RE_.match(line.text)
+            if m is not None:
+                contents.append(_Line(line.ln, line.col + m.end(), line.text[m.end() :]))
+            elif (
+                not _is_blank(line.text)
+                and not _is_blank(contents[-1].text)
+                and not _can_interrupt_paragraph(line.text)
+            ):
+                # lazy continuation line
+                contents.append(line)
+            else:
+                break
+            j += 1
+
+        children, _ = self._parse_blocks(contents)
+        blocks.append(
+            self._block({"t": "BlockQuote", "c": children}, lines[i], lines[j - 1])
+        )
+
+        return j
+
+    def _parse_list(self, lines: list[_Line], i: int, blocks: list) -> int:
+        first = _get_list_marker(lines[i].text)
+        assert first is not None
+        kind, _, start_num = first
+
+        items: list[list] = []
+        loose: bool = False
+        end: int = i
+
+        j: int = i
+        while j < len(lines):
+            marker = _get_list_marker(lines[j].text)
+            if (marker is None) or (marker[0] != kind) or _HR_RE_.match(lines[j].text):
+                break
+            if end < j:
+                # blank lines between items
+                loose = True
+
+            contents: list[_Line]
+            contents, end = self._get_list_item(lines, j, marker[1])
+            children, item_loose = self._parse_blocks(contents)
+            items.append(children)
+            loose = loose or item_loose
+
+            j = end
+            while (j < len(lines)) and _is_blank(lines[j].text):
+                j += 1
+
+        if not loose:
+            for children in items:
+                for child in children:
+                    _set_plain(child)
+
+        elem: dict
+        if kind[0] == "bullet":
+            elem = {"t": "BulletList", "c": items}
+        else:
+            delim: str = "Period" if kind[1] == "." else "OneParen"
+            elem = {
+                "t": "OrderedList",
+                "c": [[start_num, {"t": "Decimal"}, {"t": delim}], items],
+            }
+
+        blocks.append(self._block(elem, lines[i], lines[end - 1]))
+
+        return end
+
+    def _get_list_item(
+        self, lines: list[_Line], i: int, marker_end: int
+    ) -> tuple[list[_Line], int]:
+        """
+        @return tuple[list[_Line], int] : Lines of the item without the marker and
+                                          the indentation, and the index of the line
+                                          next to the last non-blank line of the item.
+        """
+        line: _Line = lines[i]
+        rest: str = line.text[marker_end:]
+        spaces, nchars = _get_indent(rest)
+
+        width: int
+        if _is_blank(rest):
+            width = marker_end + 1
+            nchars = len(rest)
+        elif spaces > 4:
+            # The content starts with an indented code block.
+            width = marker_end + 1
+            nchars = 1
+        else:
+            width = marker_end + spaces
+
+        contents: list[_Line] = [
+            _Line(line.ln, line.col + marker_end + nchars, rest[nchars:])
+        ]
+        end: int = i + 1
+
+        j: int = i + 1
+        while j < len(lines):
+            text: str = lines[j].text
+            if _is_blank(text):
+                if _is_blank(contents[0].text) and (len(contents) == 1):
+                    # An item can begin with at most one blank line.
+                    break
+                contents.append(_Line(lines[j].ln, lines[j].col, ""))
+            elif _get_indent(text)[0] >= width:
+                contents.append(_strip_indent(lines[j], width))
+                end = j + 1
+            elif (
+                not _is_blank(contents[-1].text)
+                and not _can_interrupt_paragraph(text)
+                and (_get_list_marker(text) is None)
+            ):
+                # lazy continuation line
+                contents.append(lines[j])
+                end = j + 1
+            else:
+                break
+            j += 1
+
+        return contents[: end - i], end
+
+    def _parse_html_block(self, lines: list[_Line], i: int, blocks: list) -> int:
+        end_re = _get_html_block(lines[i].text, False)
+        assert end_re is not None
+
+        j: int = i
+        while j < len(lines):
+            text: str = lines[j].text
+            if end_re is True:
+                if _is_blank(text):
+                    break
+            elif end_re.search(text):
+                j += 1
+                break
+            j += 1
+
+        source: str = "\n".join(line.text for line in lines[i:j]) + "\n"
+        blocks.append(
+            self._block({"t": "RawBlock", "c": ["html", source]}, lines[i], lines[j - 1])
+        )
+
+        return j
+
+    def _is_table_start(self, lines: list[_Line], i: int) -> bool:
+        if (i + 1 >= len(lines)) or ("|" not in lines[i].text):
+            return False
+
+        delimiter: _Line = lines[i + 1]
+        if ("|" not in delimiter.text) and ("-" not in delimiter.text):
+            return False
+
+        if _get_indent(lines[i].text)[0] >= 4:
+            return False
+
+        cells: list[_Line] = _split_row(delimiter)
+        if any(_TABLE_DELIMITER_RE_.match(cell.text) is None for cell in cells):
+            return False
+
+        if (len(cells) == 1) and ("|" not in delimiter.text):
+            return False
+
+        return len(cells) == len(_split_row(lines[i]))
+
+    def _parse_table(self, lines: list[_Line], i: int, blocks: list) -> int:
+        aligns: list[str] = []
+        for cell in _split_row(lines[i + 1]):
+            left: bool = cell.text.startswith(":")
+            right: bool = cell.text.endswith(":")
+            aligns.append(
+                "AlignCenter"
+                if left and right
+                else "AlignLeft"
+                if left
+                else "AlignRight"
+                if right
+                else "AlignDefault"
+            )
+
+        head: list = self._table_row(lines[i], len(aligns))
+        rows: list = []
+
+        j: int = i + 2
+        while j < len(lines):
+            text: str = lines[j].text
+            if _is_blank(text) or _can_interrupt_paragraph(text):
+                break
+            rows.append(self._table_row(lines[j], len(aligns)))
+            j += 1
+
+        null_attr: list = ["", [], []]
+        elem: dict = {
+            "t": "Table",
+            "c": [
+                ["", [], []],
+                [None, []],
+                [[{"t": align}, {"t": "ColWidthDefault"}] for align in aligns],
+                [null_attr, [head]],
+                [[null_attr, 0, [], rows]],
+                [null_attr, []],
+            ],
+        }
+        blocks.append(self._block(elem, lines[i], lines[j - 1]))
+
+        return j
+
+    def _table_row(self, line: _Line, ncols: int) -> list:
+        cells: list[_Line] = _split_row(line)[:ncols]
+        while len(cells) < ncols:
+            cells.append(_Line(line.ln, line.col + len(line.text), ""))
+
+        row: list = []
+        for cell in cells:
+            contents: list = []
+            if len(cell.text) > 0:
+                contents.append({"t": "Plain", "c": self._parse_inlines([cell])})
+            row.append([["", [], []], {"t": "AlignDefault"}, 1, 1, contents])
+
+        return [["", [], []], row]
+
+    def _block(self, elem: dict, first: _Line, last: _Line) -> dict:
+        """
+        adds 'data-pos' to the block element as pandoc does with 'sourcepos'.
+        Header, CodeBlock and Table have the attribute in themselves, and others
+        are wrapped in Div.
+        """
+        if not self._sourcepos:
+            return elem
+
+        col: int = first.col + _get_indent(first.text)[1]
+        pos: list[str] = ["data-pos", self._get_pos(first.ln, col, last.ln + 1, 1)]
+
+        if elem["t"] in ("Header", "CodeBlock", "Table"):
+            attr: list = elem["c"][1] if elem["t"] == "Header" else elem["c"][0]
+            attr[2].append(pos)
+            return elem
+
+        return {"t": "Div", "c": [["", [], [pos]], [elem]]}
+
+    def _get_identifier(self, text: str) -> str:
+        """
+        returns unique identifier of the header as 'gfm_auto_identifiers' does.
+        """
+        base: str = "".join(
+            c for c in text.lower() if c.isalnum() or c in ("_", "-", " ")
+        ).replace(" ", "-")
+        base = base or "section"
+
+        identifier: str = base
+        count: int = self._identifiers.get(base, 0)
+        while identifier in self._identifiers:
+            count += 1
+            identifier = f"{base}-{count}"
+
+        self._identifiers[base] = count
+        self._identifiers[identifier] = 0
+
+        return identifier
+
+    def _get_pos(self, sl: int, sc: int, el: int, ec: int) -> str:
+        pos: str = f"{sl}:{sc}-{el}:{ec}"
+        return f"{self._path}@{pos}" if self._path else pos
+
+    #
+    # Inlines
+    #
+    def _parse_inlines(self, lines: list[_Line]) -> list:
+        return _InlineParser(self, lines).parse()
+
+
+class _InlineParser:
+    """
+    Inline parser for the contents of one block.
+
+    Nodes are dicts with the keys:
+    - "k" : kind of the node
+    - "s", "e" : start and end(exclusive) index of the node in `_text`
+    and other keys for each kind.
+    """
+
+    _parser: _Parser
+    _text: str
+    _lns: list[int]
+    _cols: list[int]
+    _nodes: list[dict]
+    _delims: list[dict]
+    _brackets: list[dict]
+
+    def __init__(self, parser: _Parser, lines: list[_Line]):
+        self._parser = parser
+
+        texts: list[str] = []
+        self._lns = []
+        self._cols = []
+        for n, line in enumerate(lines):
+            text: str = line.text
+            nchars: int = len(text) - len(text.lstrip(" \t"))
+            text = text[nchars:]
+            if n == len(lines) - 1:
+                text = text.rstrip(" \t")
+            else:
+                text += "\n"
+            texts.append(text)
+            self._lns += [line.ln] * len(text)
+            self._cols += range(line.col + nchars, line.col + nchars + len(text))
+
+        self._text = "".join(texts)
+        self._nodes = []
+        self._delims = []
+        self._brackets = []
+
+    def parse(self) -> list:
+        text: str = self._text
+        i: int = 0
+        while i < len(text):
+            c: str = text[i]
+
+            if c == "\\":
+                i = self._parse_backslash(i)
+            elif c == "`":
+                i = self._parse_code(i)
+            elif c == "<":
+                i = self._parse_angle_bracket(i)
+            elif c == "&":
+                i = self._parse_entity(i)
+            elif c in "*_~":
+                i = self._parse_delimiter_run(i)
+            elif (c == "[") or text.startswith("![", i):
+                n: int = 1 if c == "[" else 2
+                node: dict = {"k": "bracket", "s": i, "e": i + n, "active": True}
+                node["bottom"] = len(self._delims)
+                self._nodes.append(node)
+                self._brackets.append(node)
+                i += n
+            elif c == "]":
+                i = self._parse_closing_bracket(i)
+            elif c in " \t\n":
+                i = self._parse_whitespace(i)
+            else:
+                m = _TEXT_RE_.match(text, i)
+                assert m is not None
+                self._add_str(m.group(), i, m.end())
+                i = m.end()
+
+        self._process_emphasis(0)
+
+        return self._to_json(self._nodes)
+
+    def _add_str(self, text: str, start: int, end: int) -> None:
+        self._nodes.append({"k": "Str", "s": start, "e": end, "text": text})
+
+    def _parse_backslash(self, i: int) -> int:
+        next_c: str = self._text[i + 1 : i + 2]
+
+        if next_c == "\n":
+            self._nodes.append({"k": "LineBreak", "s": i, "e": i + 1})
+            return i + 2
+
+        if (next_c != "") and (next_c in _ASCII_PUNCTUATION_):
+            self._add_str(next_c, i, i + 2)
+            return i + 2
+
+        self._add_str("\\", i, i + 1)
+        return i + 1
+
+    def _parse_code(self, i: int) -> int:
+        text: str = self._text
+        j: int = i
+        while (j < len(text)) and (text[j] == "`"):
+            j += 1
+        ticks: str = text[i:j]
+
+        m = re.compile(rf"(?<!`){ticks}(?!`)").search(text, j)
+        if m is None:
+            self._add_str(ticks, i, j)
+            return j
+
+        code: str = text[j : m.start()].replace("\n", " ")
+        if (len(code) > 2) and (code[0] == code[-1] == " ") and code.strip(" "):
+            code = code[1:-1]
+
+        self._nodes.append({"k": "Code", "s": i, "e": m.end(), "text": code})
+
+        return m.end()
+
+    def _parse_angle_bracket(self, i: int) -> int:
+        text: str = self._text
+
+        m = _URI_AUTOLINK_RE_.match(text, i)
+        if m is not None:
+            self._add_autolink(m.group(1), m.group(1), "uri", i, m.end())
+            return m.end()
+
+        m = _EMAIL_AUTOLINK_RE_.match(text, i)
+        if m is not None:
+            self._add_autolink(m.group(1), "mailto:" + m.group(1), "email", i, m.end())
+            return m.end()
+
+        m = _RAW_HTML_RE_.match(text, i)
+        if m is not None:
+            self._nodes.append(
+                {"k": "RawInline", "s": i, "e": m.end(), "text": m.group()}
+            )
+            return m.end()
+
+        self._add_str("<", i, i + 1)
+        return i + 1
+
+    def _add_autolink(self, label: str, url: str, cls: str, start: int, end: int):
+        child: dict = {"k": "Str", "s": start + 1, "e": end - 1, "text": label}
+        self._nodes.append(
+            {
+                "k": "Link",
+                "s": start,
+                "e": end,
+                "children": [child],
+                "target": [url, ""],
+                "classes": [cls],
+            }
+        )
+
+    def _parse_entity(self, i: int) -> int:
+        m = _ENTITY_RE_.match(self._text, i)
+        if m is None:
+            self._add_str("&", i, i + 1)
+            return i + 1
+
+        self._add_str(html.unescape(m.group()), i, m.end())
+        return m.end()
+
+    def _parse_delimiter_run(self, i: int) -> int:
+        text: str = self._text
+        c: str = text[i]
+        j: int = i
+        while (j < len(text)) and (text[j] == c):
+            j += 1
+
+        before: str = text[i - 1] if i > 0 else "\n"
+        after: str = text[j] if j < len(text) else "\n"
+        before_space, before_punct = before.isspace(), _is_punctuation(before)
+        after_space, after_punct = after.isspace(), _is_punctuation(after)
+
+        left: bool = not after_space and (not after_punct or before_space or before_punct)
+        right: bool = not before_space and (
+            not before_punct or after_space or after_punct
+        )
+
+        can_open: bool = left
+        can_close: bool = right
+        if c == "_":
+            can_open = left and (not right or before_punct)
+            can_close = right and (not left or after_punct)
+        elif c == "~" and (j - i) > 2:
+            can_open = can_close = False
+
+        node: dict = {
+            "k": "delim",
+            "s": i,
+            "e": j,
+            "char": c,
+            "count": j - i,
+            "can_open": can_open,
+            "can_close": can_close,
+        }
+        self._nodes.append(node)
+        if can_open or can_close:
+            self._delims.append(node)
+
+        return j
+
+    def _parse_closing_bracket(self, i: int) -> int:
+        if len(self._brackets) == 0:
+            self._add_str("]", i, i + 1)
+            return i + 1
+
+        opener: dict = self._brackets.pop()
+        m = _LINK_TAIL_RE_.match(self._text, i + 1) if opener["active"] else None
+        if m is None:
+            self._add_str("]", i, i + 1)
+            return i + 1
+
+        url: str = m.group(1)
+        if url.startswith("<"):
+            url = url[1:-1]
+        title: str = m.group(2)[1:-1] if m.group(2) else ""
+
+        self._process_emphasis(opener["bottom"])
+
+        index: int = _index(self._nodes, opener)
+        children: list[dict] = self._nodes[index + 1 :]
+        del self._nodes[index:]
+
+        image: bool = opener["e"] - opener["s"] == 2
+        self._nodes.append(
+            {
+                "k": "Image" if image else "Link",
+                "s": opener["s"],
+                "e": m.end(),
+                "children": children,
+                "target": [_unescape(url), _unescape(title)],
+                "classes": [],
+            }
+        )
+
+        if not image:
+            # Links may not contain other links.
+            for bracket in self._brackets:
+                if bracket["e"] - bracket["s"] == 1:
+                    bracket["active"] = False
+
+        return m.end()
+
+    def _parse_whitespace(self, i: int) -> int:
+        text: str = self._text
+        j: int = i
+        while (j < len(text)) and (text[j] in " \t"):
+            j += 1
+
+        if (j < len(text)) and (text[j] == "\n"):
+            if (j - i >= 2) and (text[i:j].strip(" ") == ""):
+                self._nodes.append({"k": "LineBreak", "s": i, "e": j})
+            else:
+                self._nodes.append({"k": "SoftBreak", "s": j, "e": j + 1})
+            return j + 1
+
+        self._nodes.append({"k": "Space", "s": i, "e": j})
+        return j
+
+    def _process_emphasis(self, bottom: int) -> None:
+        """
+        processes the delimiter stack above `bottom`.
+        See 'process emphasis' in the CommonMark spec.
+        """
+        delims: list[dict] = self._delims
+        nodes: list[dict] = self._nodes
+
+        ci: int = bottom
+        while ci < len(delims):
+            closer: dict = delims[ci]
+            if not closer["can_close"]:
+                ci += 1
+                continue
+
+            oi: int = ci - 1
+            while oi >= bottom:
+                opener: dict = delims[oi]
+                if (opener["char"] == closer["char"]) and opener["can_open"]:
+                    if closer["char"] == "~":
+                        if opener["count"] == closer["count"]:
+                            break
+                    elif not (
+                        (closer["can_open"] or opener["can_close"])
+                        and ((opener["count"] + closer["count"]) % 3 == 0)
+                        and not (opener["count"] % 3 == 0 and closer["count"] % 3 == 0)
+                    ):
+                        break
+                oi -= 1
+
+            if oi < bottom:
+                if closer["can_open"]:
+                    ci += 1
+                else:
+                    del delims[ci]
+                continue
+
+            opener = delims[oi]
+            use: int
+            kind: str
+            if closer["char"] == "~":
+                use, kind = closer["count"], "Strikeout"
+            elif (opener["count"] >= 2) and (closer["count"] >= 2):
+                use, kind = 2, "Strong"
+            else:
+                use, kind = 1, "Emph"
+
+            oindex: int = _index(nodes, opener)
+            cindex: int = _index(nodes, closer)
+            node: dict = {
+                "k": kind,
+                "s": opener["e"] - use,
+                "e": closer["s"] + use,
+                "children": nodes[oindex + 1 : cindex],
+            }
+            nodes[oindex + 1 : cindex] = [node]
+
+            opener["count"] -= use
+            opener["e"] -= use
+            closer["count"] -= use
+            closer["s"] += use
+
+            del delims[oi + 1 : ci]
+            ci = oi + 1
+
+            if opener["count"] == 0:
+                del nodes[oindex]
+                del delims[oi]
+                ci -= 1
+
+            if closer["count"] == 0:
+                del nodes[_index(nodes, closer)]
+                del delims[ci]
+
+        del delims[bottom:]
+
+    def _to_json(self, nodes: list[dict]) -> list:
+        sourcepos: bool = self._parser._sourcepos
+        inlines: list = []
+
+        for node in nodes:
+            kind: str = node["k"]
+            pos: str = self._get_pos(node) if kind != "SoftBreak" else ""
+
+            if kind in ("delim", "bracket"):
+                kind = "Str"
+                node["text"] = self._text[node["s"] : node["e"]]
+
+            elem: dict
+            if kind == "Str":
+                if not sourcepos and (len(inlines) > 0) and (inlines[-1]["t"] == "Str"):
+                    inlines[-1]["c"] += node["text"]
+                    continue
+                elem = {"t": "Str", "c": node["text"]}
+            elif kind in ("Space", "SoftBreak", "LineBreak"):
+                if (
+                    not sourcepos
+                    and (kind != "Space")
+                    and (len(inlines) > 0)
+                    and (inlines[-1]["t"] == "Space")
+                ):
+                    # pandoc drops the space before line breaks when Spans of
+                    # 'sourcepos' don't separate them.
+                    inlines.pop()
+                elem = {"t": kind}
+            elif kind == "RawInline":
+                elem = {"t": kind, "c": ["html", node["text"]]}
+            elif kind in ("Emph", "Strong", "Strikeout"):
+                elem = {"t": kind, "c": self._to_json(node["children"])}
+            elif kind == "Code":
+                inlines.append({"t": kind, "c": [self._attr(pos), node["text"]]})
+                continue
+            else:  # Link, Image
+                attr: list = self._attr(pos)
+                attr[1] = node["classes"]
+                children: list = self._to_json(node["children"])
+                inlines.append({"t": kind, "c": [attr, children, node["target"]]})
+                continue
+
+            if sourcepos:
+                elem = {"t": "Span", "c": [self._attr(pos), [elem]]}
+            inlines.append(elem)
+
+        return inlines
+
+    def _attr(self, pos: str) -> list:
+        if not self._parser._sourcepos:
+            return ["", [], []]
+        return ["", [], [["data-pos", pos]]]
+
+    def _get_pos(self, node: dict) -> str:
+        start: int = node["s"]
+        last: int = node["e"] - 1
+        return self._parser._get_pos(
+            self._lns[start], self._cols[start], self._lns[last], self._cols[last] + 1
+        )
+
+
+#
+# Helper functions
+#
+def _is_blank(text: str) -> bool:
+    return text.strip(" \t") == ""
+
+
+def _get_indent(text: str) -> tuple[int, int]:
+    """
+    @return tuple[int, int] : Width(a tab stops at multiples of 4) and the number
+                              of characters of the leading white spaces.
+    """
+    width: int = 0
+    for n, c in enumerate(text):
+        if c == " ":
+            width += 1
+        elif c == "\t":
+            width += 4 - (width % 4)
+        else:
+            return width, n
+
+    return width, len(text)
+
+
+def _strip_indent(line: _Line, width: int) -> _Line:
+    stripped: int = 0
+    n: int = 0
+    while (n < len(line.text)) and (stripped < width) and (line.text[n] in " \t"):
+        stripped += 1 if line.text[n] == " " else 4 - (stripped % 4)
+        n += 1
+
+    return _Line(line.ln, line.col + n, line.text[n:])
+
+
+def _get_fence(text: str) -> tuple[int, str, str] | None:
+    """
+    @return tuple[int, str, str] | None : Indent, fence marker and info string.
+    """
+    m = _FENCE_RE_.match(text)
+    if (m is None) or ((m.group(2)[0] == "`") and ("`" in m.group(3))):
+        return None
+    return len(m.group(1)), m.group(2), m.group(3)
+
+
+def _get_list_marker(text: str) -> tuple[tuple[str, str], int, int] | None:
+    """
+    @return tuple[tuple[str, str], int, int] | None :
+            Kind of the list, index of the end of the marker and the start number.
+    """
+    m = _BULLET_RE_.match(text)
+    if m is not None:
+        return ("bullet", m.group(1)), m.end(), 1
+
+    m = _ORDERED_RE_.match(text)
+    if m is not None:
+        return ("ordered", m.group(2)), m.end(), int(m.group(1))
+
+    return None
+
+
+def _get_html_block(text: str, in_paragraph: bool):
+    """
+    @return re.Pattern | True | None : Pattern of the end line of the html block,
+                                       True if it ends at a blank line, or None if
+                                       the line doesn't start an html block.
+    """
+    for start_re, end_re, interrupt in _HTML_BLOCK_START_:
+        if (not in_paragraph or interrupt) and start_re.match(text):
+            return end_re if end_re is not None else True
+
+    return None
+
+
+def _can_interrupt_paragraph(text: str) -> bool:
+    if _get_indent(text)[0] >= 4:
+        return False
+
+    if (
+        (_get_fence(text) is not None)
+        or _ATX_RE_.match(text)
+        or _HR_RE_.match(text)
+        or _QUOTE_RE_.match(text)
+        or (_get_html_block(text, True) is not None)
+    ):
+        return True
+
+    marker = _get_list_marker(text)
+    return (
+        (marker is not None)
+        and not _is_blank(text[marker[1] :])
+        and ((marker[0][0] == "bullet") or (marker[2] == 1))
+    )
+
+
+def _split_row(line: _Line) -> list[_Line]:
+    """
+    splits a row of pipe table into cells with their columns.
+    """
+    text: str = line.text
+    cells: list[_Line] = []
+
+    n: int = _get_indent(text)[1]
+    if text[n : n + 1] == "|":
+        n += 1
+
+    start: int = n
+    while n <= len(text):
+        if (n == len(text)) or (text[n] == "|"):
+            cell: str = text[start:n]
+            nchars: int = len(cell) - len(cell.lstrip())
+            if (n < len(text)) or (cell.strip() != ""):
+                cells.append(_Line(line.ln, line.col + start + nchars, cell.strip()))
+            start = n + 1
+        elif text[n] == "\\":
+            n += 1
+        n += 1
+
+    return cells
+
+
+def _set_plain(block: dict) -> None:
+    """
+    changes Para in a tight list into Plain.
+    """
+    if block["t"] == "Div":
+        block = block["c"][1][0]
+    if block["t"] == "Para":
+        block["t"] = "Plain"
+
+
+def _is_punctuation(c: str) -> bool:
+    return (c in _ASCII_PUNCTUATION_) or (unicodedata.category(c)[0] in ("P", "S"))
+
+
+def _unescape(text: str) -> str:
+    return html.unescape(_ESCAPED_RE_.sub(r"\1", text))
+
+
+def _index(nodes: list[dict], node: dict) -> int:
+    for i in range(len(nodes) - 1, -1, -1):
+        if nodes[i] is node:
+            return i
+    raise ValueError("node is not found")
+
+
+def _stringify(inlines: list) -> str:
+    texts: list[str] = []
+    stack: list = list(reversed(inlines))
+    while stack:
+        elem: dict = stack.pop()
+        t: str = elem["t"]
+        if t == "Str":
+            texts.append(elem["c"])
+        elif t in ("Space", "SoftBreak", "LineBreak"):
+            texts.append(" ")
+        elif t == "Code":
+            texts.append(elem["c"][1])
+        elif t in ("Span", "Link", "Image"):
+            stack += reversed(elem["c"][1])
+        elif t in ("Emph", "Strong", "Strikeout"):
+            stack += reversed(elem["c"])
+
+    return "".join(texts)
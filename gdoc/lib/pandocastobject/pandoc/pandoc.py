@@ -1,9 +1,17 @@
 r"""
 Pandoc class
 """
-import json
+import asyncio
 import subprocess
+import tempfile
+import threading
 from logging import getLogger
+from typing import IO, cast
+
+from . import jsonbackend
+from .capabilities import PandocCapabilities, get_capabilities
+from .pandocserver import PandocServer
+from .rawhtml import interpret_raw_html
 
 logger = getLogger(__name__)
 
@@ -14,62 +22,71 @@ class Pandoc:
     to generate PandocAST json object.
     """
 
-    _version: dict[str, list[int | str]] | None
-    _version_str: str | None
     _pandoc_command: str
+    _server: PandocServer | None
+    _cache_dir: str | None
 
-    def __init__(self, pandoc_command: str = "pandoc"):
-        self._version = None
-        self._version_str = None
+    def __init__(
+        self,
+        pandoc_command: str = "pandoc",
+        server: PandocServer | None = None,
+        cache_dir: str | None = None,
+    ):
+        """
+        @param pandoc_command (str, optional) : pandoc command. Defaults to "pandoc".
+        @param server (PandocServer | None, optional) : If given, documents are
+                converted by the server instead of a new pandoc process.
+                Defaults to None.
+        @param cache_dir (str | None, optional) : Directory to persist capabilities
+                of pandoc in. None means they are not persisted.
+                Defaults to None.
+        """
         self._pandoc_command = pandoc_command
+        self._server = server
+        self._cache_dir = cache_dir
 
-    def _run(
-        self, commandlines: list[list[str]], stdin=None
-    ) -> tuple[list[int], str, list[str]]:
-        """run multiple subcommands
-        run multiple subcommands while connecting them with pipes and return results.
+    def _run_json(self, commandline: list[str], stdin: str | None = None):
+        """
+        runs pandoc and returns its json output as a json object.
 
-        @param commandlines (list[list[str]]) : _description_
-        @param stdin (_type_, optional) : _description_. Defaults to None.
+        The output is read as bytes and parsed by `jsonbackend` without decoding
+        it into a str, so no full text copy of the output is made.
 
-        @return tuple[list[int], str, list[str]] : _description_
+        @param commandline (list[str]) : pandoc command line with '-t json'.
+        @param stdin (str | None, optional) : Data passed to stdin. Defaults to None.
+        @exception ValueError : pandoc didn't output valid json.
         """
-        retcode: list[int] = []
-        stderr: list[str] = []
-        output: str = ""
-
-        input: str | None = None
-        pipe = None
-        if type(stdin) is str:
-            input = stdin
-            pipe = subprocess.PIPE
-        else:
-            pipe = stdin
-
-        with subprocess.Popen(
-            commandlines[0],
-            stdin=pipe,
+        output: bytes
+        with tempfile.TemporaryFile() as stderr, subprocess.Popen(
+            commandline,
+            stdin=subprocess.DEVNULL if stdin is None else subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding="utf-8",
+            stderr=stderr,
         ) as ps:
-            serr: str
-
-            if len(commandlines) > 1:
-                if input is not None and ps.stdin is not None:
-                    ps.stdin.write(input)
-                    ps.stdin.flush()
-                    ps.stdin.close()
-                    ps.stdin = None
-                retcode, output, stderr = self._run(commandlines[1:], stdin=ps.stdout)
-                _, serr = ps.communicate()
-            else:
-                output, serr = ps.communicate(input)
+            # stdin is written by another thread so that pandoc never blocks on
+            # writing stdout while we are writing stdin.
+            writer: threading.Thread | None = None
+            if (stdin is not None) and (ps.stdin is not None):
+                writer = threading.Thread(
+                    target=_write_stdin, args=(ps.stdin, stdin.encode("utf-8"))
+                )
+                writer.start()
+
+            output = cast(IO[bytes], ps.stdout).read()
+
+            if writer is not None:
+                writer.join()
+            ps.wait()
 
-            stderr.insert(0, serr)
-            retcode.insert(0, ps.returncode)
+            if ps.returncode != 0:
+                stderr.seek(0)
+                logger.warning(
+                    "pandoc exited with %s: %s",
+                    ps.returncode,
+                    stderr.read().decode("utf-8", "replace"),
+                )
 
-        return retcode, output, stderr
+        return jsonbackend.loads(output)
 
     def get_json(
         self,
@@ -91,20 +108,98 @@ class Pandoc:
         @return output : { PandocAst Object }
             Pandoc AST json object generated by pandoc from source document.
         """
-        _SOURCEPOS_ = ["gfm", "commonmark", "commonmark_x"]
+        fileformat, via_html = _get_format(filepath, fileformat, via_html)
 
-        filename: list[str] = filepath.rsplit("/", 1)[-1].rsplit(".", 1)
-        file_ext: str = filename[-1] if len(filename) > 1 else ""
+        if self._use_server(fileformat):
+            try:
+                return self._get_json_from_server(
+                    filepath, cast(str, fileformat), via_html, filedata
+                )
+            except RuntimeError as e:
+                logger.warning("%s: run pandoc without the server", e)
 
-        if (fileformat is None) and (file_ext == "md"):
-            fileformat = "gfm+sourcepos"
-            via_html = False if via_html is None else via_html
-        else:
-            if fileformat in _SOURCEPOS_:
-                fileformat += "+sourcepos"
-            via_html = False if via_html is None else via_html
+        json_object = self._run_json(
+            self._get_command(filepath, fileformat, filedata), filedata
+        )
 
-        commands: list[list[str]] = []
+        if via_html:
+            # Interpret html tags in the process instead of converting the
+            # document to html and back with another pandoc process.
+            interpret_raw_html(json_object)
+
+        return json_object
+
+    async def get_json_async(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+        """
+        async version of `get_json()`.
+
+        pandoc runs as an asyncio subprocess, and it is killed when the task
+        is cancelled, e.g. when a newer version of the document has arrived.
+        With the server, the connection of the request is closed instead.
+        """
+        fileformat, via_html = _get_format(filepath, fileformat, via_html)
+
+        if self._use_server(fileformat):
+            try:
+                server: PandocServer = cast(PandocServer, self._server)
+                output: bytes = await server.convert_to_bytes_async(
+                    _read_text(filepath, filedata), cast(str, fileformat), "json"
+                )
+                return _load_server_output(output, filepath, via_html, filedata)
+            except RuntimeError as e:
+                logger.warning("%s: run pandoc without the server", e)
+
+        ps = await asyncio.create_subprocess_exec(
+            *self._get_command(filepath, fileformat, filedata),
+            stdin=asyncio.subprocess.DEVNULL
+            if filedata is None
+            else asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        output: bytes
+        errors: bytes
+        try:
+            output, errors = await ps.communicate(
+                None if filedata is None else filedata.encode("utf-8")
+            )
+        except asyncio.CancelledError:
+            if ps.returncode is None:
+                ps.kill()
+                await ps.wait()
+            raise
+
+        if ps.returncode != 0:
+            logger.warning(
+                "pandoc exited with %s: %s",
+                ps.returncode,
+                errors.decode("utf-8", "replace"),
+            )
+
+        json_object = jsonbackend.loads(output)
+
+        if via_html:
+            interpret_raw_html(json_object)
+
+        return json_object
+
+    def _use_server(self, fileformat: str | None) -> bool:
+        return (
+            (self._server is not None)
+            and (fileformat is not None)
+            and self._server.is_available()
+        )
+
+    def _get_command(
+        self, filepath: str, fileformat: str | None, filedata: str | None
+    ) -> list[str]:
         cmd: list[str] = [self._pandoc_command]
         if filedata is None:
             cmd.append(filepath)
@@ -112,19 +207,23 @@ class Pandoc:
         if fileformat is not None:
             cmd += ["-f", fileformat]
 
-        if not via_html:
-            cmd += ["-t", "json"]
-            commands.append(cmd)
-        else:
-            cmd += ["-t", "html"]
-            commands.append(cmd)
-            commands.append(
-                [self._pandoc_command, "-f", "html", "-t", "json"],
-            )
+        cmd += ["-t", "json"]
 
-        json_object = json.loads(self._run(commands, filedata)[1])
+        return cmd
 
-        return json_object
+    def _get_json_from_server(
+        self,
+        filepath: str,
+        fileformat: str,
+        via_html: bool | None,
+        filedata: str | None,
+    ):
+        server: PandocServer = cast(PandocServer, self._server)
+        output: bytes = server.convert_to_bytes(
+            _read_text(filepath, filedata), fileformat, "json"
+        )
+
+        return _load_server_output(output, filepath, via_html, filedata)
 
     def get_version(self) -> dict[str, list[int | str]] | None:
         """
@@ -135,28 +234,92 @@ class Pandoc:
             }
             version information obtained by 'pandoc --version'
         """
-        if self._version is not None:
-            return self._version
-
-        stdout: str
-        retcode: list[int]
-        retcode, stdout, _ = self._run([[self._pandoc_command, "--version"]])
-
-        version: dict[str, list[int | str]] = {}
-        lines: list[str] = stdout.split("\n")
-        line: str
-        for line in lines:
-            words: list[str] = line.replace(",", " ").split()
-            for i, word in enumerate(words):
-                if (word in ("pandoc", "pandoc-types")) and (i < len(words) - 1):
-                    vers: list[str] = words[i + 1].split(".")
-                    if not vers[0].isdecimal():
-                        break
-                    version[word] = [
-                        (int(ver) if ver.isdecimal() else ver) for ver in vers
-                    ]
-
-        self._version = version
-        self._version_str = stdout
-
-        return self._version
+        return self.get_capabilities().version
+
+    def get_capabilities(self) -> PandocCapabilities:
+        """
+        returns capabilities of the pandoc command.
+
+        They are shared in the process and persisted in the cache directory,
+        so pandoc is not run again until the binary is updated.
+        """
+        return get_capabilities(self._pandoc_command, self._cache_dir)
+
+
+def _get_format(
+    filepath: str, fileformat: str | None, via_html: bool | None
+) -> tuple[str | None, bool]:
+    """
+    returns the input format for pandoc and the flag of via_html with defaults.
+    """
+    _SOURCEPOS_ = ["gfm", "commonmark", "commonmark_x"]
+
+    filename: list[str] = filepath.rsplit("/", 1)[-1].rsplit(".", 1)
+    file_ext: str = filename[-1] if len(filename) > 1 else ""
+
+    if (fileformat is None) and (file_ext == "md"):
+        fileformat = "gfm+sourcepos"
+    elif fileformat in _SOURCEPOS_:
+        fileformat += "+sourcepos"
+
+    return fileformat, False if via_html is None else via_html
+
+
+def _read_text(filepath: str, filedata: str | None) -> str:
+    """
+    returns the text to be sent to the server.
+    """
+    if filedata is not None:
+        return filedata
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _load_server_output(
+    output: bytes, filepath: str, via_html: bool | None, filedata: str | None
+):
+    """
+    loads json output of the server as pandoc outputs it for the file.
+    """
+    json_object = jsonbackend.loads(output)
+
+    if filedata is None:
+        # The server reads the text without its file name.
+        # Add the path to 'data-pos' as pandoc does when it reads the file.
+        _set_source_path(json_object, filepath)
+
+    if via_html:
+        interpret_raw_html(json_object)
+
+    return json_object
+
+
+def _write_stdin(stdin: IO[bytes], data: bytes) -> None:
+    try:
+        stdin.write(data)
+        stdin.close()
+    except BrokenPipeError:
+        pass
+
+
+def _set_source_path(pan_elem, path: str) -> None:
+    """
+    adds `path@` to the values of 'data-pos'(or 'pos') attributes in the tree.
+    """
+    stack: list = [pan_elem]
+    while stack:
+        elem = stack.pop()
+        if type(elem) is dict:
+            stack += elem.values()
+
+        elif type(elem) is list:
+            if (
+                (len(elem) == 2)
+                and (elem[0] in ("data-pos", "pos"))
+                and (type(elem[1]) is str)
+            ):
+                if (len(elem[1]) > 0) and ("@" not in elem[1]):
+                    elem[1] = f"{path}@{elem[1]}"
+            else:
+                stack += elem
@@ -0,0 +1,310 @@
+r"""
+PandocServer class
+"""
+import asyncio
+import atexit
+import http.client
+import json
+import socket
+import subprocess
+import time
+from logging import getLogger
+from typing import ClassVar
+
+logger = getLogger(__name__)
+
+
+class PandocServer:
+    """
+    Long-lived `pandoc server` process shared by all conversions in this process.
+
+    Documents are converted through the HTTP API of the server instead of
+    spawning a new pandoc process for each of them. The server is started on
+    the first request and restarted when it has crashed.
+    """
+
+    _shared: ClassVar[dict[str, "PandocServer"]] = {}
+
+    _pandoc_command: str
+    _host: str
+    _port: int | None
+    _timeout: int
+    _process: subprocess.Popen | None
+    _owner: bool
+    _disabled: bool
+
+    def __init__(self, pandoc_command: str = "pandoc", timeout: int = 60):
+        """
+        @param pandoc_command (str, optional) : pandoc command. Defaults to "pandoc".
+        @param timeout (int, optional) : Timeout in seconds of each conversion.
+                                         Defaults to 60.
+        """
+        self._pandoc_command = pandoc_command
+        self._host = "127.0.0.1"
+        self._port = None
+        self._timeout = timeout
+        self._process = None
+        self._owner = True
+        self._disabled = False
+
+    @classmethod
+    def get_shared(cls, pandoc_command: str = "pandoc") -> "PandocServer":
+        """
+        returns the server instance shared in the process for the pandoc command.
+        """
+        if pandoc_command not in cls._shared:
+            if len(cls._shared) == 0:
+                atexit.register(cls._stop_shared)
+            cls._shared[pandoc_command] = cls(pandoc_command)
+
+        return cls._shared[pandoc_command]
+
+    @classmethod
+    def _stop_shared(cls) -> None:
+        for server in cls._shared.values():
+            server.stop()
+        cls._shared.clear()
+
+    def __getstate__(self) -> dict:
+        # Worker processes connect to the server started by the parent process,
+        # but they don't own(stop or restart) it.
+        state: dict = self.__dict__.copy()
+        state["_process"] = None
+        state["_owner"] = False
+        return state
+
+    def is_available(self) -> bool:
+        """
+        returns True if the server is running or can be started.
+        """
+        if self._disabled:
+            return False
+
+        if not self._owner:
+            return self._port is not None
+
+        if (self._process is not None) and (self._process.poll() is None):
+            return True
+
+        return self.start()
+
+    def is_alive(self) -> bool:
+        """
+        health check of the server.
+        """
+        if self._port is None:
+            return False
+
+        if self._owner and (
+            (self._process is None) or (self._process.poll() is not None)
+        ):
+            return False
+
+        try:
+            status, _ = self._request("GET", "/version", None, 2)
+        except (OSError, http.client.HTTPException):
+            return False
+
+        return status == 200
+
+    def start(self, wait: float = 10.0) -> bool:
+        """
+        starts the server process and waits until it gets ready.
+
+        @param wait (float, optional) : Maximum seconds to wait. Defaults to 10.0.
+        @return bool : True if the server has been started.
+        """
+        self.stop()
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((self._host, 0))
+            self._port = sock.getsockname()[1]
+
+        try:
+            self._process = subprocess.Popen(
+                [
+                    self._pandoc_command,
+                    "server",
+                    "--port",
+                    str(self._port),
+                    "--timeout",
+                    str(self._timeout),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning("failed to start pandoc server: %s", e)
+            self._disabled = True
+            return False
+
+        deadline: float = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                # e.g. pandoc < 3.0 doesn't have 'server' subcommand.
+                logger.warning("pandoc server exited with %s", self._process.returncode)
+                self._disabled = True
+                self._process = None
+                return False
+
+            if self.is_alive():
+                logger.debug("pandoc server started on port %s", self._port)
+                return True
+
+            time.sleep(0.05)
+
+        logger.warning("pandoc server did not get ready in %s sec", wait)
+        self.stop()
+        self._disabled = True
+        return False
+
+    def stop(self) -> None:
+        """
+        stops the server process.
+        """
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+
+    def convert(self, text: str, from_format: str, to_format: str) -> str:
+        """
+        converts text with the server.
+
+        @exception RuntimeError : The server is not available or failed to convert.
+        @return str : Converted text.
+        """
+        result: dict = json.loads(
+            self._convert(text, from_format, to_format, "application/json")
+        )
+        if result.get("base64"):
+            raise RuntimeError(f"unexpected binary output for '{to_format}'")
+
+        return result["output"]
+
+    def convert_to_bytes(self, text: str, from_format: str, to_format: str) -> bytes:
+        """
+        converts text with the server and returns the output as it is.
+        It's not wrapped in a json response, so json output can be parsed directly
+        from the bytes.
+
+        @exception RuntimeError : The server is not available or failed to convert.
+        @return bytes : Converted output in UTF-8.
+        """
+        return self._convert(text, from_format, to_format, "text/plain")
+
+    async def convert_to_bytes_async(
+        self, text: str, from_format: str, to_format: str
+    ) -> bytes:
+        """
+        async version of `convert_to_bytes()`.
+
+        The request is sent on an asyncio connection, which is closed when the task
+        is cancelled, so a cancelled conversion doesn't keep a thread waiting for
+        the output. The crashed server is not restarted here, but on the next check
+        of `is_available()`.
+
+        @exception RuntimeError : The server is not available or failed to convert.
+        @return bytes : Converted output in UTF-8.
+        """
+        body: dict = {"text": text, "from": from_format, "to": to_format}
+
+        status: int
+        data: bytes
+        try:
+            status, data = await asyncio.wait_for(
+                self._request_async(body, "text/plain"), self._timeout
+            )
+        except (OSError, EOFError, ValueError, IndexError) as e:
+            raise RuntimeError("pandoc server is not available") from e
+
+        if status != 200:
+            raise RuntimeError(f"pandoc server error: {data.decode('utf-8', 'replace')}")
+
+        return data
+
+    def _convert(self, text: str, from_format: str, to_format: str, accept: str) -> bytes:
+        body: dict = {"text": text, "from": from_format, "to": to_format}
+
+        status: int
+        data: bytes
+        try:
+            status, data = self._request("POST", "/", body, self._timeout, accept)
+        except (OSError, http.client.HTTPException) as e:
+            # Restart the crashed server and retry once.
+            logger.info("pandoc server is not responding: %s", e)
+            if not (self._owner and self.start()):
+                raise RuntimeError("pandoc server is not available") from e
+            try:
+                status, data = self._request("POST", "/", body, self._timeout, accept)
+            except (OSError, http.client.HTTPException) as e:
+                raise RuntimeError("pandoc server is not available") from e
+
+        if status != 200:
+            raise RuntimeError(f"pandoc server error: {data.decode('utf-8', 'replace')}")
+
+        return data
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: dict | None,
+        timeout: float,
+        accept: str = "application/json",
+    ) -> tuple[int, bytes]:
+        conn = http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+        try:
+            headers: dict[str, str] = {"Accept": accept}
+            payload: bytes | None = None
+            if body is not None:
+                headers["Content-Type"] = "application/json"
+                payload = json.dumps(body).encode("utf-8")
+
+            conn.request(method, path, payload, headers)
+            response = conn.getresponse()
+            return response.status, response.read()
+
+        finally:
+            conn.close()
+
+    async def _request_async(self, body: dict, accept: str) -> tuple[int, bytes]:
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        try:
+            payload: bytes = json.dumps(body).encode("utf-8")
+            # HTTP/1.0 not to get the output in chunks,
+            # which is sent until the server closes the connection.
+            writer.write(
+                (
+                    "POST / HTTP/1.0\r\n"
+                    f"Host: {self._host}:{self._port}\r\n"
+                    f"Accept: {accept}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "\r\n"
+                ).encode("ascii")
+                + payload
+            )
+            await writer.drain()
+
+            status: int = int((await reader.readline()).split()[1])
+            length: int | None = None
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+
+            data: bytes = (
+                await reader.read()
+                if length is None
+                else await reader.readexactly(length)
+            )
+            return status, data
+
+        finally:
+            writer.close()
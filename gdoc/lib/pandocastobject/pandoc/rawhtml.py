@@ -0,0 +1,312 @@
+r"""
+Interpreter of raw html elements in PandocAST json object
+"""
+import re
+from html.parser import HTMLParser
+
+_TAG_RE_ = re.compile(r"<(/?)([A-Za-z][A-Za-z0-9-]*)(\s[^>]*?)?\s*/?>$", re.S)
+_ATTR_RE_ = re.compile(
+    r"([A-Za-z_:][-\w.:]*)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s\"'=<>`]+))?"
+)
+_POS_KEYS_: tuple[str, str] = ("data-pos", "pos")
+
+# tag name -> type of the element
+_INLINE_TAGS_: dict[str, str] = {
+    "b": "Strong",
+    "strong": "Strong",
+    "i": "Emph",
+    "em": "Emph",
+    "s": "Strikeout",
+    "strike": "Strikeout",
+    "del": "Strikeout",
+    "u": "Underline",
+    "ins": "Underline",
+    "sub": "Subscript",
+    "sup": "Superscript",
+    "span": "Span",
+    "a": "Link",
+    "code": "Code",
+}
+
+_BLOCK_TAGS_: set[str] = {
+    "address", "article", "aside", "blockquote", "body", "caption", "dd", "details",
+    "div", "dl", "dt", "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "summary", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}  # fmt: skip
+
+
+def interpret_raw_html(pandoc_json):
+    """
+    interprets raw html elements in PandocAST json object in place, as converting
+    it to html and back(`pandoc -t html | pandoc -f html -t json`) does.
+
+    - `<br>` becomes LineBreak, and pairs of tags like `<b>` and `</b>` become
+      elements(Strong, etc.) containing the inlines between them.
+    - Other tags and comments are removed, and texts in raw html blocks become
+      Plain blocks.
+    - 'data-pos' attributes are renamed to 'pos' as the html reader does.
+
+    Spans and Divs of 'sourcepos' are kept, so positions of the elements are
+    preserved.
+
+    @return PandocAst json object : `pandoc_json` itself.
+    """
+    stack: list = [pandoc_json]
+    while stack:
+        elem = stack.pop()
+        if type(elem) is dict:
+            stack += elem.values()
+
+        elif type(elem) is list:
+            if (len(elem) == 2) and (elem[0] == "data-pos") and (type(elem[1]) is str):
+                elem[0] = "pos"
+                continue
+
+            raw_type: str | None = None
+            for child in elem:
+                raw_type = _get_raw_html(child)[0]
+                if raw_type is not None:
+                    break
+
+            if raw_type == "RawInline":
+                elem[:] = _interpret_inlines(elem)
+            elif raw_type == "RawBlock":
+                elem[:] = _interpret_blocks(elem)
+
+            stack += elem
+
+    return pandoc_json
+
+
+def _get_raw_html(elem) -> tuple[str | None, str, str | None]:
+    """
+    @return tuple[str | None, str, str | None] :
+            Type of the raw element, its html text and 'data-pos' of the Span or
+            Div wrapping it. Type is None if `elem` is not raw html.
+    """
+    if type(elem) is not dict:
+        return None, "", None
+
+    pos: str | None = None
+    if elem.get("t") in ("Span", "Div"):
+        attr, content = elem["c"]
+        if (
+            (len(content) != 1)
+            or (attr[0] != "")
+            or (len(attr[1]) > 0)
+            or (len(attr[2]) != 1)
+            or (attr[2][0][0] not in _POS_KEYS_)
+        ):
+            return None, "", None
+        pos = attr[2][0][1]
+        elem = content[0]
+
+    if (
+        (elem.get("t") in ("RawInline", "RawBlock"))
+        and (elem["c"][0] == "html")
+        and (type(elem["c"][1]) is str)
+    ):
+        return elem["t"], elem["c"][1], pos
+
+    return None, "", None
+
+
+def _interpret_inlines(inlines: list) -> list:
+    result: list = []
+    # (tag name, attributes, index in result, pos)
+    opened: list[tuple[str, dict[str, str], int, str | None]] = []
+
+    for elem in inlines:
+        raw_type, text, pos = _get_raw_html(elem)
+        if raw_type is None:
+            result.append(elem)
+            continue
+
+        m = _TAG_RE_.match(text)
+        if m is None:
+            # comments, etc.
+            continue
+
+        closing: bool = m.group(1) == "/"
+        name: str = m.group(2).lower()
+        attrs: dict[str, str] = _get_attrs(m.group(3) or "")
+
+        if name == "br":
+            result.append(_wrap({"t": "LineBreak"}, pos))
+
+        elif name == "img":
+            attr: list = _to_attr(attrs, ("src", "title", "alt"))
+            alt: list = [{"t": "Str", "c": attrs["alt"]}] if attrs.get("alt") else []
+            target: list = [attrs.get("src", ""), attrs.get("title", "")]
+            result.append(_set_pos({"t": "Image", "c": [attr, alt, target]}, pos))
+
+        elif name not in _INLINE_TAGS_:
+            continue
+
+        elif not closing:
+            opened.append((name, attrs, len(result), pos))
+
+        else:
+            for i in range(len(opened) - 1, -1, -1):
+                if opened[i][0] == name:
+                    break
+            else:
+                continue
+
+            _, attrs, index, start_pos = opened[i]
+            del opened[i:]
+
+            children: list = result[index:]
+            del result[index:]
+            result.append(
+                _create_inline(name, attrs, children, _join_pos(start_pos, pos))
+            )
+
+    return result
+
+
+def _create_inline(name: str, attrs: dict[str, str], children: list, pos: str | None):
+    elem_type: str = _INLINE_TAGS_[name]
+
+    if elem_type == "Span":
+        return _set_pos({"t": "Span", "c": [_to_attr(attrs), children]}, pos)
+
+    if elem_type == "Link":
+        attr: list = _to_attr(attrs, ("href", "title"))
+        target: list = [attrs.get("href", ""), attrs.get("title", "")]
+        return _set_pos({"t": "Link", "c": [attr, children, target]}, pos)
+
+    if elem_type == "Code":
+        return _set_pos({"t": "Code", "c": [_to_attr(attrs), _stringify(children)]}, pos)
+
+    return _wrap({"t": elem_type, "c": children}, pos)
+
+
+def _interpret_blocks(blocks: list) -> list:
+    result: list = []
+
+    for elem in blocks:
+        raw_type, text, pos = _get_raw_html(elem)
+        if raw_type is None:
+            result.append(elem)
+            continue
+
+        inlines: list = _html_to_inlines(text)
+        if len(inlines) > 0:
+            block: dict = {"t": "Plain", "c": inlines}
+            if pos is not None:
+                block = {"t": "Div", "c": [["", [], [["pos", pos]]], [block]]}
+            result.append(block)
+
+    return result
+
+
+class _TextParser(HTMLParser):
+    """
+    collects texts and line breaks in html.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.texts: list[str | None] = []  # None means LineBreak
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "br":
+            self.texts.append(None)
+        elif tag in _BLOCK_TAGS_:
+            self.texts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in _BLOCK_TAGS_:
+            self.texts.append(" ")
+
+    def handle_data(self, data):
+        self.texts.append(data)
+
+
+def _html_to_inlines(text: str) -> list:
+    parser = _TextParser()
+    parser.feed(text)
+    parser.close()
+
+    inlines: list = []
+    for data in parser.texts:
+        if data is None:
+            inlines.append({"t": "LineBreak"})
+            continue
+        for word in re.split(r"(\s+)", data):
+            if word == "":
+                continue
+            if not word.isspace():
+                inlines.append({"t": "Str", "c": word})
+            elif (len(inlines) > 0) and (inlines[-1]["t"] not in ("Space", "SoftBreak")):
+                inlines.append({"t": "SoftBreak" if "\n" in word else "Space"})
+
+    while (len(inlines) > 0) and (inlines[-1]["t"] in ("Space", "SoftBreak")):
+        inlines.pop()
+
+    return inlines
+
+
+def _get_attrs(text: str) -> dict[str, str]:
+    attrs: dict[str, str] = {}
+    for m in _ATTR_RE_.finditer(text):
+        value: str = m.group(2) or ""
+        if value[:1] in ("'", '"'):
+            value = value[1:-1]
+        attrs[m.group(1).lower()] = value
+
+    return attrs
+
+
+def _to_attr(attrs: dict[str, str], excludes: tuple[str, ...] = ()) -> list:
+    keyvals: list = []
+    for key, value in attrs.items():
+        if key in ("id", "class") or key in excludes:
+            continue
+        keyvals.append([key.removeprefix("data-"), value])
+
+    return [attrs.get("id", ""), attrs.get("class", "").split(), keyvals]
+
+
+def _wrap(elem: dict, pos: str | None) -> dict:
+    if pos is None:
+        return elem
+    return {"t": "Span", "c": [["", [], [["pos", pos]]], [elem]]}
+
+
+def _set_pos(elem: dict, pos: str | None) -> dict:
+    if pos is not None:
+        elem["c"][0][2].append(["pos", pos])
+    return elem
+
+
+def _join_pos(start: str | None, stop: str | None) -> str | None:
+    """
+    returns 'data-pos' from the start of `start` to the stop of `stop`.
+    """
+    if (not start) or (not stop):
+        return None
+
+    return start.rsplit("-", 1)[0] + "-" + stop.rsplit("-", 1)[-1]
+
+
+def _stringify(inlines: list) -> str:
+    texts: list[str] = []
+    stack: list = list(reversed(inlines))
+    while stack:
+        elem: dict = stack.pop()
+        t: str = elem["t"]
+        if t == "Str":
+            texts.append(elem["c"])
+        elif t in ("Space", "SoftBreak", "LineBreak"):
+            texts.append(" ")
+        elif t == "Code":
+            texts.append(elem["c"][1])
+        elif t in ("Span", "Link", "Image"):
+            stack += reversed(elem["c"][1])
+        elif type(elem.get("c")) is list:
+            stack += reversed([c for c in elem["c"] if type(c) is dict])
+
+    return "".join(texts)
@@ -7,6 +7,14 @@ r"""!
 from .datapos import DataPos, Pos
 from .element import Element as PandocElement
 from .inline import Inline as PandocInlineElement
+from .nodetable import NodeTable as PandocNodeTable
 from .pandocast import PandocAst
 
-__all__ = ["PandocAst", "PandocElement", "PandocInlineElement", "DataPos", "Pos"]
+__all__ = [
+    "PandocAst",
+    "PandocElement",
+    "PandocInlineElement",
+    "PandocNodeTable",
+    "DataPos",
+    "Pos",
+]
@@ -10,6 +10,8 @@ class Block(Element):
     Base class of PandocAST Element handler.
     """
 
+    __slots__ = ()
+
     def __init__(self, pan_elem, elem_type, type_def):
         """Constructor
         @param pan_elem(Dict)
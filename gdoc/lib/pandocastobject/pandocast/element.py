@@ -2,16 +2,95 @@ r"""
 Element class
 """
 
-from typing import List, Optional, Union, cast
+import sys
+from typing import Callable, Iterator, List, Literal, Optional, TypeAlias, Union, cast
 
 from .datapos import DataPos, Pos
 
+NOT_SET: TypeAlias = Literal[False]
+_NOT_SET_: NOT_SET = False
+
+
+class TypeAccessor:
+    """
+    Element structure data(type_def) compiled into direct indices.
+    """
+
+    __slots__ = (
+        "type_def",
+        "has_content",
+        "content_key",
+        "content_main",
+        "content_type",
+        "struct",
+        "props",
+    )
+
+    def __init__(self, type_def: dict):
+        """Constructor
+        @param type_def(Dict)
+            Element structur data
+        """
+        content: dict | None = type_def.get("content")
+        struct: dict | None = type_def.get("struct")
+
+        self.type_def: dict = type_def
+        self.has_content: bool = content is not None
+        self.content_key = None if content is None else content.get("key")
+        self.content_main = None if content is None else content.get("main")
+        self.content_type: str | None = None if content is None else content.get("type")
+
+        # for set_prop(): None means the type has no property.
+        self.struct: dict | None = struct if "struct" in type_def else None
+
+        # for get_prop(): indices of properties.
+        self.props: dict = {}
+        if (content is not None) and (struct is not None):
+            self.props = {
+                key: (index.get("index", index) if isinstance(index, dict) else index)
+                for key, index in struct.items()
+            }
+
+
+# id(type_def) -> TypeAccessor compiled at import
+_ACCESSORS_: dict[int, TypeAccessor] = {}
+
+
+def compile_type_defs(type_defs: dict[str, dict]) -> None:
+    """
+    compiles element structure data into accessors in advance.
+    """
+    for type_def in type_defs.values():
+        _ACCESSORS_[id(type_def)] = TypeAccessor(type_def)
+
+
+def get_accessor(type_def: dict) -> TypeAccessor:
+    """
+    returns the accessor of the element structure data.
+    """
+    accessor: TypeAccessor | None = _ACCESSORS_.get(id(type_def))
+    if (accessor is None) or (accessor.type_def is not type_def):
+        accessor = TypeAccessor(type_def)
+
+    return accessor
+
 
 class Element:
     """
     Base class of PandocAST Element handler.
     """
 
+    __slots__ = (
+        "pan_element",
+        "type",
+        "_acc",
+        "parent",
+        "_children",
+        "_lazy_children",
+        "_index",
+        "_pos",
+    )
+
     def __init__(self, pan_elem: dict, elem_type: str, type_def: dict):
         """Constructor
         @param pan_elem(Dict)
@@ -23,9 +102,52 @@ class Element:
         """
         self.pan_element: dict = pan_elem
         self.type: str = elem_type
-        self.type_def: dict = type_def
+        self._acc: TypeAccessor = get_accessor(type_def)
         self.parent: Union[Element, None] = None
-        self.children: List[Element] = []
+        self._children: List[Element] = []
+        self._lazy_children: Optional[Callable[[], None]] = None
+        self._index: int = -1
+        # Decoded position of self. "" means it's taken from the previous item.
+        self._pos: Optional[DataPos] | str | NOT_SET = _NOT_SET_
+
+    @property
+    def type_def(self) -> dict:
+        """Element structur data"""
+        return self._acc.type_def
+
+    @type_def.setter
+    def type_def(self, type_def: dict):
+        self._acc = get_accessor(type_def)
+
+    @property
+    def children(self) -> List["Element"]:
+        """child elements.
+        Deferred children are created on the first access.
+        """
+        if self._lazy_children is not None:
+            create_children = self._lazy_children
+            self._lazy_children = None
+            create_children()
+
+        return self._children
+
+    @children.setter
+    def children(self, children: List["Element"]):
+        self._lazy_children = None
+        self._children = children
+        for child in children or []:
+            child._pos = _NOT_SET_
+        self._reset_text()
+
+    def _defer_children(self, create_children: Callable[[], None]) -> "Element":
+        """defers creating children until they are accessed.
+        @param create_children(function) : def create_children()
+            Function to create children with `_add_child()`.
+        @return Element :
+            self, for chaining.
+        """
+        self._lazy_children = create_children
+        return self
 
     def _add_child(self, child) -> "Element":
         """add an element as a child.
@@ -34,10 +156,43 @@ class Element:
         @return Element :
             self, for chaining.
         """
+        children = self.children
+        if len(children) == 1:
+            # The position of an only child may be taken from its parent.
+            children[0]._pos = _NOT_SET_
         child.parent = self
-        self.children.append(child)
+        child._index = len(children)
+        child._pos = _NOT_SET_
+        children.append(child)
+        self._reset_text()
         return self
 
+    def _reset_text(self) -> None:
+        """resets the texts of self and the ancestors made of their children,
+        to be made again on the next access.
+        """
+        element: Element | None = self
+        while element is not None:
+            if (element._children is not None) and hasattr(element, "_text"):
+                element._text = None
+            element = element.parent
+
+    def _get_index(self) -> int:
+        """returns the index of self in the children of the parent.
+        @return Int : -1 if self has no parent.
+        """
+        if self.parent is None:
+            return -1
+
+        siblings = self.parent.children
+        index = self._index
+        if (index < 0) or (index >= len(siblings)) or (siblings[index] is not self):
+            # children has been replaced.
+            index = siblings.index(self)
+            self._index = index
+
+        return index
+
     def next(self) -> Union["Element", None]:
         """returns an element ordered at next to self.
         @return Element :
@@ -46,7 +201,7 @@ class Element:
         next = None
 
         if self.parent is not None:
-            index = self.parent.children.index(self) + 1
+            index = self._get_index() + 1
             if index < len(self.parent.children):
                 next = self.parent.children[index]
 
@@ -60,7 +215,7 @@ class Element:
         prev = None
 
         if self.parent is not None:
-            index = self.parent.children.index(self) - 1
+            index = self._get_index() - 1
             if index >= 0:
                 prev = self.parent.children[index]
 
@@ -103,26 +258,16 @@ class Element:
         @return Str :
             Value string of the property.
         """
-        TYPEDEF = self.type_def
+        acc = self._acc
         property = None
 
-        if ("content" in TYPEDEF) and (TYPEDEF["content"] is not None):
+        if key in acc.props:
             element = self.pan_element
 
-            if ("key" in TYPEDEF["content"]) and (TYPEDEF["content"]["key"] is not None):
-                element = element[TYPEDEF["content"]["key"]]
-
-            if (
-                ("struct" in TYPEDEF)
-                and (TYPEDEF["struct"] is not None)
-                and (key in TYPEDEF["struct"])
-            ):
-                index = TYPEDEF["struct"][key]
+            if acc.content_key is not None:
+                element = element[acc.content_key]
 
-                if isinstance(index, dict):
-                    index = index["index"]
-
-                property = element[index]
+            property = element[acc.props[key]]
 
         return property
 
@@ -133,18 +278,19 @@ class Element:
         @param value(Str)
             Value of the property.
         """
-        TYPEDEF = self.type_def
+        self._reset_pos()
+        acc = self._acc
 
-        if "struct" not in TYPEDEF:
+        if acc.struct is None:
             raise TypeError(f'can not set property to "{self.type}" element.')
 
-        if key not in TYPEDEF["struct"]:
+        if key not in acc.struct:
             raise KeyError(f'can not set property "{key}" to "{self.type}" element.')
 
-        index = TYPEDEF["struct"][key]
+        index = acc.struct[key]
 
-        if ("key" in TYPEDEF["content"]) and (TYPEDEF["content"]["key"] is not None):
-            self.pan_element[TYPEDEF["content"]["key"]][index] = value
+        if acc.content_key is not None:
+            self.pan_element[acc.content_key][index] = value
         else:
             self.pan_element[index] = value
 
@@ -176,29 +322,23 @@ class Element:
         """returns True if self has content(s) or False if self has no content.
         @return Bool :
         """
-        TYPEDEF = self.type_def
-
-        hascontent = ("content" in TYPEDEF) and (TYPEDEF["content"] is not None)
-
-        return hascontent
+        return self._acc.has_content
 
     def get_content(self):
         """returns main content data in the element.
         @return Main content data of the element.
         """
-        TYPEDEF = self.type_def
+        acc = self._acc
         content = None
 
-        if self.hascontent():
-            if ("key" in TYPEDEF["content"]) and (TYPEDEF["content"]["key"] is not None):
-                content = self.pan_element[TYPEDEF["content"]["key"]]
+        if acc.has_content:
+            if acc.content_key is not None:
+                content = self.pan_element[acc.content_key]
             else:
                 content = self.pan_element
 
-            if ("main" in TYPEDEF["content"]) and (
-                TYPEDEF["content"]["main"] is not None
-            ):
-                content = content[TYPEDEF["content"]["main"]]
+            if acc.content_main is not None:
+                content = content[acc.content_main]
 
         return content
 
@@ -206,20 +346,19 @@ class Element:
         """returns main content data in the element.
         @return Main content data of the element.
         """
-        TYPEDEF: dict = self.type_def
+        self._reset_pos()
+        acc = self._acc
 
-        if not self.hascontent():
+        if not acc.has_content:
             raise TypeError(f'"{self.type}" can not set content')
 
-        index: Optional[int] = None
-        if ("main" in TYPEDEF["content"]) and (TYPEDEF["content"]["main"] is not None):
-            index = TYPEDEF["content"]["main"]
+        index = acc.content_main
 
-        if ("key" in TYPEDEF["content"]) and (TYPEDEF["content"]["key"] is not None):
+        if acc.content_key is not None:
             if index is not None:
-                self.pan_element[TYPEDEF["content"]["key"]][index] = value
+                self.pan_element[acc.content_key][index] = value
             else:
-                self.pan_element[TYPEDEF["content"]["key"]] = value
+                self.pan_element[acc.content_key] = value
         else:
             if index is not None:
                 self.pan_element[index] = value
@@ -230,50 +369,28 @@ class Element:
         """returns main content data in the element.
         @return Main content data of the element.
         """
-        TYPEDEF: dict = self.type_def
+        self._reset_pos()
+        acc = self._acc
 
-        if not self.hascontent():
+        if not acc.has_content:
             raise TypeError(f'can not append content to "{self.type}"')
 
-        index: Optional[int] = None
-        if ("main" in TYPEDEF["content"]) and (TYPEDEF["content"]["main"] is not None):
-            index = TYPEDEF["content"]["main"]
+        content = self.pan_element
+        if acc.content_key is not None:
+            content = content[acc.content_key]
+        if acc.content_main is not None:
+            content = content[acc.content_main]
 
-        if ("key" in TYPEDEF["content"]) and (TYPEDEF["content"]["key"] is not None):
-            if index is not None:
-                if type(self.pan_element[TYPEDEF["content"]["key"]][index]) is list:
-                    self.pan_element[TYPEDEF["content"]["key"]][index].append(value)
-                else:
-                    raise TypeError(f'can not append content to "{self.type}"')
-            else:
-                if type(self.pan_element[TYPEDEF["content"]["key"]]) is list:
-                    self.pan_element[TYPEDEF["content"]["key"]].append(value)
-                else:
-                    raise TypeError(f'can not append content to "{self.type}"')
-        else:
-            if index is not None:
-                if type(self.pan_element[index]) is list:
-                    self.pan_element[index].append(value)
-                else:
-                    raise TypeError(f'can not append content to "{self.type}"')
-            else:
-                if type(self.pan_element) is list:
-                    self.pan_element.append(value)
-                else:
-                    raise TypeError(f'can not append content to "{self.type}"')
+        if type(content) is not list:
+            raise TypeError(f'can not append content to "{self.type}"')
+
+        content.append(value)
 
     def get_content_type(self) -> Union[str, None]:
         """returns type of main content in the element.
         @return String : The type of main content in the element.
         """
-        TYPEDEF = self.type_def
-        content_type = None
-
-        if self.hascontent():
-            if "type" in TYPEDEF["content"]:
-                content_type = TYPEDEF["content"]["type"]
-
-        return content_type
+        return self._acc.content_type
 
     def walk(self, action, post_action=None, opt=None) -> "Element":
         """Walk through all elements of the tree and call out given functions.
@@ -284,14 +401,54 @@ class Element:
         """
         action(self, opt)
 
-        for child in self.children:
-            child.walk(action, post_action, opt)
-
-        if post_action is not None:
-            post_action(self, opt)
+        # An explicit stack instead of recursion, not to hit the recursion limit.
+        stack: list[tuple[Element, Iterator[Element]]] = [
+            (self, iter(self.children or ()))
+        ]
+        while stack:
+            element, children = stack[-1]
+            child: Element | None = next(children, None)
+            if child is not None:
+                action(child, opt)
+                stack.append((child, iter(child.children or ())))
+            else:
+                stack.pop()
+                if post_action is not None:
+                    post_action(element, opt)
 
         return self
 
+    def iter_preorder(
+        self, prune: Optional[Callable[["Element"], bool]] = None
+    ) -> Iterator["Element"]:
+        """Iterate over self and all descendant elements in pre-order.
+        @param prune(function) : def prune(element) -> bool
+            Children of the elements for which it returns True are not visited.
+        @return Iterator[Element] :
+        """
+        stack: list[Element] = [self]
+        while stack:
+            element = stack.pop()
+            yield element
+
+            if (prune is None) or (not prune(element)):
+                children = element.children
+                if children:
+                    stack.extend(reversed(children))
+
+    def iter_type(
+        self, elem_type: str, prune: Optional[Callable[["Element"], bool]] = None
+    ) -> Iterator["Element"]:
+        """Iterate over self and all descendant elements of the type in pre-order.
+        @param elem_type(Str) : Element type. ex. "Header"
+        @param prune(function) : def prune(element) -> bool
+            Children of the elements for which it returns True are not visited.
+        @return Iterator[Element] :
+        """
+        for element in self.iter_preorder(prune):
+            if element.type == elem_type:
+                yield element
+
     #
     # '_item()' related methods
     #
@@ -336,32 +493,36 @@ class Element:
         @return Element :
             If the next element does not exist, returns None.
         """
-        next: Union[Element, None] = None
-
-        parent = self.get_parent_item(ignore)
-        if parent is not None:
-            siblings = parent.get_child_items(ignore)
-            index = siblings.index(self) + 1
-            if index < len(siblings):
-                next = siblings[index]
-
-        return next
+        return self._find_item(ignore, 1)
 
     def prev_item(self, ignore=["Div", "Span"]) -> Union["Element", None]:
         """returns an element ordered at previous to self.
         @return Element :
             If the previous element does not exist, returns None.
         """
-        prev: Union[Element, None] = None
+        return self._find_item(ignore, -1)
 
-        parent = self.get_parent_item(ignore)
-        if parent is not None:
-            siblings = parent.get_child_items(ignore)
-            index = siblings.index(self) - 1
-            if index >= 0:
-                prev = siblings[index]
+    def _find_item(self, ignore, step: int) -> Union["Element", None]:
+        """returns the nearest item in the direction of `step` among the child
+        items of the parent item.
+        Siblings are followed by their indices, entering the elements of ignored
+        types and leaving them to the parents, without making the list of items.
+        """
+        element: Element = self
+        while element.parent is not None:
+            siblings: List[Element] = element.parent.children
+            index: int = element._get_index() + step
+            while 0 <= index < len(siblings):
+                item = _get_end_item(siblings[index], ignore, step)
+                if item is not None:
+                    return item
+                index += step
+
+            element = element.parent
+            if element.type not in ignore:
+                break
 
-        return prev
+        return None
 
     def get_first_item(self, ignore=["Div", "Span"]) -> Union["Element", None]:
         """returns the first child item.
@@ -387,54 +548,104 @@ class Element:
         if self.type not in ignore:
             action(self, opt)
 
-        for child in self.children:
-            child.walk_items(action, post_action, opt, ignore)
-
-        if post_action is not None and self.type not in ignore:
-            post_action(self, opt)
+        # An explicit stack instead of recursion, not to hit the recursion limit.
+        stack: list[tuple[Element, Iterator[Element]]] = [
+            (self, iter(self.children or ()))
+        ]
+        while stack:
+            element, children = stack[-1]
+            child: Element | None = next(children, None)
+            if child is not None:
+                if child.type not in ignore:
+                    action(child, opt)
+                stack.append((child, iter(child.children or ())))
+            else:
+                stack.pop()
+                if post_action is not None and element.type not in ignore:
+                    post_action(element, opt)
 
         return self
 
+    def iter_items(
+        self,
+        ignore=["Div", "Span"],
+        prune: Optional[Callable[["Element"], bool]] = None,
+    ) -> Iterator["Element"]:
+        """Iterate over self and all descendant items in pre-order.
+        @param ignore([Str]) : Element types not to be items.
+        @param prune(function) : def prune(element) -> bool
+            Children of the elements for which it returns True are not visited.
+        @return Iterator[Element] :
+        """
+        for element in self.iter_preorder(prune):
+            if element.type not in ignore:
+                yield element
+
     def get_data_pos(self) -> Optional[DataPos]:
+        """returns the position of the element in the source file.
+        The position is decoded once and kept in the element.
+        @return DataPos : None if the position is not available.
+        """
+        pos = self._pos
+        if pos is _NOT_SET_:
+            pos = self._pos = self._decode_pos()
+
+        if type(pos) is not str:
+            return cast(Optional[DataPos], pos)
+
         result: DataPos | None = None
-        target: "Element" | None = self
 
-        path: str
-        pos: list[int]
+        # Currently(pandoc -v = 2.14.2),
+        # If the type is SoftBreak, data-pos is not provided and is "".
+        # Therefore, try to get the prev item and get its stop position.
+        # The stop position points start point of the next(self) element.
+        # ('SoftBreak' is converted to 'Space' while converting to html)
+        target = self.prev_item()
+        if target is not None:
+            prev: Optional[DataPos] = target.get_data_pos()
+            if prev is not None:
+                result = DataPos(prev.path, prev.stop, Pos(0, 0))
+
+        return result
+
+    def _decode_pos(self) -> Optional[DataPos] | str:
+        """decodes 'pos' or 'data-pos' attribute of the element.
+        @return DataPos | str :
+            "" if the position should be taken from the previous item.
+            None if the position is not available.
+        """
+        target: "Element" | None = self
 
         if self.get_prop("Attr") is None:
             # Some of Pandoc AST element types (ex. 'Str', 'Space', 'LineBreak')
             # don't have 'Attr' property. But their parents may be 'Span' or 'Div'
             # and they have 'Attr' property. When 'sourcepos' extension is enabled
             # for pandoc, 'Attr' property includes pos data. [pandoc-types-1.22.2]
-            target = self.get_parent()
+            target = self.parent
 
             if target is not None:
                 # Check if self is the only a child of Div or Span:
-                if len(cast(list[Element], target.get_children())) != 1:
+                if len(cast(list[Element], target.children)) != 1:
                     target = None
 
-        if target is not None:
-            pos_str: str | None = target.get_attr(("pos", "data-pos"))
+        if target is None:
+            return None
 
-            if (pos_str is not None) and (pos_str != ""):
-                path, pos = self.__class__._get_pos_info(pos_str)
-                result = DataPos(path, Pos(pos[0], pos[1]), Pos(pos[2], pos[3]))
+        pos_str: str | None = target.get_attr(("pos", "data-pos"))
 
-            elif (pos_str == "") and (self.get_type() in ("SoftBreak", "Space")):
-                # Currently(pandoc -v = 2.14.2),
-                # If the type is SoftBreak, data-pos is not provided and is "".
-                # Therefore, try to get the prev item and get its stop position.
-                # The stop position points start point of the next(self) element.
-                # ('SoftBreak' is converted to 'Space' while converting to html)
+        if (pos_str is not None) and (pos_str != ""):
+            return _decode_pos_str(pos_str)
 
-                target = self.prev_item()
-                if target is not None:
-                    prev: Optional[DataPos] = target.get_data_pos()
-                    if prev is not None:
-                        result = DataPos(prev.path, prev.stop, Pos(0, 0))
+        if (pos_str == "") and (self.type in ("SoftBreak", "Space")):
+            return ""
 
-        return result
+        return None
+
+    def _reset_pos(self) -> None:
+        """discards decoded positions of self and the children."""
+        self._pos = _NOT_SET_
+        for child in self._children or []:
+            child._pos = _NOT_SET_
 
     @staticmethod
     def _get_pos_info(pos_str: str) -> tuple[str, list[int]]:
@@ -455,3 +666,45 @@ class Element:
             _parts += p.split(":")
 
         return path, [int(p) for p in _parts]
+
+
+def _get_end_item(element: Element, ignore, step: int) -> Optional[Element]:
+    """
+    returns the element, or the first(step > 0) or the last(step < 0) item in it
+    if its type is ignored.
+    """
+    if element.type not in ignore:
+        return element
+
+    def _iter(element: Element) -> Iterator[Element]:
+        children: List[Element] = element.children or []
+        return iter(children) if step > 0 else reversed(children)
+
+    # An explicit stack instead of recursion, as walk_items() does.
+    stack: list[Iterator[Element]] = [_iter(element)]
+    while stack:
+        child: Element | None = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif child.type not in ignore:
+            return child
+        else:
+            stack.append(_iter(child))
+
+    return None
+
+
+def _decode_pos_str(pos_str: str) -> DataPos:
+    """
+    decodes "path@l:c-l:c" into DataPos with the interned path.
+    """
+    path, _, pos = pos_str.rpartition("@")
+    start, _, stop = pos.partition("-")
+    start_ln, _, start_col = start.partition(":")
+    stop_ln, _, stop_col = stop.partition(":")
+
+    return DataPos(
+        sys.intern(path),
+        Pos(int(start_ln), int(start_col)),
+        Pos(int(stop_ln), int(stop_col)),
+    )
@@ -2,6 +2,9 @@ r"""
 Inline class
 """
 
+from functools import partial
+from typing import Iterator
+
 from .element import Element
 
 
@@ -10,7 +13,9 @@ class Inline(Element):
     Inline class of PandocAST Element handler.
     """
 
-    def __init__(self, pan_elem, elem_type, type_def, create_element):
+    __slots__ = ("_text",)
+
+    def __init__(self, pan_elem, elem_type, type_def, create_element, lazy=False):
         """Constructor
         @param pan_elem(Dict)
             PandocAST Element
@@ -20,34 +25,75 @@ class Inline(Element):
             Element structur data
         @param create_element(func(pan_elem, elem_type : Element))
             General constructor of pandoc Element types for creating children.
+        @param lazy(Bool)
+            If True, children and text are created on the first access to them.
         """
         super().__init__(pan_elem, elem_type, type_def)
-        self.text = ""
+        acc = self._acc
+        self._text = ""
 
-        if not self.hascontent():
+        # Children of a new element are set to the slot without the setter.
+        if not acc.has_content:
             #
             # 'Space', 'SoftBrak' or 'LineBreak'
             #
-            self.children = None
-            self.text = type_def["alt"]
+            self._children = None
+            self._text = type_def["alt"]
 
-        elif self.get_content_type() == "Text":
+        elif acc.content_type == "Text":
             #
             # In Inline context, 'Text' is a text string
             #
-            self.children = None
-            self.text = self.get_content()
+            self._children = None
+            self._text = self.get_content()
+
+        elif lazy:
+            self._defer_children(partial(self._create_children, create_element))
+            self._text = None
 
         else:
             #
             # '[Inline]' or '[Block]'
+            # The text is made of the children on the first access.
             #
-            panContent = self.get_content()
-            panContentType = self.get_content_type()
+            self._create_children(create_element)
+            self._text = None
+
+    @property
+    def text(self) -> str:
+        """text of the element.
+        @return Str : texts of the children concatenated.
+        """
+        if self._text is None:
+            self._text = self._get_text()
+
+        return self._text
+
+    @text.setter
+    def text(self, text: str):
+        self._text = text
+
+    def _create_children(self, create_element):
+        panContent = self.get_content()
+        panContentType = self.get_content_type()
+
+        for element in panContent:
+            self._add_child(create_element(element, panContentType))
+
+    def _get_text(self) -> str:
+        # Texts of the descendants are joined at once,
+        # instead of being concatenated at every nesting level.
+        texts: list[str] = []
+        stack: list[Iterator[Element]] = [iter(self.children)]
+        while stack:
+            element: Element | None = next(stack[-1], None)
+            if element is None:
+                stack.pop()
+
+            elif isinstance(element, Inline) and (element._text is None):
+                stack.append(iter(element.children))
 
-            for element in panContent:
-                self._add_child(create_element(element, panContentType))
+            elif hasattr(element, "text") and (element.text is not None):
+                texts.append(element.text)
 
-            for element in self.children:
-                if hasattr(element, "text") and (element.text is not None):
-                    self.text += element.text
+        return "".join(texts)
@@ -2,6 +2,8 @@ r"""
 Inline class
 """
 
+from functools import partial
+
 from .block import Block
 
 
@@ -10,7 +12,9 @@ class InlineList(Block):
     InlineList class of PandocAST Element handler.
     """
 
-    def __init__(self, pan_elem, elem_type, type_def, create_element):
+    __slots__ = ("_text",)
+
+    def __init__(self, pan_elem, elem_type, type_def, create_element, lazy=False):
         """Constructor
         @param pan_elem(Dict)
             PandocAST Element
@@ -20,36 +24,64 @@ class InlineList(Block):
             Element structur data
         @param create_element(func(pan_elem, elem_type : Element))
             General constructor of pandoc Element types for creating children.
+        @param lazy(Bool)
+            If True, children and text are created on the first access to them.
         """
         super().__init__(pan_elem, elem_type, type_def)
-        self.text = ""
+        acc = self._acc
+        self._text = ""
 
-        if not self.hascontent():
+        # Children of a new element are set to the slot without the setter.
+        if not acc.has_content:
             # HorizontalRule
-            self.children = None
-            self.text = type_def["alt"]
+            self._children = None
+            self._text = type_def["alt"]
 
-        elif self.get_content_type() == "Text":
+        elif acc.content_type == "Text":
             #
             # CodeBlock or RawBlock
             #
-            self.children = None
+            self._children = None
 
-            self.text = self.get_content()
+            self._text = self.get_content()
+
+        elif lazy:
+            self._defer_children(partial(self._create_children, create_element))
+            self._text = None
 
         else:
             #
             # Para, Plain, Header, LineBlock or Line(gdoc internal type)
+            # The text is made of the children on the first access.
             #
-            contents = self.get_content()
-            type = self.get_content_type()
+            self._create_children(create_element)
+            self._text = None
+
+    @property
+    def text(self) -> str:
+        """text of the element.
+        @return Str : texts of the children joined with the separator.
+        """
+        if self._text is None:
+            self._text = self._get_text()
+
+        return self._text
+
+    @text.setter
+    def text(self, text: str):
+        self._text = text
+
+    def _create_children(self, create_element):
+        contents = self.get_content()
+        type = self.get_content_type()
 
-            for item in contents:
-                self._add_child(create_element(item, type))
+        for item in contents:
+            self._add_child(create_element(item, type))
 
-            inlines = []
-            for element in self.children:
-                if hasattr(element, "text") and (element.text is not None):
-                    inlines.append(element.text)
+    def _get_text(self) -> str:
+        inlines = []
+        for element in self.children:
+            if hasattr(element, "text") and (element.text is not None):
+                inlines.append(element.text)
 
-            self.text = type_def["separator"].join(inlines)
+        return self.type_def["separator"].join(inlines)
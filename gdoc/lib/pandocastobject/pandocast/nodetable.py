@@ -0,0 +1,419 @@
+r"""
+NodeTable class
+
+A columnar and read-only form of a PandocAst tree.
+Each node is a row of flat arrays(type, parent, first child, next sibling, text
+offset and position), and texts of all nodes are kept in one str.
+Neither the json of pandoc nor the Element objects are kept alive, so a table
+takes a small part of the memory of them.
+Nodes are accessed through `NodeView`, which provides the reading part of the
+Element API.
+"""
+from array import array
+from typing import Any, List, Optional, Union, cast
+
+from .datapos import DataPos, Pos
+from .element import Element, TypeAccessor, get_accessor
+from .inline import Inline
+from .inlinelist import InlineList
+from .pandocast import PandocAst
+from .types import _ELEMENT_TYPES
+
+# type id -> element type
+_TYPES_: list[str] = list(_ELEMENT_TYPES)
+_TYPE_IDS_: dict[str, int] = {etype: i for i, etype in enumerate(_TYPES_)}
+_ACCESSORS_: list[TypeAccessor] = [
+    get_accessor(_ELEMENT_TYPES[etype]) for etype in _TYPES_
+]
+
+# Types whose elements have no children but a text.
+_LEAF_TYPES_: frozenset[int] = frozenset(
+    i
+    for i, acc in enumerate(_ACCESSORS_)
+    if (not acc.has_content) or (acc.content_type == "Text")
+)
+
+# Properties holding child elements, which are rows of the table.
+_CHILD_PROPS_: tuple[str, ...] = ("TableHead", "[TableBody]", "TableFoot")
+
+_NO_ATTR_: list = ["", [], []]
+
+
+def _get_prop_keys(acc: TypeAccessor) -> tuple[str, ...]:
+    """
+    returns keys of the properties to be kept in the table.
+    """
+    return tuple(
+        key
+        for key, index in acc.props.items()
+        if (index != acc.content_main)
+        and (key not in _CHILD_PROPS_)
+        and (not isinstance(acc.struct[key], dict))  # type: ignore[index]
+    )
+
+
+_PROP_KEYS_: list[tuple[str, ...]] = [_get_prop_keys(acc) for acc in _ACCESSORS_]
+
+
+def _encode_pos(pos: DataPos) -> str:
+    return f"{pos.path}@{pos.start.ln}:{pos.start.col}-{pos.stop.ln}:{pos.stop.col}"
+
+
+class NodeTable:
+    """
+    Columnar node table of a PandocAst tree.
+    """
+
+    __slots__ = (
+        "_types",
+        "_parents",
+        "_first_children",
+        "_next_siblings",
+        "_text",
+        "_text_offsets",
+        "_paths",
+        "_path_ids",
+        "_positions",
+        "_props",
+    )
+
+    def __init__(self, root: Element):
+        """Constructor
+        @param root(Element)
+            Root element of the tree to be stored in the table.
+            The tree can be released after the table is created.
+        """
+        self._types: array = array("B")
+        self._parents: array = array("i")
+        self._text_offsets: array = array("l", [0])
+        # path id(-1 if no position), start ln, col, stop ln, col
+        self._path_ids: array = array("i")
+        self._positions: array = array("i")
+        self._paths: list[str] = []
+        self._props: dict[int, dict[str, Any]] = {}
+
+        texts: list[str] = []
+        offset: int = 0
+        path_ids: dict[str, int] = {}
+        node_ids: dict[int, int] = {}
+
+        for element in root.iter_preorder():
+            node: int = len(self._types)
+            node_ids[id(element)] = node
+
+            type_id: int = _TYPE_IDS_[element.type]
+            self._types.append(type_id)
+            self._parents.append(
+                -1 if (element is root) else node_ids[id(element.parent)]
+            )
+
+            if type_id in _LEAF_TYPES_:
+                text: str = element.text  # type: ignore[attr-defined]
+                texts.append(text)
+                offset += len(text)
+            self._text_offsets.append(offset)
+
+            pos: Optional[DataPos] = element.get_data_pos()
+            if pos is None:
+                self._path_ids.append(-1)
+                self._positions.extend((0, 0, 0, 0))
+            else:
+                path_id = path_ids.get(pos.path)
+                if path_id is None:
+                    path_id = path_ids[pos.path] = len(self._paths)
+                    self._paths.append(pos.path)
+                self._path_ids.append(path_id)
+                self._positions.extend(
+                    (pos.start.ln, pos.start.col, pos.stop.ln, pos.stop.col)
+                )
+
+            props: dict[str, Any] = {}
+            for key in _PROP_KEYS_[type_id]:
+                value = element.get_prop(key)
+                if key == "Attr":
+                    if (value == _NO_ATTR_) or (
+                        (pos is not None) and (value == self._get_pos_attr(pos))
+                    ):
+                        # made again from the position on access.
+                        continue
+                if value is not None:
+                    props[key] = value
+            if props:
+                self._props[node] = props
+
+        self._text: str = "".join(texts)
+
+        # Siblings are numbered in order in the pre-order,
+        # so linking them in the reverse order makes the lists of children.
+        size: int = len(self._types)
+        self._first_children: array = array("i", [-1]) * size
+        self._next_siblings: array = array("i", [-1]) * size
+        for node in range(size - 1, 0, -1):
+            parent: int = self._parents[node]
+            self._next_siblings[node] = self._first_children[parent]
+            self._first_children[parent] = node
+
+    @staticmethod
+    def from_json(pan_elem) -> "NodeTable":
+        """creates a table of PandocAST json.
+        The json can be released after the table is created.
+        @param pan_elem(Dict)
+            PandocAST json
+        @return NodeTable :
+        """
+        return NodeTable(PandocAst(pan_elem, lazy=True))
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    @property
+    def root(self) -> "NodeView":
+        """root node of the table."""
+        return NodeView(self, 0)
+
+    @staticmethod
+    def _get_pos_attr(pos: DataPos) -> list:
+        return ["", [], [["data-pos", _encode_pos(pos)]]]
+
+    def _get_children(self, node: int) -> list[int]:
+        children: list[int] = []
+        child: int = self._first_children[node]
+        while child >= 0:
+            children.append(child)
+            child = self._next_siblings[child]
+
+        return children
+
+    def _get_data_pos(self, node: int) -> Optional[DataPos]:
+        path_id: int = self._path_ids[node]
+        if path_id < 0:
+            return None
+
+        i: int = node * 4
+        start_ln, start_col, stop_ln, stop_col = self._positions[i : i + 4]
+        return DataPos(
+            self._paths[path_id], Pos(start_ln, start_col), Pos(stop_ln, stop_col)
+        )
+
+
+class NodeView:
+    """
+    View of a node in NodeTable, providing the reading part of the Element API.
+    """
+
+    __slots__ = ("_table", "_node")
+
+    def __init__(self, table: NodeTable, node: int):
+        """Constructor
+        @param table(NodeTable)
+            Table containing the node.
+        @param node(Int)
+            Row of the node in the table.
+        """
+        self._table: NodeTable = table
+        self._node: int = node
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, NodeView)
+            and (self._table is other._table)
+            and (self._node == other._node)
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._node))
+
+    def _view(self, node: int) -> Optional["NodeView"]:
+        return None if node < 0 else NodeView(self._table, node)
+
+    @property
+    def type(self) -> str:
+        """Element type"""
+        return _TYPES_[self._table._types[self._node]]
+
+    @property
+    def parent(self) -> Optional["NodeView"]:
+        """parent node"""
+        return self._view(self._table._parents[self._node])
+
+    @property
+    def children(self) -> Optional[List["NodeView"]]:
+        """child nodes.
+        None if the type of the node has no children.
+        """
+        table = self._table
+        if table._types[self._node] in _LEAF_TYPES_:
+            return None
+
+        return [NodeView(table, child) for child in table._get_children(self._node)]
+
+    @property
+    def text(self) -> str:
+        """text of the node.
+        The same text as of `Inline` and `InlineList` elements.
+        """
+        table = self._table
+        node: int = self._node
+        type_id: int = table._types[node]
+
+        if type_id in _LEAF_TYPES_:
+            return table._text[table._text_offsets[node] : table._text_offsets[node + 1]]
+
+        type_def: dict = _ELEMENT_TYPES[_TYPES_[type_id]]
+        element_class = type_def["class"]
+
+        if issubclass(element_class, Inline):
+            # Texts of the descendant inlines are in a row in the buffer.
+            return "".join(
+                leaf.text for leaf in self._get_inline_leaves() if hasattr(leaf, "text")
+            )
+
+        if issubclass(element_class, InlineList):
+            return type_def["separator"].join(
+                child.text
+                for child in cast(list[NodeView], self.children)
+                if hasattr(child, "text")
+            )
+
+        raise AttributeError(f"'{self.type}' node has no attribute 'text'")
+
+    def _get_inline_leaves(self) -> list["NodeView"]:
+        leaves: list[NodeView] = []
+        stack: list[NodeView] = list(reversed(cast(list[NodeView], self.children)))
+        while stack:
+            node = stack.pop()
+            if (node.children is not None) and issubclass(
+                _ELEMENT_TYPES[node.type]["class"], Inline
+            ):
+                stack.extend(reversed(node.children))
+            else:
+                leaves.append(node)
+
+        return leaves
+
+    def next(self) -> Optional["NodeView"]:
+        """returns the next sibling node."""
+        return self._view(self._table._next_siblings[self._node])
+
+    def prev(self) -> Optional["NodeView"]:
+        """returns the previous sibling node."""
+        parent: int = self._table._parents[self._node]
+        if parent < 0:
+            return None
+
+        prev: int = -1
+        for child in self._table._get_children(parent):
+            if child == self._node:
+                break
+            prev = child
+
+        return self._view(prev)
+
+    def get_parent(self) -> Optional["NodeView"]:
+        return self.parent
+
+    def get_children(self) -> Optional[List["NodeView"]]:
+        return self.children
+
+    def get_first_child(self) -> Optional["NodeView"]:
+        return self._view(self._table._first_children[self._node])
+
+    def get_type(self) -> str:
+        return self.type
+
+    def get_prop(self, key):
+        """returns a property of the node specified by key string.
+        Properties holding child elements are not available.
+        @param key(Str)
+            Key string of the property.
+        @return property or None
+        """
+        props: dict | None = self._table._props.get(self._node)
+        if (props is not None) and (key in props):
+            return props[key]
+
+        type_id: int = self._table._types[self._node]
+
+        if (key == "Attr") and (key in _PROP_KEYS_[type_id]):
+            # The position of an element having 'Attr' is taken from its own Attr,
+            # so the elided Attr is the one holding the position, if any.
+            pos: Optional[DataPos] = self._table._get_data_pos(self._node)
+            if pos is not None:
+                return NodeTable._get_pos_attr(pos)
+            return ["", [], []]
+
+        acc: TypeAccessor = _ACCESSORS_[type_id]
+        if (
+            (acc.content_type == "Text")
+            and (key in acc.props)
+            and (acc.props[key] == acc.content_main)
+        ):
+            # Text contents are kept in the text buffer.
+            return self.text
+
+        return None
+
+    get_attr = Element.get_attr
+
+    def hascontent(self) -> bool:
+        return _ACCESSORS_[self._table._types[self._node]].has_content
+
+    def get_content_type(self) -> Union[str, None]:
+        return _ACCESSORS_[self._table._types[self._node]].content_type
+
+    def get_content(self):
+        """returns the content of 'Text' type.
+        @return Str : None if the content is not a text.
+        """
+        if self.get_content_type() != "Text":
+            return None
+
+        return self.text
+
+    def get_data_pos(self) -> Optional[DataPos]:
+        return self._table._get_data_pos(self._node)
+
+    def get_child_items(self, ignore=["Div", "Span"]) -> List["NodeView"]:
+        """returns new list of child items.
+        @return [NodeView] :
+        """
+        children = self.children
+        if children is None:
+            return None  # type: ignore
+
+        items: list[NodeView] = []
+        for child in children:
+            if child.type in ignore:
+                items += child.get_child_items(ignore) or []
+            else:
+                items.append(child)
+
+        return items
+
+    def next_item(self, ignore=["Div", "Span"]) -> Optional["NodeView"]:
+        """returns an item ordered at next to self."""
+        parent = self.get_parent_item(ignore)
+        if parent is None:
+            return None
+
+        items = parent.get_child_items(ignore)
+        index = items.index(self) + 1
+        return items[index] if index < len(items) else None
+
+    def prev_item(self, ignore=["Div", "Span"]) -> Optional["NodeView"]:
+        """returns an item ordered at previous to self."""
+        parent = self.get_parent_item(ignore)
+        if parent is None:
+            return None
+
+        items = parent.get_child_items(ignore)
+        index = items.index(self) - 1
+        return items[index] if index >= 0 else None
+
+    get_parent_item = Element.get_parent_item
+    get_first_item = Element.get_first_item
+    walk = Element.walk
+    walk_items = Element.walk_items
+    iter_preorder = Element.iter_preorder
+    iter_items = Element.iter_items
+    iter_type = Element.iter_type
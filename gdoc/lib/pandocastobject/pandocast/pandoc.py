@@ -10,7 +10,9 @@ class Pandoc(BlockList):
     Root element representing whole pandocAst object.
     """
 
-    def __init__(self, pan_elem, elem_type, type_def, create_element):
+    __slots__ = ()
+
+    def __init__(self, pan_elem, elem_type, type_def, create_element, lazy=False):
         """Constructor
         @param pan_elem(Dict)
             PandocAST Element
@@ -20,5 +22,7 @@ class Pandoc(BlockList):
             Element structur data
         @param create_element(func(pan_elem, elem_type : Element))
             General constructor of pandoc Element types for creating children.
+        @param lazy(Bool)
+            If True, children are created on the first access to them.
         """
-        super().__init__(pan_elem, elem_type, type_def, create_element)
+        super().__init__(pan_elem, elem_type, type_def, create_element, lazy)
@@ -1,26 +1,49 @@
 r"""
 PandocAst Utility Class
 """
-import copy
-from typing import Callable, cast
+import marshal
+from typing import Callable, NamedTuple, cast
 
-from .element import Element
+from .element import Element, TypeAccessor, get_accessor
 from .pandoc import Pandoc
 from .types import _ELEMENT_TYPES
 
 
 class PandocAst(Pandoc):
-    def __init__(self, pan_elem):
+
+    __slots__ = ()
+
+    def __init__(self, pan_elem, lazy=False):
         """Constructor
         @param pan_elem(Dict)
             PandocAST Element
+        @param lazy(Bool)
+            If True, children of the elements are created on the first access to
+            them, so only the parts of the tree that are visited are built.
         """
-        super().__init__(
-            pan_elem, "Pandoc", _ELEMENT_TYPES["Pandoc"], PandocAst.create_element
-        )
+        if lazy:
+            super().__init__(
+                pan_elem,
+                "Pandoc",
+                _ELEMENT_TYPES["Pandoc"],
+                PandocAst.create_lazy_element,
+                lazy=True,
+            )
+        else:
+            super().__init__(
+                pan_elem, "Pandoc", _ELEMENT_TYPES["Pandoc"], PandocAst.create_element
+            )
 
     @staticmethod
-    def create_element(pan_elem, elem_type=None, content=None) -> Element:
+    def create_lazy_element(pan_elem, elem_type=None, content=None) -> Element:
+        """
+        `create_element()` creating the element whose children are created on
+        the first access to them.
+        """
+        return PandocAst.create_element(pan_elem, elem_type, content, lazy=True)
+
+    @staticmethod
+    def create_element(pan_elem, elem_type=None, content=None, lazy=False) -> Element:
         """
         Find the element type and call constructor specified by it.
         """
@@ -39,18 +62,131 @@ class PandocAst(Pandoc):
             # Invalid etype( = 'ELEMENT TYPE MISSING' or invalid `elem_type`)
             raise KeyError(etype)
 
-        if pan_elem is not None:
-            elem = pan_elem
+        if pan_elem is None:
+            return PandocAst.build_element(etype, content, lazy=lazy)
+
+        element_class: Callable = cast(Callable, _ELEMENT_TYPES[etype]["class"])
+        element: Element
+        if lazy:
+            element = element_class(
+                pan_elem,
+                etype,
+                _ELEMENT_TYPES[etype],
+                PandocAst.create_lazy_element,
+                lazy=True,
+            )
         else:
-            elem = copy.deepcopy(_ELEMENT_TYPES[etype]["new"])
+            element = element_class(
+                pan_elem, etype, _ELEMENT_TYPES[etype], PandocAst.create_element
+            )
 
-        element: Element = cast(Callable, _ELEMENT_TYPES[etype]["class"])(
-            elem, etype, _ELEMENT_TYPES[etype], PandocAst.create_element
-        )
+        return element
+
+    @staticmethod
+    def build_element(
+        elem_type: str,
+        content=None,
+        children: list[Element] | None = None,
+        attr: list | None = None,
+        lazy=False,
+    ) -> Element:
+        """
+        Create a new element of the type directly.
+        The json of the element is made from the template of the type without
+        `copy.deepcopy()`, and the given children are not created again from
+        their json.
+
+        @param elem_type(Str)
+            Element type
+        @param content
+            PandocAST json of the content. (ex. str of 'Str')
+        @param children([Element])
+            Elements to be the children. Their `pan_element`s become the content.
+            Only for the types whose content is a list of elements.
+        @param attr(List)
+            'Attr' of the element.
+        @param lazy(Bool)
+            If True, children created from `content` are created on the first
+            access to them.
+        @return Element : new element.
+        """
+        type_def, acc, element_class, template = _get_builder(elem_type)
+
+        if children is not None:
+            content = [child.pan_element for child in children]
+
+        # `marshal` copies the template much faster than `copy.deepcopy()`.
+        elem = marshal.loads(template)
+        if content is not None:
+            if not acc.has_content:
+                raise TypeError(f'"{elem_type}" can not set content')
+            elem = _set_json(elem, acc.content_key, acc.content_main, content)
 
-        if pan_elem is None and content is not None:
-            element.set_content(content)
-            # The following line is inefficient and not a good way.
-            element = PandocAst.create_element(element.pan_element, etype)
+        if attr is not None:
+            if (acc.struct is None) or ("Attr" not in acc.struct):
+                raise KeyError(f'can not set property "Attr" to "{elem_type}" element.')
+            elem = _set_json(elem, acc.content_key, acc.struct["Attr"], attr)
+
+        element: Element
+        if children is not None:
+            # The children are handed to the constructor in the order of the content
+            # instead of being created from their json.
+            _next = iter(children).__next__
+            element = element_class(
+                elem, elem_type, type_def, lambda pan_elem, elem_type=None: _next()
+            )
+
+        elif lazy:
+            element = element_class(
+                elem, elem_type, type_def, PandocAst.create_lazy_element, lazy=True
+            )
+        else:
+            element = element_class(elem, elem_type, type_def, PandocAst.create_element)
 
         return element
+
+
+class _Builder(NamedTuple):
+    type_def: dict
+    acc: TypeAccessor
+    element_class: Callable
+    template: bytes
+
+
+# elem_type -> _Builder
+_BUILDERS_: dict[str, _Builder] = {}
+
+
+def _get_builder(etype: str) -> _Builder:
+    builder: _Builder | None = _BUILDERS_.get(etype)
+    if builder is None:
+        type_def: dict = _ELEMENT_TYPES[etype]
+        if "new" not in type_def:
+            raise TypeError(f'"{etype}" can not be created without json')
+
+        builder = _BUILDERS_[etype] = _Builder(
+            type_def,
+            get_accessor(type_def),
+            cast(Callable, type_def["class"]),
+            marshal.dumps(type_def["new"]),
+        )
+
+    return builder
+
+
+def _set_json(elem, key, index, value):
+    """
+    sets the value in the json, and returns the json.
+    """
+    if key is not None:
+        if index is not None:
+            elem[key][index] = value
+        else:
+            elem[key] = value
+    else:
+        if index is not None:
+            elem[index] = value
+        else:
+            elem = value
+
+    return elem
@@ -2,6 +2,8 @@ r"""
 Block class
 """
 
+from functools import partial
+
 from .block import Block
 from .element import Element
 
@@ -11,7 +13,9 @@ class Table(Block):
     BlockList is a Block containing Blocks or BlockLists as a list.
     """
 
-    def __init__(self, pan_elem, elem_type, type_def, create_element):
+    __slots__ = ()
+
+    def __init__(self, pan_elem, elem_type, type_def, create_element, lazy=False):
         """Constructor
         @param pan_elem(Dict)
             PandocAST Element
@@ -21,9 +25,17 @@ class Table(Block):
             Element structur data
         @param create_element(func(pan_elem, elem_type : Element))
             General constructor of pandoc Element types for creating children.
+        @param lazy(Bool)
+            If True, children are created on the first access to them.
         """
         super().__init__(pan_elem, elem_type, type_def)
 
+        if lazy:
+            self._defer_children(partial(self._create_children, create_element))
+        else:
+            self._create_children(create_element)
+
+    def _create_children(self, create_element):
         self._add_child(create_element(self.get_prop("TableHead"), "TableHead"))
 
         for body in self.get_prop("[TableBody]"):
@@ -33,7 +45,10 @@ class Table(Block):
 
 
 class TableBody(Element):
-    def __init__(self, pan_elem, elem_type, type_def, create_element):
+
+    __slots__ = ()
+
+    def __init__(self, pan_elem, elem_type, type_def, create_element, lazy=False):
         """Constructor
         @param pan_elem(Dict)
             PandocAST Element
@@ -43,8 +58,16 @@ class TableBody(Element):
             Element structur data
         @param create_element(func(pan_elem, elem_type : Element))
             General constructor of pandoc Element types for creating children.
+        @param lazy(Bool)
+            If True, children are created on the first access to them.
         """
         super().__init__(pan_elem, elem_type, type_def)
 
+        if lazy:
+            self._defer_children(partial(self._create_children, create_element))
+        else:
+            self._create_children(create_element)
+
+    def _create_children(self, create_element):
         self._add_child(create_element(self.get_prop("RowHeads"), "TableRowList"))
         self._add_child(create_element(self.get_prop("Rows"), "TableRowList"))
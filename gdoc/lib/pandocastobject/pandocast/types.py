@@ -3,6 +3,7 @@ PandocAst Type definitions.
 """
 
 from .blocklist import BlockList
+from .element import compile_type_defs
 from .inline import Inline
 from .inlinelist import InlineList
 from .pandoc import Pandoc
@@ -147,6 +148,7 @@ _ELEMENT_TYPES = {
         "class": BlockList,
         "content": {"key": "c", "main": 1, "type": None},
         "struct": {"Attr": 0, "[Block]": 1},
+        "new": {"t": "Div", "c": [["", [], []], []]},
     },
     #
     # Inlines
@@ -302,6 +304,7 @@ _ELEMENT_TYPES = {
         "class": Inline,
         "content": {"key": "c", "main": 1, "type": None},
         "struct": {"Attr": 0, "Inlines": 1},
+        "new": {"t": "Span", "c": [["", [], []], []]},
     },
     #
     # OtherTypes
@@ -360,3 +363,5 @@ _ELEMENT_TYPES = {
         },
     },
 }
+
+compile_type_defs(_ELEMENT_TYPES)
@@ -1,8 +1,10 @@
 """
 PandocStr class
 """
+from array import array
+from bisect import bisect_left, bisect_right
 from collections.abc import Sequence
-from typing import Optional, TypeVar, Union
+from typing import Iterator, Optional, TypeVar, Union
 
 from gdoc.util.returntype import ReturnType
 
@@ -18,8 +20,25 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
     Handles text strings and source mapping info in 'Str' inline elements.
     """
 
-    _items: list[dict]
-    _text: str
+    # Items are stored in parallel columns:
+    # the inline element and the start/stop positions in the text of it.
+    # The columns and the text are shared between a PandocStr and its slices,
+    # which are views of a part of them and are copied only when items are added.
+    _elements: list[PandocInlineElement]
+    _starts: array
+    _stops: array
+    # Cumulative lengths of the items to find an item by char index.
+    _ends: array
+    _base_text: str
+    # The part of the columns and the text of self.
+    _vstart: int
+    _vstop: int
+    _first: int
+    _last: int
+    # True if self owns the columns, False if self is a view.
+    _owner: bool
+    _text_cache: Optional[str]
+    _item_dicts: Optional[list[dict]]
     _len: int
 
     def __init__(
@@ -36,14 +55,112 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         """
         if isinstance(items, PandocStr):
             pandocstr = items[start:stop]
-            self._items = pandocstr._items
-            self._text = pandocstr._text
-            self._len = pandocstr._len
+            self._share(pandocstr, pandocstr._vstart, pandocstr._vstop)
 
         else:
-            self._items, self._text, self._len = self._create_items_list(
-                items, start, stop
-            )
+            self._set_columns(*self._create_items_list(items, start, stop))
+
+    def _set_columns(self, elements, starts, stops, text, length) -> None:
+        """
+        Set own columns.
+        """
+        self._elements = elements
+        self._starts = starts
+        self._stops = stops
+        self._ends = self._accumulate(starts, stops, 0)
+        self._base_text = text
+        self._vstart = 0
+        self._vstop = length
+        self._first = 0
+        self._last = len(elements)
+        self._owner = True
+        self._text_cache = text
+        self._item_dicts = None
+        self._len = length
+
+    def _share(self, source: "PandocStr", vstart: int, vstop: int) -> None:
+        """
+        Make self a view of the part of the columns of source.
+
+        @param source (PandocStr) : PandocStr to share the columns with.
+        @param vstart (int) : Start char position in the columns.
+        @param vstop (int) : Stop char position in the columns.
+        """
+        if vstop <= vstart:
+            self._set_columns([], array("i"), array("i"), "", 0)
+            return
+
+        ends: array = source._ends
+        self._elements = source._elements
+        self._starts = source._starts
+        self._stops = source._stops
+        self._ends = ends
+        self._base_text = source._base_text
+        self._vstart = vstart
+        self._vstop = vstop
+        self._first = bisect_right(ends, vstart, source._first, source._last)
+        self._last = bisect_left(ends, vstop, source._first, source._last) + 1
+        self._owner = False
+        self._text_cache = None
+        self._item_dicts = None
+        self._len = vstop - vstart
+
+    def _clip(self, i: int) -> tuple[int, int]:
+        """
+        @param i (int) : index of the item in the columns.
+        @return tuple[int, int] : start/stop positions of the item in the part of self.
+        """
+        begin: int = self._ends[i - 1] if i > 0 else 0
+        return (
+            self._starts[i] + max(0, self._vstart - begin),
+            self._stops[i] - max(0, self._ends[i] - self._vstop),
+        )
+
+    def _get_columns(self) -> tuple[list[PandocInlineElement], array, array]:
+        """
+        @return tuple[list[PandocInlineElement], array, array] :
+            copies of the columns of the part of self.
+        """
+        first: int = self._first
+        last: int = self._last
+        elements: list[PandocInlineElement] = self._elements[first:last]
+        starts: array = self._starts[first:last]
+        stops: array = self._stops[first:last]
+        if len(elements) > 0:
+            starts[0] = self._clip(first)[0]
+            stops[-1] = self._clip(last - 1)[1]
+
+        return elements, starts, stops
+
+    @property
+    def _text(self) -> str:
+        if self._text_cache is None:
+            self._text_cache = self._base_text[self._vstart : self._vstop]
+
+        return self._text_cache
+
+    @property
+    def _items(self) -> list[dict]:
+        """
+        Data objects of the items, made of the columns on the first access.
+        """
+        if self._item_dicts is None:
+            self._item_dicts = []
+            for i in range(self._first, self._last):
+                element: PandocInlineElement = self._elements[i]
+                start, stop = self._clip(i)
+                self._item_dicts.append(
+                    {
+                        "_item": element,
+                        "start": start,
+                        "stop": stop,
+                        "text": element.text[start:stop],
+                        "len": stop - start,
+                        "decoration": 0,
+                    }
+                )
+
+        return self._item_dicts
 
     def add_items(
         self, items: list[PandocInlineElement] = None, start: int = 0, stop: int = None
@@ -56,11 +173,7 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         @param start (int, optional) : Start char postion. Defaults to 0.
         @param stop (int, optional) : Stop char position. Defaults to None.
         """
-        new_items: list[dict]
-        new_text: str
-        new_len: int
-        new_items, new_text, new_len = self._create_items_list(items, start, stop)
-        self._join_items(new_items, new_text, new_len)
+        self._join_items(*self._create_items_list(items, start, stop))
 
     def get_items(self) -> list[dict]:
         """
@@ -68,54 +181,69 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         """
         return self._items
 
+    def _locate(self, index: int) -> tuple[int, int]:
+        """
+        @param index : int
+            index of the target char in self._text
+        @return tuple[int, int] : index of the item in the columns,
+            and of the char in the item.
+            The last item and its length if index is out of the range.
+        """
+        ends: array = self._ends
+        pos: int = self._vstart + index
+        i: int = bisect_right(ends, pos, self._first, self._last)
+
+        if i >= self._last:
+            i = self._last - 1
+            pos = self._vstop  # set to the last
+
+        return i, pos - max(ends[i - 1] if i > 0 else 0, self._vstart)
+
+    @staticmethod
+    def _accumulate(starts: array, stops: array, base: int) -> array:
+        """
+        @return array : cumulative lengths of the items, starting from base.
+        """
+        ends: array = array("i", stops)
+        end: int = base
+        for i in range(len(ends)):
+            end += ends[i] - starts[i]
+            ends[i] = end
+
+        return ends
+
     def get_char_info(self, index: int = 0):
         """
         @param index : int = 0
             index of the target char in self._text
         @return (sourcepos : {path:str, line:int, col:int}, decoration, item)
         """
-        _index: int = index
         sourcepos: Optional[dict] = None
         decoration: int = 0
 
-        item: dict
-        for item in self._items:
-            if _index >= item["len"]:
-                _index -= item["len"]
-            else:
-                break
-        else:
-            _index = item["len"]  # set to the last
+        i, _index = self._locate(index)
 
-        datapos: DataPos = item["_item"].get_data_pos()
+        datapos: DataPos = self._elements[i].get_data_pos()
 
         if datapos is not None:
             sourcepos = {
                 "path": datapos.path,
                 "line": datapos.start.ln,
-                "col": datapos.start.col + item["start"] + _index,
+                "col": datapos.start.col + self._clip(i)[0] + _index,
             }
 
         else:
             sourcepos = {"path": "[Source pos not found]", "line": 0, "col": 0}
 
-        return sourcepos, decoration, item
+        return sourcepos, decoration, self._items[i - self._first]
 
     def get_char_pos(self, index: int = 0) -> Optional[DataPos]:
         result: Optional[DataPos] = None
         element: PandocInlineElement
-        item: dict
 
-        _index: int = index
-        for item in self._items:
-            if _index >= item["len"]:
-                _index -= item["len"]
-            else:
-                break
-        else:
-            _index = item["len"]  # set to the last
+        i, _index = self._locate(index)
 
-        element = item["_item"]
+        element = self._elements[i]
         datapos: DataPos = element.get_data_pos()
         if datapos is not None:
             text_len: int = len(element.text)
@@ -128,10 +256,11 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
             elif (text_len > 1) and (_index < text_len):
                 # A character in a Str.
                 # _index doesn't point its last.
+                col: int = datapos.start.col + self._clip(i)[0] + _index
                 result = DataPos(
                     datapos.path,
-                    Pos(datapos.start.ln, datapos.start.col + item["start"] + _index),
-                    Pos(datapos.start.ln, datapos.start.col + item["start"] + _index + 1),
+                    Pos(datapos.start.ln, col),
+                    Pos(datapos.start.ln, col + 1),
                 )
 
             else:
@@ -142,9 +271,9 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
 
     def _create_items_list(
         self, items: list[PandocInlineElement] = None, start: int = 0, stop: int = None
-    ) -> tuple[list[dict], str, int]:  # (new_items, new_text, new_len)
+    ) -> tuple[list[PandocInlineElement], array, array, str, int]:
         """
-        Create items list from pandoc inline elements with start/stop pos.
+        Create items columns from pandoc inline elements with start/stop pos.
 
         @param items (list[PandocInlineElement], optional) : Pandoc Inline Elements.
                                                              Defaults to None.
@@ -153,34 +282,31 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
 
         @exception TypeError : Invalid item type
 
-        @return tuple[list[dict], str, int] : items list, entire_text, text_length
+        @return tuple[list[PandocInlineElement], array, array, str, int] :
+            elements, start positions, stop positions, entire_text, text_length
         """
-        new_items: list[dict] = []
-        new_text: str = ""
-        new_len: int = 0
+        new_elements: list[PandocInlineElement] = []
+        new_starts: array = array("i")
+        new_stops: array = array("i")
 
         if items is None or len(items) == 0:
-            return (new_items, new_text, new_len)
+            return (new_elements, new_starts, new_stops, "", 0)
 
         #
-        # Create new items list
+        # Create new items columns
         #
+        texts: list[str] = []
         total_length: int = 0
         inline_element: PandocInlineElement
         for inline_element in items:
             if inline_element.get_type() in _ALLOWED_TYPES_:
-                if len(inline_element.text) > 0:
-                    new_items.append(
-                        {
-                            "_item": inline_element,
-                            "start": 0,
-                            "stop": len(inline_element.text),
-                            "text": inline_element.text,
-                            "len": len(inline_element.text),
-                            "decoration": 0,
-                        }
-                    )
-                    total_length += len(inline_element.text)
+                text: str = inline_element.text
+                if len(text) > 0:
+                    new_elements.append(inline_element)
+                    new_starts.append(0)
+                    new_stops.append(len(text))
+                    texts.append(text)
+                    total_length += len(text)
 
             else:
                 # raise error
@@ -193,55 +319,47 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         _start: int
         _stop: int
         _start, _stop = self._normalize_pos_vals(start, stop, total_length)
+        new_text: str = "".join(texts)[_start:_stop]
+        new_len: int = _stop - _start
         trailing_str_len: int = total_length - _stop
-        new_len = _stop - _start
 
         #
         # Remove unneeded items
         #
+        first: int = 0
+        last: int = len(new_elements)
         length: int
 
         # 1) Leading items
         while _start > 0:
-            length = new_items[0]["len"]
+            length = new_stops[first]
 
             if length <= _start:
-                del new_items[0]
+                first += 1
                 _start -= length
 
             else:
-                new_items[0]["start"] = _start
-                new_items[0]["len"] -= _start
-                new_items[0]["text"] = new_items[0]["text"][_start:]
-                # The above line is same as:
-                # new_items[0]["text"] = new_items[0]["_item"].text[
-                #     new_items[0]["start"] : new_items[0]["stop"]
-                # ]
+                new_starts[first] = _start
                 break
 
         # 2) Trailing items
         while trailing_str_len > 0:
-            if new_items[-1]["len"] <= trailing_str_len:
-                trailing_str_len -= new_items[-1]["len"]
-                del new_items[-1]
+            length = new_stops[last - 1] - new_starts[last - 1]
+
+            if length <= trailing_str_len:
+                trailing_str_len -= length
+                last -= 1
 
             else:
-                length = len(new_items[-1]["_item"].text)
-                new_items[-1]["stop"] = length - trailing_str_len
-                new_items[-1]["len"] -= trailing_str_len
-                new_items[-1]["text"] = new_items[-1]["_item"].text[
-                    new_items[-1]["start"] : new_items[-1]["stop"]
-                ]
+                new_stops[last - 1] -= trailing_str_len
                 break
 
-        #
-        # Create entire string
-        #
-        itme: dict
-        for item in new_items:
-            new_text += item["text"]
+        if (first > 0) or (last < len(new_elements)):
+            new_elements = new_elements[first:last]
+            new_starts = new_starts[first:last]
+            new_stops = new_stops[first:last]
 
-        return (new_items, new_text, new_len)
+        return (new_elements, new_starts, new_stops, new_text, new_len)
 
     def _normalize_pos_vals(
         self, start: int, stop: Optional[int], total_length: int
@@ -270,41 +388,45 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
 
         return _start, _stop
 
-    def _join_items(self, new_items, new_text, new_len):
+    def _join_items(self, new_elements, new_starts, new_stops, new_text, new_len):
         """
-        @param items : [Str] | None
-            PandocAST items to be added.
-        @param start : int = 0
-            start char pos in the str items.
-        @param stop : int | None = None
-            stop char pos in the str items.
-        @return output : PandocStr
+        Join items columns to the existing columns.
+
+        @param new_elements : list[PandocInlineElement]
+        @param new_starts : array
+            start char pos in the elements.
+        @param new_stops : array
+            stop char pos in the elements.
+        @param new_text : str
+        @param new_len : int
         """
+        if not self._owner:
+            self._set_columns(*self._get_columns(), self._text, self._len)
 
-        #
-        # Join new list to existing lit.
-        #
+        first: int = 0
         if (
             ((self._len > 0) and (new_len > 0))
-            and (self._items[-1]["_item"] is new_items[0]["_item"])
-            and (self._items[-1]["stop"] == new_items[0]["start"])
+            and (self._elements[-1] is new_elements[0])
+            and (self._stops[-1] == new_starts[0])
         ):
-
             # Merge them
-            # "_item": item,            <- same
-            # "start" : 0,              <- same
-            # "stop": len(item.text),   <- replace
-            # "text": item.text,        <- add
-            # "len": len(item.text),    <- add
-            # "decoration": 0           <- same
-            self._items[-1]["stop"] = new_items[0]["stop"]
-            self._items[-1]["len"] += new_items[0]["len"]
-            self._items[-1]["text"] += new_items[0]["text"]
-            del new_items[0]
-
-        self._items += new_items
-        self._text += new_text
+            self._stops[-1] = new_stops[0]
+            self._ends[-1] += new_stops[0] - new_starts[0]
+            first = 1
+
+        self._ends += self._accumulate(
+            new_starts[first:], new_stops[first:], self._ends[-1] if self._ends else 0
+        )
+
+        self._elements += new_elements[first:]
+        self._starts += new_starts[first:]
+        self._stops += new_stops[first:]
+        self._base_text += new_text
         self._len += new_len
+        self._vstop = self._len
+        self._last = len(self._elements)
+        self._text_cache = self._base_text
+        self._item_dicts = None
 
     ##############
     #
@@ -403,6 +525,18 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         """
         return self._len
 
+    def __iter__(self: PANDOCSTR) -> Iterator[PANDOCSTR]:
+        """
+        Implement iter(self).
+
+        The chars are made as views of self without the range checks of self[i].
+        """
+        returntype = self.__class__._returntype_
+        for pos in range(self._vstart, self._vstop):
+            char: PANDOCSTR = returntype.__new__(returntype)
+            char._share(self, pos, pos + 1)
+            yield char
+
     def __getitem__(self: PANDOCSTR, key: int | slice) -> PANDOCSTR:
         """
         Return self[key].
@@ -425,33 +559,11 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         # 2. Create empty pandocstr/subclass
         new_pandoc_str = self.__class__._returntype_()
 
-        # 3. Add all each items with start/stop info.
+        # 3. Share the columns of the part
         if length > 0:
-            # 3.1. move to start point
-            for item in self._items:  # pragma: no branch: This line never complete.
-                if start < item["len"]:
-                    break
-                else:
-                    start -= item["len"]
-                    continue
-
-            # 3.2. add items for length
-            for item in self._items[self._items.index(item) :]:  # pragma: no branch
-                # This line never complete.
-                _start = item["start"] + start
-
-                if start + length < item["len"]:
-                    _stop = _start + length
-                else:
-                    _stop = item["stop"]
-
-                length -= item["len"] - start
-                start = 0
-
-                new_pandoc_str.add_items([item["_item"]], _start, _stop)
-
-                if length <= 0:
-                    break
+            new_pandoc_str._share(
+                self, self._vstart + start, self._vstart + start + length
+            )
 
         # 4. Return the new pandocstr
         return new_pandoc_str
@@ -514,9 +626,8 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         new_pandoc_str: PANDOCSTR
 
         if isinstance(value, PandocStr):
-            opr_str: PANDOCSTR = value[:]
             new_pandoc_str = self[:]
-            new_pandoc_str._join_items(opr_str._items, opr_str._text, opr_str._len)
+            new_pandoc_str.extend(value)
 
         else:
             raise TypeError(
@@ -537,9 +648,8 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
         new_pandoc_str: PANDOCSTR
 
         if isinstance(value, PandocStr):
-            opr_str = self[:]
             new_pandoc_str = value[:]
-            new_pandoc_str._join_items(opr_str._items, opr_str._text, opr_str._len)
+            new_pandoc_str.extend(self)
 
         else:
             raise TypeError(
@@ -550,6 +660,19 @@ class PandocStr(Sequence, ReturnType, ret_subclass=True):
 
         return new_pandoc_str
 
+    def extend(self, value: "PandocStr") -> None:
+        """
+        Join the items of value to the end of self.
+
+        @param value (PandocStr) :
+        """
+        if self._len == 0:
+            # Share the columns of value instead of copying them.
+            self._share(value, value._vstart, value._vstop)
+
+        elif value._len > 0:
+            self._join_items(*value._get_columns(), value._text, value._len)
+
     def count(self, sub, start: int = 0, end: int = None) -> int:
         """
         S.count(sub[, start[, end]]) -> int
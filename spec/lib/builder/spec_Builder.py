@@ -0,0 +1,99 @@
+r"""
+# `gdoc::lib::builder::Builder` class Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import pytest
+
+from gdoc.lib.builder.builder import Builder
+from gdoc.lib.pandocastobject.pandoc import Pandoc
+from gdoc.util import ErrorReport, Settings
+
+
+def _para(text: str) -> dict:
+    inlines: list = []
+    for word in text.split(" "):
+        if inlines:
+            inlines.append({"t": "Space"})
+        inlines.append({"t": "Str", "c": word})
+    return {"t": "Para", "c": inlines}
+
+
+def _get_json(self, filepath, fileformat=None, via_html=None, filedata=None):
+    with open(filepath, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    return {
+        "pandoc-api-version": [1, 22, 2, 1],
+        "meta": {},
+        "blocks": [_para(line) for line in lines],
+    }
+
+
+@pytest.fixture
+def _package(tmp_path, monkeypatch):
+    monkeypatch.setattr(Pandoc, "get_json", _get_json)
+    (tmp_path / "sub").mkdir()
+    for name, text in {
+        "a.md": "[@ A1] name\n[@ A1] duplicated",
+        "b.md": "[@ B1] name",
+        "sub/c.md": "[@ C1 X] too many args\n[@ C2] name",
+        "d.md": "[@ D1] name",
+    }.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+class Spec_build:
+    r"""
+    ## [\@spec] `build`
+
+    ```py
+    def build(
+        self, uristr: str, erpt: ErrorReport, opts: Settings | None = None
+    ) -> Result[Package, ErrorReport]:
+    ```
+    """
+
+    @pytest.mark.parametrize("cont", [True, False])
+    def spec_1(self, _package, cont):
+        r"""
+        ### [\@case 1] Parallel builds report the same as the serial build.
+        """
+        # GIVEN
+        uristr = str(_package)
+        results = []
+        # WHEN
+        for jobs in (1, 3):
+            erpt = ErrorReport(cont=cont, filename=uristr)
+            opts = Settings({"builder": {"jobs": jobs}})
+            package, e = Builder(opts).build(uristr, erpt=erpt, opts=opts)
+            results.append(
+                (
+                    list(package.documents.keys()) if package else None,
+                    e.dump(True) if e else None,
+                )
+            )
+        # THEN
+        assert results[0] == results[1]
+        assert results[0][1] is not None
+
+    def spec_2(self, _package):
+        r"""
+        ### [\@case 2] Documents are added in the sorted order of file paths.
+        """
+        # GIVEN
+        uristr = str(_package)
+        erpt = ErrorReport(cont=True, filename=uristr)
+        opts = Settings({"builder": {"jobs": 2}})
+        # WHEN
+        package, _ = Builder(opts).build(uristr, erpt=erpt, opts=opts)
+        # THEN
+        assert [uri.removeprefix(uristr) for uri in package.documents] == [
+            "/a.md",
+            "/b.md",
+            "/d.md",
+            "/sub/c.md",
+        ]
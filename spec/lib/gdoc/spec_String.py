@@ -6,6 +6,7 @@ r"""
 ## ADDITIONAL STRUCTURE
 
 """
+import copy
 from typing import cast
 
 import pytest
@@ -124,6 +125,65 @@ class Spec___init__:
         # THEN
         assert charpos == DataPos.loadd(["FILEPATH", 5, 6, 5, 7])
 
+    def spec_7(self):
+        r"""
+        ### [\@case 7] A str is built into a Str in a Span having the `dpos`.
+        """
+        # GIVEN
+        DATA_POS = DataPos.loadd(["FILEPATH", 5, 2, 5, 10])
+        # WHEN
+        target = String("TESTDATA", dpos=DATA_POS)
+        # THEN
+        element = target.get_char_info(0)[2]["_item"]
+        assert element.pan_element == {"t": "Str", "c": "TESTDATA"}
+        assert element.get_parent().pan_element == {
+            "t": "Span",
+            "c": [
+                ["", [], [["data-pos", "FILEPATH@5:2-5:10"]]],
+                [{"t": "Str", "c": "TESTDATA"}],
+            ],
+        }
+        assert element.get_parent().get_first_child() is element
+
+    def spec_8(self, mocker):
+        r"""
+        ### [\@case 8] A str is built without copying and re-creating elements.
+
+        The result is the same as of building a Span and a Str from deep copies
+        of their templates and creating them again from the json.
+        """
+
+        # GIVEN
+        def create_from_templates(text: str) -> String:
+            str_elem = PandocAst.create_element(
+                copy.deepcopy({"t": "Str", "c": ""}), "Str"
+            )
+            str_elem.set_content(text)
+            span_elem = PandocAst.create_element(
+                copy.deepcopy({"t": "Span", "c": [["", [], []], []]}), "Span"
+            )
+            span_elem.set_content([str_elem.pan_element])
+            span_elem = PandocAst.create_element(span_elem.pan_element, "Span")
+            return String([span_elem.get_first_child()])
+
+        expected = create_from_templates("TESTDATA")
+        spy_create = mocker.spy(PandocAst, "create_element")
+        spy_deepcopy = mocker.spy(copy, "deepcopy")
+        # WHEN
+        target1 = String("TESTDATA")
+        target2 = String("TESTDATA")
+        # THEN
+        assert spy_create.call_count == 0
+        assert spy_deepcopy.call_count == 0
+        assert target1 == expected
+        element1 = target1.get_char_info(0)[2]["_item"]
+        element2 = target2.get_char_info(0)[2]["_item"]
+        assert element1.get_parent().pan_element == (
+            expected.get_char_info(0)[2]["_item"].get_parent().pan_element
+        )
+        assert element1.pan_element is not element2.pan_element
+        assert element1.get_parent().pan_element is not element2.get_parent().pan_element
+
 
 class Spec_get_str:
     r"""
@@ -426,6 +486,53 @@ class Spec_loadd:
             assert exc_info.match(expected["Exception"][1])
 
 
+class Spec_from_runs:
+    r"""
+    ## [\@spec] `get_runs` and `from_runs`
+
+    ```py
+    def get_runs(self) -> list[tuple[int, Optional[DataPos]]]:
+    def from_runs(cls, text: str, runs: list[tuple[int, Optional[DataPos]]]) -> String:
+    ```
+    """
+
+    def spec_1(self):
+        r"""
+        ### [\@spec 1] Returns a String made of the runs.
+        """
+        # GIVEN
+        data = [
+            "s",
+            [[2, None], [3, ["FILEPATH", 6, 2, 6, 5]], [4, ["FILEPATH", 7, 1, 7, 5]]],
+            "ABCDEFGHI",
+        ]
+        runs = String.loadd(data).get_runs()
+        assert [(length, dpos and dpos.dumpd()) for length, dpos in runs] == [
+            (2, None),
+            (3, ["FILEPATH", 6, 2, 6, 5]),
+            (4, ["FILEPATH", 7, 1, 7, 5]),
+        ]
+
+        # WHEN
+        target = String.from_runs("ABCDEFGHI", runs)
+
+        # THEN
+        assert target.dumpd() == data
+        assert len(target.get_items()) == 3
+
+    def spec_2(self):
+        r"""
+        ### [\@spec 2] Raises RuntimeError if the runs don't match the text.
+        """
+        with pytest.raises(RuntimeError) as exc_info:
+            String.from_runs("ABC", [(4, None)])
+        assert exc_info.match("invalid data")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            String.from_runs("ABC", [(2, None)])
+        assert exc_info.match("invalid data")
+
+
 class Spec_get_char_pos:
     r"""
     ## [\@spec] `get_char_pos`
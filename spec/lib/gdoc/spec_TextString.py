@@ -321,6 +321,42 @@ class Spec_get_str:
         assert target.get_str() == expected
         assert str(target) == expected
 
+    def spec_2(self):
+        r"""
+        ### [\@spec 2] The flattened str is cached and made again after changes.
+        """
+        # GIVEN
+        child = TextString.loadd(["T", [["s", [[3, None]], "DEF"]]])
+        target = TextString.loadd(["T", [["s", [[3, None]], "ABC"], ["c", "CODE"]]])
+        target.append(child)
+        # WHEN
+        first = target.get_str()
+        # THEN
+        assert first == "ABCCODEDEF"
+        assert target.get_str() is first
+        assert target._get_text_by_charindex(8) == (child[1], 0)
+
+        # WHEN: a child is changed
+        child.append(String("GH"))
+        # THEN
+        assert target.get_str() == "ABCCODEDEFGH"
+        assert target._get_text_by_charindex(11) == (child[4], 0)
+        assert target._get_text_by_charindex(12) == (None, 0)
+
+        # WHEN: self is changed
+        target.pop_prefix("AB")
+        # THEN
+        assert target.get_str() == "CCODEDEFGH"
+        assert target.startswith("C")
+        assert not target.startswith("CC")
+        assert not target.endswith("H")
+        target.append(String("XY"))
+        assert target.endswith("GHXY") is False
+        assert target.endswith("XY")
+
+        target.clear()
+        assert target.get_str() == ""
+
 
 class Spec_get_char_pos:
     r"""
@@ -2700,6 +2736,122 @@ class Spec_split:
 
         assert result == expected
 
+    def spec_2(self):
+        r"""
+        ### [\@spec 2] Items are shared with the results, and `Code`s are not split.
+        """
+        # GIVEN
+        target = TextString.loadd(
+            ["T", [["s", [[3, None]], "A,B"], ["c", "C,D"], ["s", [[3, None]], "E,F"]]]
+        )
+        items = target.get_text_items()
+
+        # WHEN
+        parts = target.split(",", retsep=True)
+
+        # THEN
+        assert [p.get_str() for p in parts] == ["A", ",", "BC,DE", ",", "F"]
+        assert parts[2].get_text_items() == items[2:5]
+        assert parts[2][1] is items[3]
+
+
+class Spec_find:
+    r"""
+    ## [\@spec] `find`
+
+    ```py
+    def find(self, sub: str, start: int | None = None, end: int | None = None) -> int:
+    ```
+    """
+
+    @staticmethod
+    def cases_1():
+        r"""
+        ### [\@ 1] Returns the index of the item where sub is found.
+        """
+        return {
+            ##
+            # #### [\@case 1] Found in `String`s
+            #
+            "String(1/)": (
+                # precondition
+                ["T", [["s", [[5, None]], "ABCDE"]]],
+                # stimulus
+                ("CD",),
+                # expected
+                2,
+            ),
+            "String(2/)": (
+                # precondition
+                ["T", [["c", "CODE"], ["s", [[5, None]], "ABCDE"]]],
+                # stimulus
+                ("CD",),
+                # expected
+                3,
+            ),
+            "String(3/)": (
+                # precondition
+                [
+                    "T",
+                    [["s", [[2, None]], "AB"], ["c", "CODE"], ["s", [[3, None]], "CDE"]],
+                ],
+                # stimulus
+                ("DE", 1),
+                # expected
+                4,
+            ),
+            ##
+            # #### [\@case 2] Not found
+            #
+            "NotFound(1/)": (
+                # precondition
+                [
+                    "T",
+                    [["s", [[2, None]], "AB"], ["c", "CODE"], ["s", [[3, None]], "CDE"]],
+                ],
+                # stimulus
+                ("OD",),
+                # expected
+                -1,
+            ),
+            "NotFound(2/)": (
+                # precondition
+                ["T", [["s", [[2, None]], "AB"], ["s", [[3, None]], "CDE"]]],
+                # stimulus
+                ("BC", 0, 1),
+                # expected
+                -1,
+            ),
+            "NotFound(3/)": (
+                # precondition
+                ["T", []],
+                # stimulus
+                ("",),
+                # expected
+                0,
+            ),
+        }
+
+    # \cond
+    @pytest.mark.parametrize(
+        "precondition, stimulus, expected",
+        list(cases_1().values()),
+        ids=list(cases_1().keys()),
+    )
+    # \endcond
+    def spec_1(self, precondition, stimulus, expected):
+        r"""
+        ### [\@spec 1]
+        """
+        # GIVEN
+        target = TextString.loadd(precondition)
+
+        # WHEN
+        result = target.find(*stimulus)
+
+        # THEN
+        assert result == expected
+
 
 class xSpec_TEMPLATE:
     r"""
@@ -0,0 +1,204 @@
+r"""
+# `gdoc::lib::gdoc::binarycodec` module Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import json
+
+import pytest
+
+from gdoc.lib.gdoc import DataPos, Gdoc, Pos, TextBlock, TextString
+from gdoc.lib.gdoc.binarycodec import MAGIC, dumpb, loadb
+from gdoc.lib.gdoc.inlinetag import InlineTag
+
+
+class Spec_dumpb_loadb:
+    r"""
+    ## [\@spec] `dumpb` and `loadb`
+
+    ```py
+    def dumpb(obj: Union[Text, TextBlock, DataPos]) -> bytes:
+    def loadb(data: bytes, loadd=None, opts=None) -> Union[Text, TextBlock, DataPos]:
+    ```
+    """
+
+    @staticmethod
+    def cases_1():
+        r"""
+        ### [\@ 1] Loads the same data as dumped.
+        """
+        return {
+            ##
+            # #### [\@case 1] Inline texts
+            #
+            "String(1/)": (["s", "CONTENTS"], "String"),
+            "String(2/)": (["s", [[8, ["FILEPATH", 5, 2, 5, 10]]], "CONTENTS"], "String"),
+            "String(3/)": (
+                [
+                    "s",
+                    [[8, None], [3, ["FILEPATH", 6, 2, 6, 5]], [2, ["PATH", 1, 1, 1, 3]]],
+                    "ABCDEFGHIJKLM",
+                ],
+                "String",
+            ),
+            "Code(1/)": (["c", "CODE"], "Code"),
+            "Code(2/)": (["c", ["FILEPATH", 5, 2, 5, 10], "CODE"], "Code"),
+            ##
+            # #### [\@case 2] TextStrings
+            #
+            "TextString(1/)": (["T", []], "TextString"),
+            "TextString(2/)": (
+                [
+                    "T",
+                    [
+                        ["s", [[3, ["FILEPATH", 1, 1, 1, 4]]], "ABC"],
+                        ["c", ["FILEPATH", 1, 4, 1, 10], "CODE"],
+                        ["T", [["s", [[6, None]], "STRING"]]],
+                    ],
+                ],
+                "TextString",
+            ),
+            "Quoted(1/)": (["Q", [["s", '"AB'], ["c", '"'], ["s", 'CD"']]], "Quoted"),
+            "Parenthesized(1/)": (
+                ["P", [["s", "[AB"], ["c", '"'], ["s", "CD]"]]],
+                "Parenthesized",
+            ),
+            ##
+            # #### [\@case 3] TextBlock
+            #
+            "TextBlock(1/)": (
+                [
+                    "TextBlock",
+                    [
+                        ["T", [["s", [[3, ["FILEPATH", 1, 1, 1, 4]]], "ABC"]]],
+                        ["T", [["s", [[3, ["FILEPATH", 2, 1, 2, 4]]], "DEF"]]],
+                    ],
+                ],
+                "TextBlock",
+            ),
+        }
+
+    # \cond
+    @pytest.mark.parametrize(
+        "precondition, expected",
+        list(cases_1().values()),
+        ids=list(cases_1().keys()),
+    )
+    # \endcond
+    def spec_1(self, precondition, expected):
+        r"""
+        ### [\@spec 1]
+        """
+        # GIVEN
+        target = (
+            TextBlock.loadd(precondition)
+            if precondition[0] == "TextBlock"
+            else Gdoc.loadd(precondition)
+        )
+
+        # WHEN
+        data = dumpb(target)
+        result = loadb(data)
+
+        # THEN
+        assert type(result).__name__ == expected
+        assert result.dumpd() == target.dumpd()
+
+    def spec_2(self):
+        r"""
+        ### [\@spec 2] DataPos is stored as difference from the previous one.
+        """
+        # GIVEN
+        target = DataPos("FILEPATH", Pos(10, 5), Pos(10, 20))
+
+        # WHEN
+        data = dumpb(target)
+
+        # THEN
+        assert loadb(data) == target
+        # magic, path table, tag, flags, path id and 4 varints
+        assert len(data) == len(MAGIC) + 10 + 3 + 4
+
+        # GIVEN: continued positions
+        textstr = TextString.loadd(
+            [
+                "T",
+                [
+                    ["s", [[3, ["FILEPATH", 1, 1, 1, 4]]], "ABC"],
+                    ["c", ["FILEPATH", 1, 4, 1, 10], "CODE"],
+                ],
+            ]
+        )
+
+        # WHEN
+        data = dumpb(textstr)
+
+        # THEN
+        assert loadb(data).dumpd() == textstr.dumpd()
+        # The path is stored once, and the position of "c" takes 3 bytes.
+        assert data.count(b"FILEPATH") == 1
+        assert data.endswith(b"\x07\x00\x0c\x04CODE")
+
+    def spec_3(self):
+        r"""
+        ### [\@spec 3] Other Texts are loaded by the given loadd.
+        """
+        # GIVEN
+        tag = InlineTag(None, [], [], TextString.loadd(["T", [["s", "[@A]"]]]))
+        target = TextString([tag])
+
+        def loadd(data, opts):
+            assert data == tag.dumpd()
+            return TextString.loadd(["T", data[-1]])
+
+        # WHEN
+        data = dumpb(target)
+
+        # THEN
+        assert loadb(data, loadd).get_str() == "[@A]"
+
+        with pytest.raises(TypeError) as exc_info:
+            loadb(data)
+        assert exc_info.match("invalid data type")
+
+    def spec_4(self):
+        r"""
+        ### [\@spec 4] Invalid data raises an exception.
+        """
+        data = dumpb(TextString.loadd(["T", [["s", "ABC"]]]))
+
+        with pytest.raises(TypeError) as exc_info:
+            loadb(b"XXXX" + data[len(MAGIC) :])
+        assert exc_info.match("invalid data type")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            loadb(data[:-1])
+        assert exc_info.match("invalid data")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            loadb(data + b"\x00")
+        assert exc_info.match("invalid data")
+
+    def spec_5(self):
+        r"""
+        ### [\@spec 5] The data is a fraction of the size of the json.
+        """
+        # GIVEN
+        texts = []
+        for ln in range(1, 21):
+            texts += [
+                ["s", [[5, ["docs/FILEPATH.md", ln, 1, ln, 6]]], "Lorem"],
+                ["c", ["docs/FILEPATH.md", ln, 7, ln, 14], "ipsum"],
+                ["s", [[6, ["docs/FILEPATH.md", ln, 14, ln, 20]]], " dolor"],
+            ]
+        target = TextString.loadd(["T", texts])
+
+        # WHEN
+        data = dumpb(target)
+
+        # THEN
+        assert loadb(data).dumpd() == target.dumpd()
+        assert len(data) * 3 < len(json.dumps(target.dumpd(), separators=(",", ":")))
@@ -9,6 +9,8 @@ r"""
 ## ADDITIONAL STRUCTOR
 
 """
+import sys
+
 import pytest
 
 from gdoc.lib.gobj.node import Node
@@ -1379,3 +1381,117 @@ class Spec_resolve:
             assert target is TARGET
         else:
             assert target is None
+
+
+def _tree() -> Node:
+    root = Node("ROOT")
+    first = Node("FIRST")
+    first.add_child(Node("CHILD"))
+    root.add_child(first)
+    root.add_child(Node("SECOND"))
+    return root
+
+
+class Spec_walk:
+    r"""
+    ## [\@spec] `walk`
+
+    ```py
+    def walk(
+        self,
+        action: Callable[["Node", "Node"], None],
+        post_action: Callable[["Node", "Node"], None] | None = None,
+        root: Union["Node", None] = None,
+    ):
+    ```
+    """
+
+    def spec_1(self, mocker):
+        r"""
+        ### [\@case 1] Calls action and post_action for each local nodes with the root.
+        """
+        # GIVEN
+        target = _tree()
+        action = mocker.Mock()
+        # WHEN
+        target.walk(
+            lambda n, r: action("pre", n.name, r), lambda n, r: action("post", n.name, r)
+        )
+        # THEN
+        assert [c.args[:2] for c in action.call_args_list] == [
+            ("pre", "ROOT"),
+            ("pre", "FIRST"),
+            ("pre", "CHILD"),
+            ("post", "CHILD"),
+            ("post", "FIRST"),
+            ("pre", "SECOND"),
+            ("post", "SECOND"),
+            ("post", "ROOT"),
+        ]
+        assert {c.args[2] for c in action.call_args_list} == {target}
+
+    def spec_2(self, mocker):
+        r"""
+        ### [\@case 2] Doesn't hit the recursion limit on deeply nested trees.
+        """
+        # GIVEN
+        target = node = Node("ROOT")
+        for i in range(sys.getrecursionlimit() * 2):
+            child = Node(f"N{i}")
+            node.add_child(child)
+            node = child
+        action = mocker.Mock()
+        # WHEN
+        target.walk(action)
+        # THEN
+        assert action.call_count == sys.getrecursionlimit() * 2 + 1
+
+
+class Spec_iter_preorder:
+    r"""
+    ## [\@spec] `iter_preorder`
+
+    ```py
+    def iter_preorder(
+        self, prune: Callable[["Node"], bool] | None = None
+    ) -> Iterator["Node"]:
+    ```
+    """
+
+    def spec_1(self):
+        r"""
+        ### [\@case 1] Yields local nodes in the same order as walk().
+        """
+        # GIVEN
+        target = _tree()
+        # WHEN
+        names = [node.name for node in target.iter_preorder()]
+        # THEN
+        assert names == ["ROOT", "FIRST", "CHILD", "SECOND"]
+
+    def spec_2(self):
+        r"""
+        ### [\@case 2] Doesn't visit children of the pruned nodes.
+        """
+        # GIVEN
+        target = _tree()
+        # WHEN
+        names = [node.name for node in target.iter_preorder(lambda n: n.name == "FIRST")]
+        # THEN
+        assert names == ["ROOT", "FIRST", "SECOND"]
+
+    def spec_3(self):
+        r"""
+        ### [\@case 3] Doesn't hit the recursion limit on deeply nested trees.
+        """
+        # GIVEN
+        target = node = Node("ROOT")
+        for i in range(sys.getrecursionlimit() * 2):
+            child = Node(f"N{i}")
+            node.add_child(child)
+            node = child
+        # WHEN
+        nodes = list(target.iter_preorder())
+        # THEN
+        assert len(nodes) == sys.getrecursionlimit() * 2 + 1
+        assert nodes[-1] is node
@@ -0,0 +1,265 @@
+r"""
+# `gdoc::lib::pandocastobject::pandoc::MarkdownReader` class Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import asyncio
+
+import pytest
+
+from gdoc.lib.gdoccompiler.gdcompiler.gdcompiler import GdocCompiler
+from gdoc.lib.pandocastobject.pandoc import MarkdownReader
+from gdoc.lib.pandocastobject.pandocast import DataPos, PandocAst, Pos
+from gdoc.lib.pandocastobject.pandocstr import PandocStr
+from gdoc.lib.plugins import std
+
+
+def _get_blocks(text: str, fileformat: str = "gfm") -> list:
+    return MarkdownReader().get_json("doc.md", fileformat, False, text)["blocks"]
+
+
+def _get_pos(elem) -> str:
+    return dict(elem["c"][0][2])["data-pos"]
+
+
+class Spec_get_json:
+    r"""
+    ## [\@spec] `get_json`
+
+    ```py
+    def get_json(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+    ```
+    """
+
+    def spec_1(self, tmp_path):
+        r"""
+        ### [\@case 1] 'data-pos' has the file path when it reads the file.
+        """
+        # GIVEN
+        source = tmp_path / "doc.md"
+        source.write_text("TEXT\n", encoding="utf-8")
+        # WHEN
+        blocks = MarkdownReader().get_json(str(source))["blocks"]
+        # THEN
+        assert _get_pos(blocks[0]) == f"{source}@1:1-2:1"
+        assert _get_pos(blocks[0]["c"][1][0]["c"][0]) == f"{source}@1:1-1:5"
+
+    def spec_2(self):
+        r"""
+        ### [\@case 2] Header, CodeBlock and Table have 'data-pos' in themselves.
+        """
+        # GIVEN
+        text = "# TITLE\n\n```py\nCODE\n```\n\n| A |\n|---|\n| 1 |\n\nTEXT\n"
+        # WHEN
+        blocks = _get_blocks(text)
+        # THEN
+        assert [b["t"] for b in blocks] == ["Header", "CodeBlock", "Table", "Div"]
+        assert blocks[0]["c"][1] == ["title", [], [["data-pos", "1:1-2:1"]]]
+        assert blocks[1]["c"] == [["", ["py"], [["data-pos", "3:1-6:1"]]], "CODE"]
+        assert _get_pos(blocks[2]) == "7:1-10:1"
+        assert blocks[3]["c"][1][0]["t"] == "Para"
+
+    def spec_3(self):
+        r"""
+        ### [\@case 3] Inlines are wrapped in Spans with 'data-pos'.
+        """
+        # GIVEN
+        text = "ABC\nDEF \\\nGHI  \nJKL<br>MNO\n"
+        # WHEN
+        para = _get_blocks(text)[0]["c"][1][0]
+        # THEN
+        assert [(_get_pos(span), span["c"][1][0]["t"]) for span in para["c"]] == [
+            ("1:1-1:4", "Str"),
+            ("", "SoftBreak"),
+            ("2:1-2:4", "Str"),
+            ("2:4-2:5", "Space"),
+            ("2:5-2:6", "LineBreak"),
+            ("3:1-3:4", "Str"),
+            ("3:4-3:6", "LineBreak"),
+            ("4:1-4:4", "Str"),
+            ("4:4-4:8", "RawInline"),
+            ("4:8-4:11", "Str"),
+        ]
+
+    def spec_4(self):
+        r"""
+        ### [\@case 4] Code and Link have 'data-pos' in themselves.
+        """
+        # GIVEN
+        text = "`CODE` [LINK](url)\n"
+        # WHEN
+        para = _get_blocks(text)[0]["c"][1][0]
+        # THEN
+        assert para["c"][0] == {
+            "t": "Code",
+            "c": [["", [], [["data-pos", "1:1-1:7"]]], "CODE"],
+        }
+        assert para["c"][2]["t"] == "Link"
+        assert _get_pos(para["c"][2]) == "1:8-1:19"
+        assert para["c"][2]["c"][2] == ["url", ""]
+
+    def spec_5(self):
+        r"""
+        ### [\@case 5] Emphasis is nested in the Span of its delimiters.
+        """
+        # GIVEN
+        text = "***A** B*\n"
+        # WHEN
+        span = _get_blocks(text)[0]["c"][1][0]["c"][0]
+        # THEN
+        assert _get_pos(span) == "1:1-1:10"
+        emph = span["c"][1][0]
+        assert emph["t"] == "Emph"
+        assert _get_pos(emph["c"][0]) == "1:2-1:7"
+        assert emph["c"][0]["c"][1][0]["t"] == "Strong"
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("- A\n- B\n", "Plain"),
+            ("- A\n\n- B\n", "Para"),
+        ],
+        ids=["tight", "loose"],
+    )
+    def spec_6(self, text, expected):
+        r"""
+        ### [\@case 6] Items of tight lists are Plain.
+        """
+        # GIVEN
+        # WHEN
+        blist = _get_blocks(text)[0]["c"][1][0]
+        # THEN
+        assert blist["t"] == "BulletList"
+        assert [item[0]["c"][1][0]["t"] for item in blist["c"]] == [expected] * 2
+
+    def spec_7(self):
+        r"""
+        ### [\@case 7] Blocks in table cells are not wrapped in Divs.
+        """
+        # GIVEN
+        text = "| A | B |\n|:--|--:|\n| 1 |\n"
+        # WHEN
+        table = _get_blocks(text)[0]
+        # THEN
+        aligns = [colspec[0]["t"] for colspec in table["c"][2]]
+        assert aligns == ["AlignLeft", "AlignRight"]
+        head_cells = table["c"][3][1][0][1]
+        assert head_cells[0][4][0]["t"] == "Plain"
+        body_cells = table["c"][4][0][3][0][1]
+        assert [len(cell[4]) for cell in body_cells] == [1, 0]
+
+    def spec_8(self):
+        r"""
+        ### [\@case 8] No Span and Div without 'sourcepos'.
+        """
+        # GIVEN
+        text = "ABC DEF \\\nGHI\n"
+        # WHEN
+        blocks = _get_blocks(text, "gfm-sourcepos")
+        # THEN
+        assert blocks == [
+            {
+                "t": "Para",
+                "c": [
+                    {"t": "Str", "c": "ABC"},
+                    {"t": "Space"},
+                    {"t": "Str", "c": "DEF"},
+                    {"t": "LineBreak"},
+                    {"t": "Str", "c": "GHI"},
+                ],
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ("doc.txt", None, None),
+            ("doc.md", "html", None),
+            ("doc.md", "commonmark", None),
+            ("doc.md", "gfm+footnotes", None),
+        ],
+        ids=["file type", "file format", "other markdown", "extension"],
+    )
+    def spec_9(self, args):
+        r"""
+        ### [\@case 9] Raise ValueError for unsupported arguments.
+        """
+        # GIVEN
+        target = MarkdownReader()
+        # WHEN
+        with pytest.raises(ValueError):
+            target.get_json(*args, filedata="TEXT\n")
+        # THEN
+        # ValueError is raised.
+
+    def spec_10(self):
+        r"""
+        ### [\@case 10] Html tags are interpreted with `via_html`.
+        """
+        # GIVEN
+        text = "A<br>B\n"
+        # WHEN
+        blocks = MarkdownReader().get_json("doc.md", "gfm", True, text)["blocks"]
+        # THEN
+        span = blocks[0]["c"][1][0]["c"][1]
+        assert span["c"] == [["", [], [["pos", "1:2-1:6"]]], [{"t": "LineBreak"}]]
+
+
+class Spec_PandocAst:
+    r"""
+    ## [\@spec] The output works with `PandocAst` and `GdocCompiler`.
+    """
+
+    def spec_1(self):
+        r"""
+        ### [\@case 1] Positions of characters in PandocStr.
+        """
+        # GIVEN
+        text = "- ABC\n  DEF\n"
+        pandoc_ast = PandocAst(MarkdownReader().get_json("doc.md", "gfm", False, text))
+        plain = pandoc_ast.get_first_item().get_first_item().get_first_item()
+        # WHEN
+        target = PandocStr(plain.get_child_items(ignore=["Div", "Span"]))
+        # THEN
+        assert str(target) == "ABC DEF"
+        assert target.get_char_pos(1) == DataPos("", Pos(1, 4), Pos(1, 5))
+        assert target.get_char_pos(3) == DataPos("", Pos(1, 6), Pos(0, 0))
+        assert target.get_char_pos(4) == DataPos("", Pos(2, 3), Pos(2, 4))
+
+    def spec_2(self, tmp_path):
+        r"""
+        ### [\@case 2] GdocCompiler compiles the document without pandoc.
+        """
+        # GIVEN
+        source = tmp_path / "doc.md"
+        source.write_text("# [@ A] TITLE\n\n[@ B] TEXT\n", encoding="utf-8")
+        target = GdocCompiler(plugins=[std.category], pandoc=MarkdownReader())
+        # WHEN
+        gobj, erpt = target.compile(str(source))
+        # THEN
+        assert erpt is None
+        assert gobj is not None
+
+    def spec_3(self, tmp_path):
+        r"""
+        ### [\@case 3] `compile_async` compiles the document as `compile` does.
+        """
+        # GIVEN
+        source = tmp_path / "doc.md"
+        source.write_text("# [@ A] TITLE\n\n[@ B] TEXT\n", encoding="utf-8")
+        target = GdocCompiler(plugins=[std.category], pandoc=MarkdownReader())
+        # WHEN
+        gobj, erpt = asyncio.run(target.compile_async(str(source)))
+        # THEN
+        assert erpt is None
+        assert gobj is not None
+        assert gobj.get_children()[0].name == "A"
@@ -0,0 +1,159 @@
+r"""
+# `gdoc::lib::pandocastobject::pandoc::Pandoc` class Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+from gdoc.lib.pandocastobject.pandoc import Pandoc
+
+_FAKE_PANDOC_ = """
+import json
+import sys
+import time
+
+args = sys.argv[1:]
+if args[0] == "--version":
+    print("pandoc 3.1.0")
+    sys.exit(0)
+
+if args[0].startswith("-"):
+    text = sys.stdin.buffer.read().decode("utf-8")
+else:
+    with open(args[0], encoding="utf-8") as f:
+        text = f.read()
+
+sys.stderr.write("WARNING " * 10000)
+words = [{"t": "Str", "c": word} for word in text.split()]
+output = {
+    "pandoc-api-version": [1, 23],
+    "meta": {},
+    "blocks": [{"t": "Para", "c": words}],
+}
+sys.stdout.buffer.write(json.dumps(output, ensure_ascii=False).encode("utf-8"))
+"""
+
+
+@pytest.fixture
+def _pandoc_command(tmp_path):
+    command = tmp_path / "pandoc"
+    command.write_text(f"#!{sys.executable}\n{_FAKE_PANDOC_}", encoding="utf-8")
+    os.chmod(command, 0o755)
+    return str(command)
+
+
+def _get_words(pandoc_json) -> list[str]:
+    return [word["c"] for word in pandoc_json["blocks"][0]["c"]]
+
+
+class Spec_get_json:
+    r"""
+    ## [\@spec] `get_json`
+
+    ```py
+    def get_json(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+    ```
+    """
+
+    def spec_1(self, tmp_path, _pandoc_command):
+        r"""
+        ### [\@case 1] Read json output of pandoc for the file.
+        """
+        # GIVEN
+        source = tmp_path / "doc.md"
+        source.write_text("ABC 日本語\n", encoding="utf-8")
+        # WHEN
+        output = Pandoc(_pandoc_command).get_json(str(source))
+        # THEN
+        assert _get_words(output) == ["ABC", "日本語"]
+
+    def spec_2(self, _pandoc_command):
+        r"""
+        ### [\@case 2] Large filedata and stderr don't block pandoc.
+        """
+        # GIVEN
+        filedata = "WORD " * 200000
+        # WHEN
+        output = Pandoc(_pandoc_command).get_json("doc.md", "gfm", False, filedata)
+        # THEN
+        assert len(_get_words(output)) == 200000
+
+    def spec_3(self, tmp_path):
+        r"""
+        ### [\@case 3] Raise ValueError if pandoc fails.
+        """
+        # GIVEN
+        command = tmp_path / "pandoc"
+        command.write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+        os.chmod(command, 0o755)
+        # WHEN
+        with pytest.raises(ValueError):
+            Pandoc(str(command)).get_json("doc.md", filedata="TEXT\n")
+        # THEN
+        # ValueError is raised.
+
+
+class Spec_get_json_async:
+    r"""
+    ## [\@spec] `get_json_async`
+
+    ```py
+    async def get_json_async(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+    ```
+    """
+
+    def spec_1(self, _pandoc_command):
+        r"""
+        ### [\@case 1] Read json output of pandoc as `get_json` does.
+        """
+        # GIVEN
+        filedata = "ABC 日本語\n"
+        target = Pandoc(_pandoc_command)
+        # WHEN
+        output = asyncio.run(target.get_json_async("doc.md", "gfm", False, filedata))
+        # THEN
+        assert output == target.get_json("doc.md", "gfm", False, filedata)
+
+    def spec_2(self, tmp_path):
+        r"""
+        ### [\@case 2] pandoc is killed when the task is cancelled.
+        """
+        # GIVEN
+        command = tmp_path / "pandoc"
+        command.write_text("#!/bin/sh\nexec sleep 10\n", encoding="utf-8")
+        os.chmod(command, 0o755)
+        target = Pandoc(str(command))
+
+        async def run() -> float:
+            task = asyncio.create_task(target.get_json_async("doc.md", filedata="TEXT"))
+            await asyncio.sleep(0.2)
+            start = time.monotonic()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return time.monotonic() - start
+
+        # WHEN
+        elapsed = asyncio.run(run())
+        # THEN
+        assert elapsed < 5
@@ -0,0 +1,185 @@
+r"""
+# `gdoc::lib::pandocastobject::pandoc::PandocAstCache` class Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import os
+
+import pytest
+
+from gdoc.lib.pandocastobject.pandoc import PandocAstCache
+
+
+class _Pandoc:
+    """
+    Test double of `Pandoc` that counts calls of `get_json()`.
+    """
+
+    def __init__(self, version="2.14.2"):
+        self.version = version
+        self.calls = 0
+
+    def get_version(self):
+        return {"pandoc": self.version.split(".")}
+
+    def get_json(self, filepath, fileformat=None, via_html=None, filedata=None):
+        self.calls += 1
+        return {"blocks": [filepath, fileformat, via_html, filedata, self.calls]}
+
+
+@pytest.fixture
+def _source(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text("# TITLE\n", encoding="utf-8")
+    return str(path)
+
+
+class Spec_get_json:
+    r"""
+    ## [\@spec] `get_json`
+
+    ```py
+    def get_json(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+    ```
+    """
+
+    def spec_1(self, tmp_path, _source):
+        r"""
+        ### [\@case 1] Run pandoc only once for unchanged source.
+        """
+        # GIVEN
+        pandoc = _Pandoc()
+        target = PandocAstCache(str(tmp_path / "cache"), pandoc=pandoc)
+        # WHEN
+        first = target.get_json(_source)
+        second = target.get_json(_source)
+        # THEN
+        assert pandoc.calls == 1
+        assert first == second
+
+    def spec_2(self, tmp_path, _source):
+        r"""
+        ### [\@case 2] The cache is persistent across instances.
+        """
+        # GIVEN
+        PandocAstCache(str(tmp_path / "cache"), pandoc=_Pandoc()).get_json(_source)
+        pandoc = _Pandoc()
+        target = PandocAstCache(str(tmp_path / "cache"), pandoc=pandoc)
+        # WHEN
+        target.get_json(_source)
+        # THEN
+        assert pandoc.calls == 0
+
+    def spec_3(self, tmp_path, _source):
+        r"""
+        ### [\@case 3] Run pandoc again when the source is changed.
+        """
+        # GIVEN
+        pandoc = _Pandoc()
+        target = PandocAstCache(str(tmp_path / "cache"), pandoc=pandoc)
+        target.get_json(_source)
+        # WHEN
+        with open(_source, "a", encoding="utf-8") as f:
+            f.write("\nPARAGRAPH\n")
+        target.get_json(_source)
+        # THEN
+        assert pandoc.calls == 2
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ("gfm", None, None),
+            (None, True, None),
+            (None, None, "# TITLE\n"),
+        ],
+        ids=["fileformat", "via_html", "filedata"],
+    )
+    def spec_4(self, tmp_path, _source, args):
+        r"""
+        ### [\@case 4] Options passed to pandoc are parts of the key.
+        """
+        # GIVEN
+        pandoc = _Pandoc()
+        target = PandocAstCache(str(tmp_path / "cache"), pandoc=pandoc)
+        target.get_json(_source)
+        # WHEN
+        target.get_json(_source, *args)
+        # THEN
+        assert pandoc.calls == 2
+
+    def spec_5(self, tmp_path, _source):
+        r"""
+        ### [\@case 5] The version of pandoc is a part of the key.
+        """
+        # GIVEN
+        PandocAstCache(str(tmp_path / "cache"), pandoc=_Pandoc("2.14.2")).get_json(
+            _source
+        )
+        pandoc = _Pandoc("3.1.0")
+        target = PandocAstCache(str(tmp_path / "cache"), pandoc=pandoc)
+        # WHEN
+        target.get_json(_source)
+        # THEN
+        assert pandoc.calls == 1
+
+    def spec_6(self, tmp_path):
+        r"""
+        ### [\@case 6] Missing source is passed to pandoc without caching.
+        """
+        # GIVEN
+        pandoc = _Pandoc()
+        target = PandocAstCache(str(tmp_path / "cache"), pandoc=pandoc)
+        # WHEN
+        target.get_json(str(tmp_path / "missing.md"))
+        # THEN
+        assert pandoc.calls == 1
+        assert not os.path.exists(tmp_path / "cache")
+
+
+class Spec_evict:
+    r"""
+    ## [\@spec] `evict`
+
+    ```py
+    def evict(self) -> None:
+    ```
+    """
+
+    def spec_1(self, tmp_path):
+        r"""
+        ### [\@case 1] Least recently used entries are removed first.
+        """
+        # GIVEN
+        cache_dir = tmp_path / "cache"
+        target = PandocAstCache(str(cache_dir), max_size=None, pandoc=_Pandoc())
+        for i, key in enumerate(["OLD", "USED", "NEW"]):
+            target.store(key, {"blocks": ["X" * 100]})
+            os.utime(cache_dir / f"{key}.past.json", (i * 10, i * 10))
+        target.load("USED")
+        size = os.path.getsize(cache_dir / "NEW.past.json")
+        # WHEN
+        target._max_size = size
+        target.evict()
+        # THEN
+        assert os.listdir(cache_dir) == ["USED.past.json"]
+
+    def spec_2(self, tmp_path, _source):
+        r"""
+        ### [\@case 2] `store` keeps the total size within max_size.
+        """
+        # GIVEN
+        cache_dir = tmp_path / "cache"
+        target = PandocAstCache(str(cache_dir), max_size=1, pandoc=_Pandoc())
+        # WHEN
+        target.get_json(_source)
+        # THEN
+        assert os.listdir(cache_dir) == []
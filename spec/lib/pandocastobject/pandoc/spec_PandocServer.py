@@ -0,0 +1,270 @@
+r"""
+# `gdoc::lib::pandocastobject::pandoc::PandocServer` class Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import asyncio
+import os
+import pickle
+import sys
+import time
+
+import pytest
+
+from gdoc.lib.pandocastobject.pandoc import Pandoc, PandocServer
+
+_FAKE_PANDOC_ = """
+import json
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+if sys.argv[1] != "server":
+    sys.exit(1)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._send(200, b"3.1.0")
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        text = body["text"].strip()
+        if text == "SLOW":
+            time.sleep(10)
+        if body["to"] == "html":
+            output = f"<p>{text}</p>"
+        else:
+            attr = ["", [], [["data-pos", "1:1-1:5"]]]
+            span = {"t": "Span", "c": [attr, [{"t": "Str", "c": text}]]}
+            output = json.dumps(
+                {
+                    "pandoc-api-version": [1, 23],
+                    "meta": {},
+                    "blocks": [{"t": "Para", "c": [span]}],
+                }
+            )
+        if self.headers["Accept"] == "text/plain":
+            self._send(200, output.encode("utf-8"))
+            return
+        result = {"output": output, "base64": False, "messages": []}
+        self._send(200, json.dumps(result).encode("utf-8"))
+
+    def _send(self, status, data):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+port = int(sys.argv[sys.argv.index("--port") + 1])
+HTTPServer(("127.0.0.1", port), Handler).serve_forever()
+"""
+
+
+@pytest.fixture
+def _server(tmp_path):
+    command = tmp_path / "pandoc"
+    command.write_text(f"#!{sys.executable}\n{_FAKE_PANDOC_}", encoding="utf-8")
+    os.chmod(command, 0o755)
+    server = PandocServer(str(command))
+    yield server
+    server.stop()
+
+
+def _get_data_pos(pandoc_json) -> str:
+    return pandoc_json["blocks"][0]["c"][0]["c"][0][2][0][1]
+
+
+class Spec_get_json:
+    r"""
+    ## [\@spec] `Pandoc.get_json` with the server
+
+    ```py
+    def get_json(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+    ```
+    """
+
+    def spec_1(self, tmp_path, _server):
+        r"""
+        ### [\@case 1] Add the file path to 'data-pos' as pandoc does.
+        """
+        # GIVEN
+        source = tmp_path / "doc.md"
+        source.write_text("TEXT\n", encoding="utf-8")
+        # WHEN
+        output = Pandoc(server=_server).get_json(str(source))
+        # THEN
+        assert _get_data_pos(output) == f"{source}@1:1-1:5"
+
+    def spec_2(self, _server):
+        r"""
+        ### [\@case 2] 'data-pos' has no file path for `filedata`.
+        """
+        # GIVEN
+        target = Pandoc(server=_server)
+        # WHEN
+        output = target.get_json("doc.md", "gfm", False, "TEXT\n")
+        # THEN
+        assert _get_data_pos(output) == "1:1-1:5"
+
+    def spec_3(self, _server):
+        r"""
+        ### [\@case 3] `via_html` is converted to json directly by the server.
+        """
+        # GIVEN
+        target = Pandoc(server=_server)
+        # WHEN
+        output = target.get_json("doc.md", "gfm", True, "TEXT\n")
+        # THEN
+        span = output["blocks"][0]["c"][0]
+        assert span["c"] == [["", [], [["pos", "1:1-1:5"]]], [{"t": "Str", "c": "TEXT"}]]
+
+
+class Spec_get_json_async:
+    r"""
+    ## [\@spec] `Pandoc.get_json_async` with the server
+
+    ```py
+    async def get_json_async(
+        self,
+        filepath: str,
+        fileformat: str | None = None,
+        via_html: bool | None = None,
+        filedata: str | None = None,
+    ):
+    ```
+    """
+
+    def spec_1(self, tmp_path, _server):
+        r"""
+        ### [\@case 1] Returns the same json as `get_json`.
+        """
+        # GIVEN
+        source = tmp_path / "doc.md"
+        source.write_text("TEXT\n", encoding="utf-8")
+        target = Pandoc(server=_server)
+        # WHEN
+        output = asyncio.run(target.get_json_async(str(source)))
+        # THEN
+        assert output == target.get_json(str(source))
+
+    def spec_2(self, _server):
+        r"""
+        ### [\@case 2] The request is abandoned when the task is cancelled.
+        """
+        # GIVEN
+        target = Pandoc(server=_server)
+        assert _server.is_available()
+
+        async def run():
+            task = asyncio.create_task(
+                target.get_json_async("doc.md", "gfm", False, "SLOW\n")
+            )
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        # WHEN
+        start = time.monotonic()
+        asyncio.run(run())
+        # THEN
+        # No thread is left waiting for the output of the server.
+        assert time.monotonic() - start < 5
+
+
+class Spec_convert:
+    r"""
+    ## [\@spec] `convert`
+
+    ```py
+    def convert(self, text: str, from_format: str, to_format: str) -> str:
+    ```
+    """
+
+    def spec_1(self, _server):
+        r"""
+        ### [\@case 1] One server process is used for all conversions.
+        """
+        # GIVEN
+        assert _server.is_available()
+        process = _server._process
+        # WHEN
+        _server.convert("A", "gfm", "html")
+        _server.convert("B", "gfm", "html")
+        # THEN
+        assert _server._process is process
+
+    def spec_2(self, _server):
+        r"""
+        ### [\@case 2] Restart the server when it has crashed.
+        """
+        # GIVEN
+        assert _server.is_available()
+        _server._process.kill()
+        _server._process.wait()
+        # WHEN
+        output = _server.convert("TEXT", "gfm", "html")
+        # THEN
+        assert output == "<p>TEXT</p>"
+        assert _server.is_alive()
+
+    def spec_3(self, _server):
+        r"""
+        ### [\@case 3] Unpickled server connects to the running server.
+        """
+        # GIVEN
+        assert _server.is_available()
+        # WHEN
+        target = pickle.loads(pickle.dumps(_server))
+        # THEN
+        assert target._process is None
+        assert target.convert("TEXT", "gfm", "html") == "<p>TEXT</p>"
+
+    def spec_4(self, _server, mocker):
+        r"""
+        ### [\@case 4] RuntimeError if the restarted server doesn't respond.
+        """
+        # GIVEN
+        mocker.patch.object(_server, "start", return_value=True)
+        mocker.patch.object(_server, "_request", side_effect=ConnectionRefusedError)
+        # WHEN
+        with pytest.raises(RuntimeError) as exc_info:
+            _server.convert("TEXT", "gfm", "html")
+        # THEN
+        assert exc_info.match("pandoc server is not available")
+        assert _server._request.call_count == 2
+
+
+class Spec_is_available:
+    r"""
+    ## [\@spec] `is_available`
+
+    ```py
+    def is_available(self) -> bool:
+    ```
+    """
+
+    def spec_1(self, tmp_path):
+        r"""
+        ### [\@case 1] False if the server can not be started.
+        """
+        # GIVEN
+        target = PandocServer(str(tmp_path / "missing"))
+        # WHEN
+        available = target.is_available()
+        # THEN
+        assert available is False
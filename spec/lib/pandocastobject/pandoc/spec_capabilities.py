@@ -0,0 +1,147 @@
+r"""
+# `gdoc::lib::pandocastobject::pandoc::capabilities` Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import os
+import sys
+
+import pytest
+
+from gdoc.lib.pandocastobject.pandoc import Pandoc
+from gdoc.lib.pandocastobject.pandoc.capabilities import (
+    clear_capabilities,
+    get_capabilities,
+)
+
+_FAKE_PANDOC_ = """
+import os
+import sys
+
+with open(os.environ["FAKE_PANDOC_LOG"], "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+
+args = sys.argv[1:]
+if args[0] == "--version":
+    print("pandoc 3.1.0\\nFeatures: +server +lua")
+elif args[0].startswith("--list-extensions"):
+    print("+autolink_bare_uris\\n-sourcepos")
+else:
+    print('{"pandoc-api-version":[1,23],"meta":{},"blocks":[]}')
+"""
+
+
+@pytest.fixture
+def _pandoc(tmp_path, monkeypatch):
+    command = tmp_path / "pandoc"
+    command.write_text(f"#!{sys.executable}\n{_FAKE_PANDOC_}", encoding="utf-8")
+    os.chmod(command, 0o755)
+    log = tmp_path / "log.txt"
+    log.write_text("", encoding="utf-8")
+    monkeypatch.setenv("FAKE_PANDOC_LOG", str(log))
+    clear_capabilities()
+    yield command, log
+    clear_capabilities()
+
+
+def _count_runs(log) -> int:
+    return len(log.read_text(encoding="utf-8").splitlines())
+
+
+class Spec_get_capabilities:
+    r"""
+    ## [\@spec] `get_capabilities`
+
+    ```py
+    def get_capabilities(
+        pandoc_command: str = "pandoc", cache_dir: str | None = None
+    ) -> PandocCapabilities:
+    ```
+    """
+
+    def spec_1(self, _pandoc, tmp_path):
+        r"""
+        ### [\@case 1] Capabilities are probed by running pandoc.
+        """
+        # GIVEN
+        command, _ = _pandoc
+        # WHEN
+        target = get_capabilities(str(command), str(tmp_path / "cache"))
+        # THEN
+        assert target.version == {"pandoc": [3, 1, 0], "pandoc-types": [1, 23]}
+        assert target.api_version == [1, 23]
+        assert target.supports("gfm", "sourcepos")
+        assert not target.supports("gfm", "smart")
+
+    def spec_2(self, _pandoc, tmp_path):
+        r"""
+        ### [\@case 2] pandoc runs only once in the process.
+        """
+        # GIVEN
+        command, log = _pandoc
+        first = get_capabilities(str(command), None)
+        runs = _count_runs(log)
+        # WHEN
+        target = get_capabilities(str(command), None)
+        # THEN
+        assert target == first
+        assert _count_runs(log) == runs
+
+    def spec_3(self, _pandoc, tmp_path):
+        r"""
+        ### [\@case 3] Persisted capabilities are used by other processes.
+        """
+        # GIVEN
+        command, log = _pandoc
+        first = get_capabilities(str(command), str(tmp_path / "cache"))
+        runs = _count_runs(log)
+        clear_capabilities()  # as a new process
+        # WHEN
+        target = get_capabilities(str(command), str(tmp_path / "cache"))
+        # THEN
+        assert target == first
+        assert _count_runs(log) == runs
+
+    def spec_4(self, _pandoc, tmp_path):
+        r"""
+        ### [\@case 4] Capabilities are probed again when the binary is updated.
+        """
+        # GIVEN
+        command, log = _pandoc
+        get_capabilities(str(command), str(tmp_path / "cache"))
+        runs = _count_runs(log)
+        clear_capabilities()
+        st = os.stat(command)
+        os.utime(command, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        # WHEN
+        get_capabilities(str(command), str(tmp_path / "cache"))
+        # THEN
+        assert _count_runs(log) == runs * 2
+
+    def spec_5(self, tmp_path):
+        r"""
+        ### [\@case 5] Raise FileNotFoundError if pandoc is not found.
+        """
+        # GIVEN
+        command = tmp_path / "no-pandoc"
+        # WHEN
+        with pytest.raises(FileNotFoundError):
+            get_capabilities(str(command), None)
+        # THEN
+        # FileNotFoundError is raised.
+
+    def spec_6(self, _pandoc, tmp_path, monkeypatch):
+        r"""
+        ### [\@case 6] Nothing is written unless the cache directory is given.
+        """
+        # GIVEN
+        command, _ = _pandoc
+        monkeypatch.chdir(tmp_path)
+        # WHEN
+        Pandoc(str(command)).get_version()
+        get_capabilities(str(command))
+        # THEN
+        assert not (tmp_path / "_gdoc_").exists()
@@ -0,0 +1,130 @@
+r"""
+# `gdoc::lib::pandocastobject::pandoc::rawhtml::interpret_raw_html` Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import pytest
+
+from gdoc.lib.pandocastobject.pandoc.rawhtml import interpret_raw_html
+
+
+def _span(pos: str, elem: dict) -> dict:
+    return {"t": "Span", "c": [["", [], [["data-pos", pos]]], [elem]]}
+
+
+def _raw(text: str) -> dict:
+    return {"t": "RawInline", "c": ["html", text]}
+
+
+def _str(text: str) -> dict:
+    return {"t": "Str", "c": text}
+
+
+def _para(inlines: list) -> dict:
+    return {
+        "pandoc-api-version": [1, 22, 2, 1],
+        "meta": {},
+        "blocks": [{"t": "Para", "c": inlines}],
+    }
+
+
+class Spec_interpret_raw_html:
+    r"""
+    ## [\@spec] `interpret_raw_html`
+
+    ```py
+    def interpret_raw_html(pandoc_json):
+    ```
+    """
+
+    @pytest.mark.parametrize("tag", ["<br>", "<br/>", "<BR />"])
+    def spec_1(self, tag):
+        r"""
+        ### [\@case 1] `<br>` becomes LineBreak in the Span of its position.
+        """
+        # GIVEN
+        target = _para([_span("1:1-1:2", _str("A")), _span("1:2-1:6", _raw(tag))])
+        # WHEN
+        interpret_raw_html(target)
+        # THEN
+        assert target["blocks"][0]["c"] == [
+            {"t": "Span", "c": [["", [], [["pos", "1:1-1:2"]]], [_str("A")]]},
+            {"t": "Span", "c": [["", [], [["pos", "1:2-1:6"]]], [{"t": "LineBreak"}]]},
+        ]
+
+    def spec_2(self):
+        r"""
+        ### [\@case 2] A pair of tags becomes an element from the start to the end.
+        """
+        # GIVEN
+        target = _para(
+            [
+                _span("1:1-1:4", _raw("<b>")),
+                _span("1:4-1:5", _str("A")),
+                _span("1:5-1:9", _raw("</b>")),
+            ]
+        )
+        # WHEN
+        interpret_raw_html(target)
+        # THEN
+        span = target["blocks"][0]["c"][0]
+        assert span["c"][0] == ["", [], [["pos", "1:1-1:9"]]]
+        assert span["c"][1][0]["t"] == "Strong"
+        assert span["c"][1][0]["c"] == [
+            {"t": "Span", "c": [["", [], [["pos", "1:4-1:5"]]], [_str("A")]]}
+        ]
+
+    def spec_3(self):
+        r"""
+        ### [\@case 3] Unknown tags, unpaired tags and comments are removed.
+        """
+        # GIVEN
+        target = _para([_raw("<x-tag>"), _raw("<b>"), _str("A"), _raw("<!-- C -->")])
+        # WHEN
+        interpret_raw_html(target)
+        # THEN
+        assert target["blocks"][0]["c"] == [_str("A")]
+
+    def spec_4(self):
+        r"""
+        ### [\@case 4] Texts in raw html blocks become Plain.
+        """
+        # GIVEN
+        target = {
+            "blocks": [
+                {
+                    "t": "Div",
+                    "c": [
+                        ["", [], [["data-pos", "1:1-3:1"]]],
+                        [{"t": "RawBlock", "c": ["html", "<div>\nA &amp; B\n</div>\n"]}],
+                    ],
+                },
+                {"t": "RawBlock", "c": ["html", "<!-- COMMENT -->\n"]},
+            ]
+        }
+        # WHEN
+        interpret_raw_html(target)
+        # THEN
+        assert target["blocks"] == [
+            {
+                "t": "Div",
+                "c": [
+                    ["", [], [["pos", "1:1-3:1"]]],
+                    [
+                        {
+                            "t": "Plain",
+                            "c": [
+                                _str("A"),
+                                {"t": "Space"},
+                                _str("&"),
+                                {"t": "Space"},
+                                _str("B"),
+                            ],
+                        }
+                    ],
+                ],
+            }
+        ]
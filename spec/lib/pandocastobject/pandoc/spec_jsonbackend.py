@@ -0,0 +1,72 @@
+r"""
+# `gdoc::lib::pandocastobject::pandoc::jsonbackend` Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+"""
+import pytest
+
+from gdoc.lib.pandocastobject.pandoc import jsonbackend
+
+
+@pytest.fixture(params=["default", "json"])
+def _backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(jsonbackend, "orjson", None)
+    return request.param
+
+
+class Spec_loads:
+    r"""
+    ## [\@spec] `loads`
+
+    ```py
+    def loads(data: bytes | str) -> Any:
+    ```
+    """
+
+    @pytest.mark.parametrize("data", [b'{"c": "\xe6\x97\xa5"}', '{"c": "日"}'])
+    def spec_1(self, _backend, data):
+        r"""
+        ### [\@case 1] Parse json from UTF-8 bytes or str.
+        """
+        # GIVEN
+        # WHEN
+        output = jsonbackend.loads(data)
+        # THEN
+        assert output == {"c": "日"}
+
+    @pytest.mark.parametrize("data", [b"", b"{"])
+    def spec_2(self, _backend, data):
+        r"""
+        ### [\@case 2] Raise ValueError for invalid json.
+        """
+        # GIVEN
+        # WHEN
+        with pytest.raises(ValueError):
+            jsonbackend.loads(data)
+        # THEN
+        # ValueError is raised.
+
+
+class Spec_dumps:
+    r"""
+    ## [\@spec] `dumps`
+
+    ```py
+    def dumps(obj: Any) -> bytes:
+    ```
+    """
+
+    def spec_1(self, _backend):
+        r"""
+        ### [\@case 1] Return compact UTF-8 json.
+        """
+        # GIVEN
+        obj = {"t": "Str", "c": "日"}
+        # WHEN
+        output = jsonbackend.dumps(obj)
+        # THEN
+        assert output == '{"t":"Str","c":"日"}'.encode("utf-8")
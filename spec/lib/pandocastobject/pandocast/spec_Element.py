@@ -19,10 +19,13 @@ The specification of Element class.
 
 """
 import inspect
+import sys
 
 import pytest
 
+from gdoc.lib.pandocastobject.pandocast import DataPos, Pos
 from gdoc.lib.pandocastobject.pandocast.element import Element
+from gdoc.lib.pandocastobject.pandocast.pandocast import PandocAst
 
 ## @{ @name \_\_init\_\_(self, pan_elem, type_def)
 ## [\@spec \_\_init\_\_] creates a new instance.
@@ -65,6 +68,21 @@ def spec___init___3():
         Element(_ELEMENT, "TYPE")
 
 
+def spec___init___4():
+    r"""
+    [@spec \_\_init\_\_.4] elements share the accessor compiled from type_def.
+    """
+    target1 = PandocAst.create_element({"t": "Str", "c": "A"})
+    target2 = PandocAst.create_element({"t": "Str", "c": "B"})
+
+    assert target1._acc is target2._acc
+    assert target1.type_def is target1._acc.type_def
+
+    target1.type_def = {"content": {"key": "c", "type": "TEST"}}
+
+    assert target1.get_content_type() == "TEST"
+
+
 ## @}
 ## @{ @name _add_child(self, child)
 ## [\@spec _add_child] adds a Element object as a child.
@@ -151,6 +169,17 @@ def spec_prev_2(_fixt_prev):
     assert _fixt_prev.children[0].prev() is None
 
 
+def spec_prev_3(_fixt_prev):
+    r"""
+    [\@spec prev.3] returns prev element after children are replaced.
+    """
+    target = _fixt_prev.children[1]  # "SECOND"
+    _fixt_prev.children = [target, _fixt_prev.children[0]]
+
+    assert target.prev() == None
+    assert _fixt_prev.children[1].prev() is target
+
+
 ## @}
 ## @{ @name get_parent(self)
 ## [\@spec get_parent] returns parent element.
@@ -1239,6 +1268,110 @@ def spec_walk_3(_fixt_walk, mocker):
     assert args[7] == [(target, opt), {}]
 
 
+def spec_walk_4(mocker):
+    r"""
+    [\@Spec walk.4] walk() doesn't hit the recursion limit on deeply nested trees.
+    """
+    target = Element({}, "ROOT", {})
+    element = target
+    for _ in range(sys.getrecursionlimit() * 2):
+        element = element._add_child(Element({}, "NESTED", {})).children[0]
+    action_mock = mocker.Mock()
+
+    assert target.walk(action_mock, action_mock) is target
+
+    assert action_mock.call_count == (sys.getrecursionlimit() * 2 + 1) * 2
+    assert action_mock.call_args_list[-1] == [(target, None), {}]
+
+
+## @}
+## @{ @name iter_preorder(self, prune=None)
+## [\@spec iter_preorder] Iterate over self and all descendant elements in pre-order.
+_iter_preorder = "dummy for doxygen styling"
+
+
+def spec_iter_preorder_1(_fixt_walk):
+    r"""
+    [\@Spec iter_preorder.1] yields the elements in the same order as walk().
+    """
+    target = _fixt_walk
+
+    assert list(target.iter_preorder()) == [
+        target,
+        target.children[0],
+        target.children[1],
+        target.children[1].children[0],
+    ]
+
+
+def spec_iter_preorder_2(_fixt_walk):
+    r"""
+    [\@Spec iter_preorder.2] doesn't visit children of the pruned elements.
+    """
+    target = _fixt_walk
+
+    assert list(target.iter_preorder(lambda e: e.type == "SECOND")) == [
+        target,
+        target.children[0],
+        target.children[1],
+    ]
+
+
+def spec_iter_preorder_3():
+    r"""
+    [\@Spec iter_preorder.3] stops visiting when the iteration stops.
+    """
+    target = PandocAst.create_element(
+        {"t": "Para", "c": [{"t": "Str", "c": "A"}, {"t": "Space"}]}, lazy=True
+    )
+
+    assert next(target.iter_preorder()) is target
+    assert target._lazy_children is not None
+
+
+def spec_iter_preorder_4():
+    r"""
+    [\@Spec iter_preorder.4] doesn't hit the recursion limit on deeply nested trees.
+    """
+    target = Element({}, "ROOT", {})
+    element = target
+    for _ in range(sys.getrecursionlimit() * 2):
+        element = element._add_child(Element({}, "NESTED", {})).children[0]
+
+    assert sum(1 for _ in target.iter_preorder()) == sys.getrecursionlimit() * 2 + 1
+
+
+## @}
+## @{ @name iter_type(self, elem_type, prune=None)
+## [\@spec iter_type] Iterate over self and all descendant elements of the type.
+_iter_type = "dummy for doxygen styling"
+
+
+def spec_iter_type_1():
+    r"""
+    [\@Spec iter_type.1] yields only the elements of the type.
+    """
+    target = PandocAst.create_element(
+        {
+            "t": "Div",
+            "c": [
+                ["", [], []],
+                [
+                    {"t": "Header", "c": [1, ["", [], []], [{"t": "Str", "c": "A"}]]},
+                    {"t": "Para", "c": [{"t": "Str", "c": "B"}]},
+                    {"t": "Header", "c": [2, ["", [], []], [{"t": "Str", "c": "C"}]]},
+                ],
+            ],
+        }
+    )
+
+    assert [e.text for e in target.iter_type("Header")] == ["A", "C"]
+    assert [e.text for e in target.iter_type("Str")] == ["A", "B", "C"]
+    assert [e.text for e in target.iter_type("Str", lambda e: e.type == "Header")] == [
+        "B"
+    ]
+
+
 ## @}
 ## @{ @name get_parent_item(self, ignore=['Div', 'Span'])
 ## [\@spec get_parent_item] returns parent item.
@@ -1368,6 +1501,32 @@ def spec_next_item_2(_fixt_next_item):
     assert target.next_item() == None
 
 
+def spec_next_item_3(_fixt_next_item):
+    r"""
+    [\@spec next_item.3] returns the new item added after the previous call.
+    """
+    target = _fixt_next_item.children[1].children[0].children[1]  # "Span_Span_CHILD2"
+    assert target.next_item() == None
+
+    _fixt_next_item.children[2]._add_child(Element({}, "Div_CHILD", {}))
+
+    assert target.next_item().type == "Div_CHILD"
+
+
+def spec_next_item_4():
+    r"""
+    [\@spec next_item.4] doesn't hit the recursion limit on deeply nested ignored elements.
+    """
+    target = Element({}, "ROOT", {})
+    element = target._add_child(Element({}, "FIRST", {}))
+    for _ in range(sys.getrecursionlimit()):
+        element = element._add_child(Element({}, "Span", {})).children[-1]
+    element._add_child(Element({}, "LAST", {}))
+
+    assert target.children[0].next_item().type == "LAST"
+    assert element.children[0].prev_item().type == "FIRST"
+
+
 ## @}
 ## @{ @name prev_item(self, ignore=['Div', 'Span'])
 ## [\@spec prev_item] returns an element ordered at previous to self.
@@ -1541,4 +1700,109 @@ def spec_walk_items_4(_fixt_walk_items, mocker):
     assert args[0] == [(target.children[0], None), {}]  # First
 
 
+def spec_walk_items_5(mocker):
+    r"""
+    [\@Spec walk_items.5] doesn't hit the recursion limit on deeply nested trees.
+    """
+    target = Element({}, "ROOT", {})
+    element = target
+    for _ in range(sys.getrecursionlimit()):
+        element = element._add_child(Element({}, "Div", {})).children[0]
+        element = element._add_child(Element({}, "NESTED", {})).children[0]
+    action_mock = mocker.Mock()
+
+    assert target.walk_items(action_mock) is target
+
+    assert action_mock.call_count == sys.getrecursionlimit() + 1
+
+
+## @}
+## @{ @name iter_items(self, ignore=['Div', 'Span'], prune=None)
+## [\@spec iter_items] Iterate over self and all descendant items in pre-order.
+_iter_items = "dummy for doxygen styling"
+
+
+def spec_iter_items_1(_fixt_walk_items):
+    r"""
+    [\@Spec iter_items.1] yields the items in the same order as walk_items().
+    """
+    target = _fixt_walk_items
+
+    assert list(target.iter_items()) == [
+        target,
+        target.children[0].children[0],  # First
+        target.children[1],  # Second
+        target.children[1].children[0].children[0],  # Last
+    ]
+
+
+def spec_iter_items_2(_fixt_walk_items):
+    r"""
+    [\@Spec iter_items.2] yields elements of the ignored types with empty ignore.
+    """
+    target = _fixt_walk_items
+
+    assert list(target.iter_items([])) == list(target.iter_preorder())
+
+
+## @}
+## @{ @name get_data_pos(self)
+## [\@spec get_data_pos] returns the position of the element in the source file.
+##
+_get_data_pos = "dummy for doxygen styling"
+
+
+def _span(pos: str, elem: dict) -> dict:
+    return {"t": "Span", "c": [["", [], [["data-pos", pos]]], [elem]]}
+
+
+def spec_get_data_pos_1():
+    r"""
+    [\@spec get_data_pos.1] decodes the position of the Span of an only child.
+    """
+    span = PandocAst.create_element(_span("doc.md@1:2-3:4", {"t": "Str", "c": "A"}))
+    target = span.children[0]
+
+    assert target.get_data_pos() == DataPos("doc.md", Pos(1, 2), Pos(3, 4))
+    assert target.get_data_pos() is target.get_data_pos()
+
+
+def spec_get_data_pos_2():
+    r"""
+    [\@spec get_data_pos.2] paths of positions are interned.
+    """
+    path = "".join(["dir/", "doc.md"])
+    span1 = PandocAst.create_element(_span(f"{path}@1:1-1:2", {"t": "Str", "c": "A"}))
+    span2 = PandocAst.create_element(_span(f"{path}@1:2-1:3", {"t": "Str", "c": "B"}))
+
+    assert span1.get_data_pos().path is span2.get_data_pos().path
+
+
+def spec_get_data_pos_3():
+    r"""
+    [\@spec get_data_pos.3] position is decoded again after the Attr is changed.
+    """
+    target = PandocAst.create_element(
+        {"t": "Code", "c": [["", [], [["data-pos", "1:1-1:5"]]], "CODE"]}
+    )
+    assert target.get_data_pos() == DataPos("", Pos(1, 1), Pos(1, 5))
+
+    target.set_prop("Attr", ["", [], [["data-pos", "2:1-2:5"]]])
+
+    assert target.get_data_pos() == DataPos("", Pos(2, 1), Pos(2, 5))
+
+
+def spec_get_data_pos_4():
+    r"""
+    [\@spec get_data_pos.4] Span with multiple children gives no position to them.
+    """
+    span = PandocAst.create_element(_span("1:1-1:2", {"t": "Str", "c": "A"}))
+    target = span.children[0]
+    assert target.get_data_pos() is not None
+
+    span._add_child(PandocAst.create_element({"t": "Str", "c": "B"}))
+
+    assert target.get_data_pos() is None
+
+
 ## @}
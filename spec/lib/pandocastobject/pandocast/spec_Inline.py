@@ -23,6 +23,7 @@ import pytest
 
 from gdoc.lib.pandocastobject.pandocast.element import Element
 from gdoc.lib.pandocastobject.pandocast.inline import Inline
+from gdoc.lib.pandocastobject.pandocast.pandocast import PandocAst
 
 ## @{ @name \_\_init\_\_(pan_elem, type_def)
 ## [\@spec \_\_init\_\_] creates a new instance.
@@ -116,4 +117,54 @@ def spec___init___4(mocker):
     assert target.children[0].elem_type == "CHILD_TYPE"
 
 
+## @}
+## @{ @name text
+## [\@spec text] text of the element.
+##
+_text = "dummy for doxygen styling"
+
+
+def _nest(depth: int, inline: dict) -> dict:
+    for _ in range(depth):
+        inline = {"t": "Emph", "c": [inline, {"t": "Str", "c": "B"}]}
+    return inline
+
+
+def spec_text_1():
+    r"""
+    [\@spec text.1] The text of the container is made on the first access and kept.
+    """
+    target = PandocAst.create_element(_nest(2, {"t": "Str", "c": "A"}))
+
+    assert target._text is None
+    assert target.text == "ABB"
+    assert target.text is target.text
+    assert target.children[0]._text is None
+
+
+def spec_text_2():
+    r"""
+    [\@spec text.2] Texts of nested inlines are joined at once, without being made
+    at every nesting level.
+    """
+    target = PandocAst.create_element(_nest(100, {"t": "Str", "c": "A"}))
+
+    assert target.text == "A" + "B" * 100
+    assert target.children[0]._text is None
+    assert target.children[0].children[0]._text is None
+
+
+def spec_text_3():
+    r"""
+    [\@spec text.3] Texts of the ancestors are made again after a child is added.
+    """
+    target = PandocAst.create_element(_nest(2, {"t": "Str", "c": "A"}))
+    assert target.text == "ABB"
+
+    target.children[0]._add_child(PandocAst.create_element({"t": "Str", "c": "C"}))
+
+    assert target.children[0].text == "ABC"
+    assert target.text == "ABCB"
+
+
 ## @}
@@ -0,0 +1,189 @@
+r"""
+# `gdoc::lib::pandocastobject::pandocast::nodetable::NodeTable` Specification
+
+## REFERENCES
+
+## ADDITIONAL STRUCTURE
+
+A columnar and read-only form of a PandocAst tree.
+Nodes are accessed through `NodeView` providing the reading part of the Element API.
+
+"""
+import glob
+import os
+
+from gdoc.lib.pandocastobject.pandoc import MarkdownReader
+from gdoc.lib.pandocastobject.pandocast import DataPos, PandocAst, PandocNodeTable, Pos
+
+_ROOT_ = os.path.normpath(os.path.join(os.path.dirname(__file__), "../../../.."))
+
+# Properties which are not child elements.
+_PROP_KEYS_ = (
+    "Attr",
+    "Text",
+    "Level",
+    "Target",
+    "Format",
+    "MathType",
+    "QuotedType",
+    "ListAttributes",
+    "Caption",
+    "[ColSpec]",
+    "Alignment",
+    "RowSpan",
+    "ColSpan",
+)
+
+
+def _span(pos: str, elem: dict) -> dict:
+    return {"t": "Span", "c": [["", [], [["data-pos", pos]]], [elem]]}
+
+
+def _line(ln: int, words: int) -> list:
+    inlines: list = []
+    for i in range(words):
+        col = i * 5 + 1
+        inlines.append(
+            _span(f"doc.md@{ln}:{col}-{ln}:{col + 4}", {"t": "Str", "c": "WORD"})
+        )
+        inlines.append(_span(f"doc.md@{ln}:{col + 4}-{ln}:{col + 5}", {"t": "SoftBreak"}))
+    return inlines
+
+
+def _doc(lines: int) -> dict:
+    blocks: list = [
+        {
+            "t": "Header",
+            "c": [1, ["title", [], [["data-pos", "doc.md@1:1-2:1"]]], _line(1, 1)],
+        },
+        {
+            "t": "BulletList",
+            "c": [
+                [
+                    {
+                        "t": "Plain",
+                        "c": [
+                            {"t": "Emph", "c": [{"t": "Str", "c": "A"}, {"t": "Space"}]},
+                            {
+                                "t": "Link",
+                                "c": [
+                                    ["", [], []],
+                                    [{"t": "Code", "c": [["", [], []], "B"]}],
+                                    ["url", ""],
+                                ],
+                            },
+                        ],
+                    }
+                ]
+            ],
+        },
+    ]
+    for ln in range(2, lines + 2):
+        blocks.append(
+            {
+                "t": "Div",
+                "c": [
+                    ["", [], [["data-pos", f"doc.md@{ln}:1-{ln + 1}:1"]]],
+                    [{"t": "Para", "c": _line(ln, 10)}],
+                ],
+            }
+        )
+    return {"pandoc-api-version": [1, 22, 2, 1], "meta": {}, "blocks": blocks}
+
+
+def _dump(element) -> list:
+    return [
+        element.type,
+        getattr(element, "text", None),
+        element.get_data_pos(),
+        element.get_prop("Attr"),
+        element.get_prop("Level"),
+        element.get_prop("Target"),
+        [item.type for item in element.get_child_items() or []],
+        [_dump(child) for child in element.children or []],
+    ]
+
+
+def _dump_node(element) -> list:
+    return [
+        element.type,
+        getattr(element, "text", None),
+        element.get_data_pos(),
+        element.get_attr("data-pos"),
+        [element.get_prop(key) for key in _PROP_KEYS_],
+        [item.type for item in element.get_child_items() or []],
+    ]
+
+
+class Spec_NodeTable:
+    r"""
+    ## [\@spec] `NodeTable`
+
+    ```py
+    class NodeTable:
+        def __init__(self, root: Element):
+
+        @staticmethod
+        def from_json(pan_elem) -> NodeTable:
+    ```
+    """
+
+    def spec_1(self):
+        r"""
+        ### [\@case 1] Nodes have the same structure, texts, positions and properties.
+        """
+        # GIVEN
+        pandoc_ast = PandocAst(_doc(3))
+        # WHEN
+        target = PandocNodeTable(pandoc_ast)
+        # THEN
+        assert _dump(target.root) == _dump(pandoc_ast)
+
+    def spec_2(self):
+        r"""
+        ### [\@case 2] Nodes can be navigated as elements.
+        """
+        # GIVEN
+        target = PandocNodeTable.from_json(_doc(1))
+        # WHEN
+        header = target.root.get_first_child()
+        bullet_list = header.next()
+        para = bullet_list.next().get_first_child()
+        items = para.get_child_items()
+        # THEN
+        assert [header.type, bullet_list.type, para.type] == [
+            "Header",
+            "BulletList",
+            "Para",
+        ]
+        assert bullet_list.prev() == header
+        assert header.get_attr("data-pos") == "doc.md@1:1-2:1"
+        assert para.get_parent_item() == target.root
+        assert items[0].next_item() == items[1]
+        assert items[1].prev_item() == items[0]
+        assert items[1].get_data_pos() == DataPos("doc.md", Pos(2, 5), Pos(2, 6))
+        assert [e.text for e in target.root.iter_type("Code")] == ["B"]
+        assert target.root.get_first_child().text == "WORD "
+
+    def spec_3(self):
+        r"""
+        ### [\@case 3] Nodes of the documents in the repository read as elements.
+
+        The properties and the 'data-pos' attribute which are made again from the
+        positions and the texts, are the same as of the elements.
+        """
+        # GIVEN
+        sources = sorted(
+            glob.glob(os.path.join(_ROOT_, "docs", "**", "*.md"), recursive=True)
+        )
+        assert sources
+        for source in sources:
+            pandoc_ast = PandocAst(MarkdownReader().get_json(source))
+            # WHEN
+            target = PandocNodeTable(pandoc_ast)
+            # THEN
+            elements = list(pandoc_ast.iter_preorder())
+            nodes = list(target.root.iter_preorder())
+            assert len(nodes) == len(elements)
+            for node, element in zip(nodes, elements):
+                assert _dump_node(node) == _dump_node(element), source
@@ -0,0 +1,93 @@
+r"""
+Memory usage of the pandocast elements.
+
+### ADDITIONAL STRUCTURE
+
+Elements are slotted classes without instance `__dict__`, as documents produce
+hundreds of thousands of them.
+
+"""
+import tracemalloc
+
+from gdoc.lib.pandocastobject.pandoc import MarkdownReader
+from gdoc.lib.pandocastobject.pandocast import PandocAst
+from gdoc.lib.pandocastobject.pandocast.inline import Inline
+
+_TEXT_ = (
+    "# TITLE\n\n- A *B*\n- `C` [D](url)\n\n| E | F |\n|---|---|\n| 1 | 2 |\n\n"
+    "Some *text* with `code` and [@ A] tag.\n\n"
+) * 50
+
+# Upper bound of allocated bytes per element of a tree.
+# It's about 165 bytes on CPython 3.11, and 200 bytes or more when elements
+# have instance `__dict__` or per-element caches are added.
+_MAX_BYTES_PER_ELEMENT_ = 192
+
+
+def _get_elements(element) -> list:
+    elements: list = []
+    stack: list = [element]
+    while stack:
+        element = stack.pop()
+        elements.append(element)
+        stack += element.children or []
+
+    return elements
+
+
+class Spec_memory:
+    r"""
+    ## [\@spec] memory usage of elements
+    """
+
+    def spec_1(self):
+        r"""
+        ### [\@case 1] No element in the tree has instance `__dict__`.
+        """
+        # GIVEN
+        text = "# TITLE\n\n- A *B*\n- `C` [D](url)\n\n| E | F |\n|---|---|\n| 1 | 2 |\n"
+        pandoc_ast = PandocAst(MarkdownReader().get_json("doc.md", "gfm", False, text))
+        # WHEN
+        elements = _get_elements(pandoc_ast)
+        # THEN
+        assert len(elements) > 20
+        assert [e.type for e in elements if hasattr(e, "__dict__")] == []
+
+    def spec_2(self):
+        r"""
+        ### [\@case 2] A tree takes less than the fixed bytes per element.
+        """
+        # GIVEN
+        pandoc_json = MarkdownReader().get_json("doc.md", "gfm", False, _TEXT_)
+        # WHEN
+        tracemalloc.start()
+        pandoc_ast = PandocAst(pandoc_json)
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # THEN
+        count = len(_get_elements(pandoc_ast))
+        assert count > 4000
+        assert size < _MAX_BYTES_PER_ELEMENT_ * count
+        assert peak < _MAX_BYTES_PER_ELEMENT_ * count
+
+    def spec_3(self):
+        r"""
+        ### [\@case 3] Walking items and making texts don't add to the tree.
+        """
+        # GIVEN
+        pandoc_json = MarkdownReader().get_json("doc.md", "gfm", False, _TEXT_)
+        pandoc_ast = PandocAst(pandoc_json)
+        elements = _get_elements(pandoc_ast)
+        # WHEN
+        tracemalloc.start()
+        for element in elements:
+            if element.type not in ("Div", "Span"):
+                element.next_item()
+                element.prev_item()
+            if isinstance(element, Inline):
+                element.text
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        # THEN
+        # Only texts of the inline containers are kept.
+        assert size < 16 * len(elements)
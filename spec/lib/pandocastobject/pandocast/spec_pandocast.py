@@ -22,6 +22,7 @@ import inspect
 
 import pytest
 
+from gdoc.lib.pandocastobject.pandoc import MarkdownReader
 from gdoc.lib.pandocastobject.pandocast.pandocast import PandocAst
 
 
@@ -283,3 +284,168 @@ class Spec_create_element:
                 PandocAst.create_element(**stimulus)
             # THEN
             assert exc_info.match(expected["Exception"][1])
+
+
+class Spec_build_element:
+    r"""
+    ## [\@spec] `build_element`
+
+    ```py
+    @staticmethod
+    def build_element(
+        elem_type: str,
+        content=None,
+        children: list[Element] | None = None,
+        attr: list | None = None,
+        lazy=False,
+    ) -> Element:
+    ```
+    """
+
+    def spec_1(self):
+        r"""
+        ### [\@case 1] Creates a new element from the template of the type.
+        """
+        # GIVEN
+        template = inspect.getmodule(PandocAst)._ELEMENT_TYPES["Code"]["new"]
+        # WHEN
+        target = PandocAst.build_element("Code", "CODE", attr=["ID", ["C"], []])
+        # THEN
+        assert target.get_type() == "Code"
+        assert target.pan_element == {"t": "Code", "c": [["ID", ["C"], []], "CODE"]}
+        assert target.text == "CODE"
+        assert template == {"t": "Code", "c": [["", [], []], ""]}
+
+    def spec_2(self, mocker):
+        r"""
+        ### [\@case 2] Given children become the children without being re-created.
+        """
+        # GIVEN
+        children = [
+            PandocAst.build_element("Str", "A"),
+            PandocAst.build_element("Space"),
+            PandocAst.build_element("Str", "B"),
+        ]
+        spy = mocker.spy(PandocAst, "create_element")
+        # WHEN
+        target = PandocAst.build_element("Span", children=children)
+        # THEN
+        assert spy.call_count == 0
+        assert target.pan_element == {
+            "t": "Span",
+            "c": [["", [], []], [child.pan_element for child in children]],
+        }
+        assert target.get_children() == children
+        assert [child.get_parent() for child in children] == [target] * 3
+        assert children[1].next() is children[2]
+        assert target.text == "A B"
+
+    def spec_3(self):
+        r"""
+        ### [\@case 3] Content json is created as children of the element.
+        """
+        # WHEN
+        target = PandocAst.build_element("Para", [{"t": "Str", "c": "A"}])
+        # THEN
+        assert [child.get_type() for child in target.get_children()] == ["Str"]
+        assert target.get_first_child().pan_element is target.get_content()[0]
+
+    @pytest.mark.parametrize(
+        "stimulus, exception",
+        [
+            ({"elem_type": "INVALID"}, KeyError),
+            ({"elem_type": "Table"}, TypeError),
+            ({"elem_type": "Space", "content": "A"}, TypeError),
+            ({"elem_type": "Str", "attr": ["", [], []]}, KeyError),
+        ],
+    )
+    def spec_4(self, stimulus, exception):
+        r"""
+        ### [\@case 4] Raises an error if the element can not be built.
+        """
+        # WHEN
+        with pytest.raises(exception):
+            PandocAst.build_element(**stimulus)
+
+    def spec_5(self):
+        r"""
+        ### [\@case 5] Built elements don't share their json with the template or others.
+        """
+        # GIVEN
+        template = inspect.getmodule(PandocAst)._ELEMENT_TYPES["Span"]["new"]
+        # WHEN
+        target1 = PandocAst.build_element("Span", [{"t": "Str", "c": "A"}])
+        target2 = PandocAst.build_element("Span", [{"t": "Str", "c": "A"}])
+        target1.get_prop("Attr")[1].append("CLASS")
+        target1.get_content().append({"t": "Str", "c": "B"})
+        # THEN
+        assert target1.pan_element != target2.pan_element
+        assert target2.pan_element == {
+            "t": "Span",
+            "c": [["", [], []], [{"t": "Str", "c": "A"}]],
+        }
+        assert PandocAst.build_element("Span").pan_element == template
+        assert template == {"t": "Span", "c": [["", [], []], []]}
+
+
+_LAZY_SOURCE_ = """# TITLE
+
+- A *B*
+- `C` [D](url)
+
+| E | F |
+|---|---|
+| 1 | 2 |
+
+> G **H**
+"""
+
+
+def _dump_tree(element) -> list:
+    return [
+        element.type,
+        getattr(element, "text", None),
+        [_dump_tree(child) for child in element.children or []],
+    ]
+
+
+class Spec_PandocAst:
+    r"""
+    ## [\@spec] `PandocAst`
+
+    ```py
+    class PandocAst(Pandoc):
+        def __init__(self, pan_elem, lazy=False):
+    ```
+    """
+
+    def spec_1(self):
+        r"""
+        ### [\@case 1] Lazy tree is the same as the eager tree.
+        """
+        # GIVEN
+        pandoc_json = MarkdownReader().get_json("doc.md", "gfm", False, _LAZY_SOURCE_)
+        expected = _dump_tree(PandocAst(pandoc_json))
+        # WHEN
+        target = PandocAst(pandoc_json, lazy=True)
+        # THEN
+        assert _dump_tree(target) == expected
+
+    def spec_2(self, mocker):
+        r"""
+        ### [\@case 2] Children are created on the first access to them.
+        """
+        # GIVEN
+        pandoc_json = MarkdownReader().get_json("doc.md", "gfm", False, _LAZY_SOURCE_)
+        spy = mocker.spy(PandocAst, "create_element")
+        target = PandocAst(pandoc_json, lazy=True)
+        assert spy.call_count == 0
+        # WHEN
+        blocks = target.get_children()
+        # THEN
+        assert spy.call_count == len(pandoc_json["blocks"])
+        # WHEN
+        children = blocks[1].get_children()
+        # THEN
+        assert [child.type for child in children] == ["BulletList"]
+        assert spy.call_count == len(pandoc_json["blocks"]) + 1
@@ -2189,3 +2189,171 @@ def spec___radd___2(items, position, index, expected):
         index + target
 
     assert exc_info.match(expected)
+
+
+## @}
+## @{ @name columns
+## [\@spec columns] items are stored in parallel array columns.
+
+
+def spec_columns_1():
+    r"""
+    [@spec columns.1] items are stored as element references and start/stop arrays.
+    """
+
+    class _TEST_ITEM_:
+        def __init__(self, type, text):
+            self.text = text
+            self.type = type
+
+        def get_type(self):
+            return self.type
+
+    TEST_ITEMS = [
+        _TEST_ITEM_("Str", "0123"),
+        _TEST_ITEM_("Space", " "),
+        _TEST_ITEM_("Str", "abcd"),
+    ]
+
+    target = PandocStr(TEST_ITEMS, 2, -2)
+
+    assert target._elements == TEST_ITEMS
+    assert target._starts.typecode == "i"
+    assert list(target._starts) == [2, 0, 0]
+    assert list(target._stops) == [4, 1, 2]
+    assert target._item_dicts is None
+
+    # slicing and concatenation work on the columns
+    sliced = target[1:4] + target[4:]
+    assert sliced._elements == TEST_ITEMS
+    assert list(sliced._starts) == [3, 0, 0]
+    assert list(sliced._stops) == [4, 1, 2]
+    assert sliced._item_dicts is None
+
+    # item dicts are made on demand
+    assert sliced._items[0] == {
+        "_item": TEST_ITEMS[0],
+        "start": 3,
+        "stop": 4,
+        "text": "3",
+        "len": 1,
+        "decoration": 0,
+    }
+    assert sliced.get_items() is sliced._items
+
+
+def spec_columns_2():
+    r"""
+    [@spec columns.2] cumulative lengths of the items are kept updated.
+    """
+
+    class _TEST_ITEM_:
+        def __init__(self, type, text):
+            self.text = text
+            self.type = type
+
+        def get_type(self):
+            return self.type
+
+        def get_data_pos(self):
+            return None
+
+    TEST_ITEMS = [
+        _TEST_ITEM_("Str", "0123"),
+        _TEST_ITEM_("Space", " "),
+        _TEST_ITEM_("Str", "abcd"),
+    ]
+
+    target = PandocStr(TEST_ITEMS, 2, -2)
+    assert list(target._ends) == [2, 3, 5]
+
+    sliced = target[1:4]
+    assert sliced._ends is target._ends
+    assert [sliced._locate(i) for i in range(4)] == [(0, 0), (1, 0), (2, 0), (2, 1)]
+
+    joined = sliced + target[4:]
+    assert list(joined._ends) == [1, 2, 4]
+
+    joined.add_items(TEST_ITEMS[:1], 0, 3)
+    assert list(joined._ends) == [1, 2, 4, 7]
+
+    expected = [(0, 0), (1, 0), (2, 0), (2, 1), (3, 0), (3, 1), (3, 2), (3, 3)]
+    for index, (item, offset) in enumerate(expected):
+        assert joined._locate(index) == (item, offset)
+        assert joined.get_char_info(index)[2] is joined._items[item]
+
+
+def spec_columns_3():
+    r"""
+    [@spec columns.3] slices share the columns until items are added.
+    """
+
+    class _TEST_ITEM_:
+        def __init__(self, type, text):
+            self.text = text
+            self.type = type
+
+        def get_type(self):
+            return self.type
+
+    TEST_ITEMS = [
+        _TEST_ITEM_("Str", "0123"),
+        _TEST_ITEM_("Space", " "),
+        _TEST_ITEM_("Str", "abcd"),
+    ]
+
+    target = PandocStr(TEST_ITEMS)
+    sliced = target[2:7]
+    empty = PandocStr()
+
+    # slices and concatenation with empty strings don't copy the columns
+    assert sliced._elements is target._elements
+    assert sliced._starts is target._starts
+    assert (empty + sliced)._elements is target._elements
+    assert PandocStr(target, 1)._elements is target._elements
+    assert sliced._text == "23 ab"
+
+    # adding items to the original doesn't change the slice
+    target.add_items(TEST_ITEMS[2:], 0, 2)
+    assert target._elements is sliced._elements
+    assert target._text == "0123 abcdab"
+    assert sliced._text == "23 ab"
+    assert [item["text"] for item in sliced._items] == ["23", " ", "ab"]
+
+    # the slice copies the columns when items are added to it
+    sliced.add_items(TEST_ITEMS[:1], 0, 1)
+    assert sliced._elements is not target._elements
+    assert sliced._text == "23 ab0"
+    assert [item["text"] for item in sliced._items] == ["23", " ", "ab", "0"]
+    assert target._text == "0123 abcdab"
+
+
+def spec_columns_4():
+    r"""
+    [@spec columns.4] chars are iterated as views, and extend joins items in place.
+    """
+
+    class _TEST_ITEM_:
+        def __init__(self, type, text):
+            self.text = text
+            self.type = type
+
+        def get_type(self):
+            return self.type
+
+    TEST_ITEMS = [_TEST_ITEM_("Str", "012"), _TEST_ITEM_("Str", "abc")]
+
+    target = PandocStr(TEST_ITEMS, 1, 5)
+    chars = list(target)
+
+    assert [str(c) for c in chars] == ["1", "2", "a", "b"]
+    assert all(type(c) is PandocStr for c in chars)
+    assert all(c._elements is target._elements for c in chars)
+    assert chars[2]._items[0]["_item"] is TEST_ITEMS[1]
+
+    joined = PandocStr()
+    for c in chars:
+        joined.extend(c)
+
+    assert str(joined) == "12ab"
+    assert [(item["start"], item["stop"]) for item in joined._items] == [(1, 3), (0, 2)]
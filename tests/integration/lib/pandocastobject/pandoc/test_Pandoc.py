@@ -15,7 +15,6 @@ The test specification of Pandoc class.
 | --version- | ---- | --version----- |
 | THIS    | Pandoc       | Execute external pandoc command as a subprocess to parse a source md file to generate PandocAST json object.
 | @Method | \_\_init\_\_ | creates a new instance.
-| @Method | \_run        | run multiple commands with PIPE and get output.
 
 """
 import json
@@ -25,126 +24,6 @@ import pytest
 from gdoc.lib.pandocastobject.pandoc.pandoc import Pandoc
 
 
-class Test__run:
-    """
-    [@test _run] run multiple commands with PIPE and return results.
-    def _run(
-        self, commandlines: list[list[str]], stdin=None
-    ) -> tuple[list[int], str, list[str]]:
-    """
-
-    case_1 = {
-        "Case: One commandline": (
-            # stimulus
-            [
-                "_test_cmd_.sh OPTION",
-            ],
-            # expected
-            {
-                "output": (
-                    [0],
-                    "Exit(0): WITH_OPT\n" "OPT = OPTION\n",
-                    [""],
-                )
-            },
-        ),
-        "Case: Two commandlines": (
-            # stimulus
-            [
-                "_test_cmd_.sh OPTION",
-                "_test_cmd_.sh OPTION",
-            ],
-            # expected
-            {
-                "output": (
-                    [0, 0],
-                    "Exit(0): WITH_OPT\n" "OPT = OPTION\n",
-                    ["", ""],
-                )
-            },
-        ),
-        "Case: Three commandlines": (
-            # stimulus
-            [
-                "_test_cmd_.sh OPTION",
-                "_test_cmd_.sh OPTION",
-                "_test_cmd_.sh OPTION",
-            ],
-            # expected
-            {
-                "output": (
-                    [0, 0, 0],
-                    "Exit(0): WITH_OPT\n" "OPT = OPTION\n",
-                    ["", "", ""],
-                )
-            },
-        ),
-        #
-        # Error cases
-        #
-        "Error: One commandline": (
-            # stimulus
-            [
-                "_test_cmd_.sh",
-            ],
-            # expected
-            {
-                "output": (
-                    [1],
-                    "",
-                    ["EXIT(1): NO_OPT\n"],
-                )
-            },
-        ),
-        "Error: Two commandlines": (
-            # stimulus
-            [
-                "_test_cmd_.sh OPTION",
-                "_test_cmd_.sh",
-            ],
-            # expected
-            {
-                "output": (
-                    [0, 1],
-                    "",
-                    ["", "EXIT(1): NO_OPT\n"],
-                )
-            },
-        ),
-        "Error: Three commandlines": (
-            # stimulus
-            [
-                "_test_cmd_.sh OPTION",
-                "_test_cmd_.sh",
-                "_test_cmd_.sh OPTION",
-            ],
-            # expected
-            {
-                "output": (
-                    [0, 1, 0],
-                    "Exit(0): WITH_OPT\n" "OPT = OPTION\n",
-                    ["", "EXIT(1): NO_OPT\n", ""],
-                )
-            },
-        ),
-    }
-
-    @pytest.mark.parametrize(
-        "stimulus, expected",
-        list(case_1.values()),
-        ids=list(case_1.keys()),
-    )
-    def test_1(self, stimulus, expected):
-        here = __file__.rsplit("/", 1)[0] + "/"  # current directory
-
-        # WHEN
-        commandlines = [(here + cmd).split() for cmd in stimulus]
-        output = Pandoc()._run(commandlines)
-
-        # THEN
-        assert output == expected["output"]
-
-
 class Test_get_version:
     """
     [@test get_version] returns versions of pandoc and pandoc-types.
@@ -1,6 +1,11 @@
+import json
+import os
 import subprocess
+import sys
 
+import gdoc
 from gdoc import _CONFIG
+from gdoc.__main__ import _COMMANDS_
 
 
 def test_version():
@@ -36,3 +41,115 @@ def test_execute_gdoc_trace(datadir):
 
     assert result.returncode == 0
     assert result.stdout == contents
+
+
+def test_subcommand_manifest():
+    app_path = os.path.join(os.path.dirname(gdoc.__file__), _CONFIG["app_path"])
+    commands = [
+        name
+        for name in os.listdir(app_path)
+        if os.path.isdir(os.path.join(app_path, name)) and (name != "__pycache__")
+    ]
+
+    assert sorted(commands) == sorted(_COMMANDS_)
+
+
+def test_version_loads_no_subcommand():
+    result = subprocess.run(
+        [
+            "python3",
+            "-c",
+            "import sys; sys.argv = ['gdoc', '--version'];"
+            "import gdoc.__main__; gdoc.__main__.main();"
+            "print(sorted(m for m in sys.modules if m.startswith('gdoc.')))",
+        ],
+        capture_output=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == b"0.1.1\n['gdoc.__main__']\n"
+
+
+def test_execute_gdoc_compile_ndjson(tmp_path):
+    files = []
+    for name in ("A", "B", "C"):
+        file = tmp_path / f"{name}.md"
+        file.write_text(f"# [@ {name}] TITLE\n", encoding="utf-8")
+        files.append(str(file))
+
+    result = subprocess.run(
+        ["python3", "-m", "gdoc", "compile", "--builtin-reader", "--no-cache"]
+        + ["--ndjson", "-j", "2"]
+        + files,
+        capture_output=True,
+    )
+
+    lines = result.stdout.splitlines()
+    assert result.returncode == 0
+    assert [json.loads(line)["a"]["name"] for line in lines] == files
+
+
+_FAKE_PANDOC_ = """
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+log = os.path.join(os.path.dirname(sys.argv[0]), "requests.log")
+if sys.argv[1] != "server":
+    with open(log, "a") as f:
+        f.write("subprocess\\n")
+    sys.exit(1)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._send(b"3.1.0")
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        text = body["text"].strip()
+        with open(log, "a") as f:
+            f.write(text + "\\n")
+        para = {"t": "Para", "c": [{"t": "Str", "c": text}]}
+        output = {"pandoc-api-version": [1, 23], "meta": {}, "blocks": [para]}
+        self._send(json.dumps(output).encode("utf-8"))
+
+    def _send(self, data):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+port = int(sys.argv[sys.argv.index("--port") + 1])
+HTTPServer(("127.0.0.1", port), Handler).serve_forever()
+"""
+
+
+def test_execute_gdoc_build_pandoc_server(tmp_path):
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    command = bindir / "pandoc"
+    command.write_text(f"#!{sys.executable}\n{_FAKE_PANDOC_}", encoding="utf-8")
+    os.chmod(command, 0o755)
+
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for name in ("A", "B", "C"):
+        (docs / f"{name}.md").write_text(f"{name}\n", encoding="utf-8")
+
+    result = subprocess.run(
+        ["python3", "-m", "gdoc", "build", "--pandoc-server", "--no-cache"]
+        + ["-j", "2", str(docs)],
+        capture_output=True,
+        env={**os.environ, "PATH": f"{bindir}{os.pathsep}{os.environ['PATH']}"},
+    )
+
+    # The worker processes convert the documents with the server.
+    requests = (bindir / "requests.log").read_text().splitlines()
+    assert result.returncode == 0
+    assert sorted(requests) == ["A", "B", "C"]